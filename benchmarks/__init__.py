@@ -0,0 +1,12 @@
+"""기록된 fixture와 대체 구현으로 네트워크 없이 실행하는 성능 벤치마크 패키지입니다.
+
+python -m benchmarks                                  # 기본 시나리오 전체 실행
+python -m benchmarks --scenarios tools batch          # 일부 시나리오만 실행
+python -m benchmarks --save-baseline                  # 결과를 기준선으로 저장
+python -m benchmarks --record AAPL MSFT               # 실제 API로 fixture 기록 (네트워크 필요)
+"""
+
+import os
+
+# 설정 로딩에 필요한 API 키가 없는 오프라인 환경에서도 패키지를 import할 수 있도록 기본값 지정
+os.environ.setdefault("TAVILY_API_KEY", "offline-benchmark")
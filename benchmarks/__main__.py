@@ -0,0 +1,105 @@
+"""오프라인 벤치마크 실행 엔트리포인트입니다 (`python -m benchmarks`)."""
+
+import argparse
+import json
+import platform
+import sys
+from datetime import datetime
+from pathlib import Path
+
+from benchmarks.fakes import offline_environment
+from benchmarks.fixtures import DEFAULT_FIXTURE_DIR, load_fixtures, record_fixtures
+from benchmarks.harness import SCENARIOS, BenchmarkConfig, compare_to_baseline, run_benchmarks
+
+_BENCHMARK_DIR = Path(__file__).parent
+DEFAULT_TICKERS = ["AAPL", "MSFT", "NVDA", "TSLA", "AMZN", "GOOGL", "META", "JPM"]
+
+
+def parse_args() -> argparse.Namespace:
+    """명령행 인자를 파싱합니다."""
+    parser = argparse.ArgumentParser(description="주식 조사 에이전트 오프라인 벤치마크")
+    parser.add_argument("--tickers", nargs="+", default=DEFAULT_TICKERS, help="측정에 사용할 종목 심볼")
+    parser.add_argument("--scenarios", nargs="+", choices=SCENARIOS, default=list(SCENARIOS), help="실행할 시나리오")
+    parser.add_argument("-n", "--iterations", type=int, default=5, help="시나리오별 반복 횟수")
+    parser.add_argument("--llm-latency", type=float, default=0.2, help="가짜 LLM 호출당 지연 시간 (초)")
+    parser.add_argument("--upstream-latency", type=float, default=0.05, help="가짜 yfinance/Tavily 호출당 지연 (초)")
+    parser.add_argument("-w", "--workers", type=int, default=4, help="watchlist 시나리오 워커 수")
+    parser.add_argument("--fixtures", default=str(DEFAULT_FIXTURE_DIR), help="fixture 디렉터리")
+    parser.add_argument("-o", "--output", default=str(_BENCHMARK_DIR / "results" / "latest.json"), help="결과 파일")
+    parser.add_argument("--baseline", default=str(_BENCHMARK_DIR / "baseline.json"), help="기준선 파일")
+    parser.add_argument("--save-baseline", action="store_true", help="이번 결과를 기준선으로 저장")
+    parser.add_argument("--tolerance", type=float, default=0.2, help="회귀로 판단하지 않을 허용 변화율")
+    parser.add_argument("--fail-on-regression", action="store_true", help="기준선보다 느린 항목이 있으면 종료 코드 1")
+    parser.add_argument("--record", nargs="+", metavar="TICKER", help="실제 API로 fixture를 기록하고 종료")
+    return parser.parse_args()
+
+
+def main() -> int:
+    """벤치마크를 실행하고 결과를 저장/비교합니다."""
+    args = parse_args()
+
+    if args.record:
+        record_fixtures(args.record, args.fixtures)
+        return 0
+
+    tickers = list(dict.fromkeys(ticker.upper() for ticker in args.tickers))
+    config = BenchmarkConfig(
+        tickers=tickers,
+        iterations=args.iterations,
+        llm_latency=args.llm_latency,
+        upstream_latency=args.upstream_latency,
+        workers=args.workers,
+        scenarios=tuple(args.scenarios),
+    )
+    fixtures = load_fixtures(tickers, args.fixtures)
+    fixture_sources = {"recorded": fixtures.recorded, "synthetic": fixtures.synthetic}
+
+    print(f"벤치마크 시작: 종목 {len(tickers)}개, 반복 {config.iterations}회, 시나리오 {', '.join(config.scenarios)}")
+    print(f"fixture: 기록 {len(fixtures.recorded)}개, 합성 {len(fixtures.synthetic)}개 ({args.fixtures})")
+    with offline_environment(fixtures, upstream_latency=config.upstream_latency) as counter:
+        result = run_benchmarks(config, counter, on_scenario=lambda name: print(f"  - {name} 측정 중..."))
+
+    report = {
+        "created_at": datetime.now().isoformat(timespec="seconds"),
+        "python": platform.python_version(),
+        "config": {**config.__dict__, "scenarios": list(config.scenarios)},
+        "fixtures": fixture_sources,
+        "metrics": result.metrics,
+        "upstream_calls": result.upstream_calls,
+    }
+
+    output = Path(args.output)
+    output.parent.mkdir(parents=True, exist_ok=True)
+    output.write_text(json.dumps(report, ensure_ascii=False, indent=2), encoding="utf-8")
+
+    print("\n" + "=" * 74)
+    for metric, value in result.metrics.items():
+        print(f"{metric:<60} {value:>12.6f}")
+    print("=" * 74)
+    print(f"결과 저장: {output}")
+
+    baseline_path = Path(args.baseline)
+    regressions = 0
+    if baseline_path.exists():
+        baseline = json.loads(baseline_path.read_text(encoding="utf-8"))
+        if baseline.get("fixtures") != fixture_sources:
+            print(f"\n주의: 기준선의 fixture 구성이 이번 실행과 다릅니다 ({baseline.get('fixtures')})")
+        rows = compare_to_baseline(result.metrics, baseline["metrics"], args.tolerance)
+        print(f"\n기준선 비교 ({baseline_path}, 허용 {args.tolerance:.0%}):")
+        for row in rows:
+            if row["status"] != "same":
+                print(f"  [{row['status']}] {row['metric']}: {row['baseline']:.4f} -> {row['current']:.4f}")
+        regressions = sum(1 for row in rows if row["status"] == "slower")
+        print(f"  느려진 항목 {regressions}개 / 비교 항목 {len(rows)}개")
+    elif not args.save_baseline:
+        print(f"\n기준선 없음 ({baseline_path}): 비교를 건너뜁니다. --save-baseline으로 기준선을 만드세요.")
+
+    if args.save_baseline:
+        baseline_path.write_text(json.dumps(report, ensure_ascii=False, indent=2), encoding="utf-8")
+        print(f"기준선 저장: {baseline_path}")
+
+    return 1 if regressions and args.fail_on_regression else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
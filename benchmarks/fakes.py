@@ -0,0 +1,231 @@
+"""네트워크 없이 벤치마크를 실행하기 위한 yfinance/Tavily/LLM 대체 구현 모듈입니다."""
+
+import asyncio
+import re
+import threading
+import time
+from collections.abc import Iterator
+from contextlib import ExitStack, contextmanager
+from typing import Any
+from unittest import mock
+
+import pandas as pd
+from langchain_core.language_models import BaseChatModel
+from langchain_core.messages import AIMessage, BaseMessage, HumanMessage, ToolMessage
+from langchain_core.outputs import ChatGeneration, ChatResult
+
+from benchmarks.fixtures import FixtureSet
+from src.data.store import period_start
+
+
+class UpstreamCounter:
+    """대체 업스트림이 받은 호출 수를 세는 클래스입니다 (스레드 안전)."""
+
+    def __init__(self) -> None:
+        self.calls: dict[str, int] = {}
+        self._lock = threading.Lock()
+
+    def hit(self, name: str) -> None:
+        with self._lock:
+            self.calls[name] = self.calls.get(name, 0) + 1
+
+    def reset(self) -> None:
+        with self._lock:
+            self.calls.clear()
+
+
+def _slice_history(frame: pd.DataFrame, period: str | None = None, start: Any = None) -> pd.DataFrame:
+    """yfinance `history`처럼 기간 또는 시작일로 일봉을 잘라냅니다."""
+    naive = frame.index.tz_localize(None)
+    if start is not None:
+        return frame[naive >= pd.Timestamp(start)]
+    begin = period_start(period) if period else None
+    return frame if begin is None else frame[naive >= begin]
+
+
+class FakeTicker:
+    """기록된 fixture를 반환하는 `yf.Ticker` 대체 클래스입니다."""
+
+    def __init__(self, ticker: str, yf: "FakeYFinance") -> None:
+        self.ticker = ticker.upper()
+        self._yf = yf
+
+    @property
+    def info(self) -> dict:
+        self._yf.call("info")
+        return dict(self._yf.fixtures.infos.get(self.ticker, {}))
+
+    def history(self, period: str | None = None, start: Any = None, interval: str = "1d", **kwargs) -> pd.DataFrame:
+        self._yf.call("history")
+        frame = self._yf.fixtures.histories.get(self.ticker)
+        if frame is None or interval != "1d":
+            return pd.DataFrame(columns=["Open", "High", "Low", "Close", "Volume"])
+        return _slice_history(frame, period, start).copy()
+
+
+class FakeYFinance:
+    """`yfinance` 모듈의 `Ticker`/`download`를 fixture로 대체하는 클래스입니다.
+
+    호출마다 `latency`초를 대기하여 네트워크 왕복을 흉내냅니다.
+    """
+
+    def __init__(self, fixtures: FixtureSet, latency: float, counter: UpstreamCounter) -> None:
+        self.fixtures = fixtures
+        self.latency = latency
+        self.counter = counter
+
+    def call(self, name: str) -> None:
+        self.counter.hit(f"yfinance.{name}")
+        if self.latency > 0:
+            time.sleep(self.latency)
+
+    def Ticker(self, ticker: str) -> FakeTicker:  # noqa: N802 - yfinance API 이름 유지
+        return FakeTicker(ticker, self)
+
+    def download(
+        self, symbols: list[str], period: str | None = None, start: Any = None, interval: str = "1d", **kwargs
+    ) -> pd.DataFrame:
+        self.call("download")
+        frames = {}
+        for symbol in symbols:
+            frame = self.fixtures.histories.get(symbol.upper())
+            if frame is not None and interval == "1d":
+                frames[symbol] = _slice_history(frame, period, start)
+        if not frames:
+            return pd.DataFrame()
+        return pd.concat(frames, axis=1)
+
+
+class FakeTavilyClient:
+    """기록된 Tavily 응답을 반환하는 동기 클라이언트 대체 클래스입니다."""
+
+    def __init__(self, fixtures: FixtureSet, latency: float, counter: UpstreamCounter) -> None:
+        self.fixtures = fixtures
+        self.latency = latency
+        self.counter = counter
+
+    def _response(self, query: str, max_results: int) -> dict:
+        ticker = query.split()[0].upper()
+        response = self.fixtures.news.get(ticker, {"results": []})
+        return {**response, "results": response.get("results", [])[:max_results]}
+
+    def search(self, query: str, search_depth: str = "basic", max_results: int = 5, **kwargs) -> dict:
+        self.counter.hit("tavily.search")
+        if self.latency > 0:
+            time.sleep(self.latency)
+        return self._response(query, max_results)
+
+
+class FakeAsyncTavilyClient(FakeTavilyClient):
+    """기록된 Tavily 응답을 반환하는 비동기 클라이언트 대체 클래스입니다."""
+
+    async def search(self, query: str, search_depth: str = "basic", max_results: int = 5, **kwargs) -> dict:
+        self.counter.hit("tavily.search")
+        if self.latency > 0:
+            await asyncio.sleep(self.latency)
+        return self._response(query, max_results)
+
+
+# 서브에이전트가 호출할 도메인 도구 (파일시스템/할 일 도구 제외)
+_DOMAIN_TOOLS = ("get_stock_price", "get_financial_data", "get_technical_summary", "search_stock_news")
+_TICKER_PATTERN = re.compile(r"\b([A-Z]{1,5})\b")
+
+
+class BenchmarkChatModel(BaseChatModel):
+    """지연 시간을 설정할 수 있는 결정적(scripted) 채팅 모델입니다.
+
+    바인딩된 도구로 역할을 판단하여 실제 에이전트 그래프를 끝까지 진행시킵니다.
+
+    - 메인 에이전트(`task` 도구 보유): 세 서브에이전트에 위임한 뒤 결과를 모아 보고서 작성
+    - 서브에이전트: 보유한 도메인 도구를 한 번씩 호출한 뒤 결과 요약
+    """
+
+    latency: float = 0.5
+    tool_names: tuple[str, ...] = ()
+
+    @property
+    def _llm_type(self) -> str:
+        return "benchmark-scripted"
+
+    def bind_tools(self, tools: list, **kwargs: Any) -> "BenchmarkChatModel":
+        names = tuple(getattr(tool, "name", None) or tool.get("name", "") for tool in tools)
+        return self.model_copy(update={"tool_names": names})
+
+    def _ticker(self, messages: list[BaseMessage]) -> str:
+        for message in messages:
+            if isinstance(message, HumanMessage):
+                match = _TICKER_PATTERN.search(message.text)
+                if match:
+                    return match.group(1)
+        return "AAPL"
+
+    def _respond(self, messages: list[BaseMessage]) -> AIMessage:
+        ticker = self._ticker(messages)
+        tool_results = [message for message in messages if isinstance(message, ToolMessage)]
+        prompt_tokens = sum(len(message.text) for message in messages) // 4
+        usage = {"input_tokens": prompt_tokens, "output_tokens": 0, "total_tokens": prompt_tokens}
+
+        if "task" in self.tool_names:
+            if not tool_results:
+                calls = [
+                    {"name": "task", "args": {"description": f"{ticker} {name}", "subagent_type": name}, "id": name}
+                    for name in ("fundamental-analyst", "technical-analyst", "sentiment-analyst")
+                ]
+                return AIMessage(content="", tool_calls=calls, usage_metadata=usage)
+            content = f"# {ticker} 종합 리서치 보고서\n\n" + "\n\n".join(message.text for message in tool_results)
+        else:
+            tools = [name for name in _DOMAIN_TOOLS if name in self.tool_names]
+            if tools and not tool_results:
+                calls = [{"name": name, "args": {"ticker": ticker}, "id": f"{name}-{ticker}"} for name in tools]
+                return AIMessage(content="", tool_calls=calls, usage_metadata=usage)
+            content = f"{ticker} 분석 결과: " + " / ".join(message.text[:200] for message in tool_results)
+
+        output_tokens = len(content) // 4
+        usage = {**usage, "output_tokens": output_tokens, "total_tokens": prompt_tokens + output_tokens}
+        return AIMessage(content=content, usage_metadata=usage)
+
+    def _generate(self, messages: list[BaseMessage], stop: Any = None, run_manager: Any = None, **kwargs) -> ChatResult:
+        if self.latency > 0:
+            time.sleep(self.latency)
+        return ChatResult(generations=[ChatGeneration(message=self._respond(messages))])
+
+    async def _agenerate(
+        self, messages: list[BaseMessage], stop: Any = None, run_manager: Any = None, **kwargs
+    ) -> ChatResult:
+        if self.latency > 0:
+            await asyncio.sleep(self.latency)
+        return ChatResult(generations=[ChatGeneration(message=self._respond(messages))])
+
+
+@contextmanager
+def offline_environment(
+    fixtures: FixtureSet, upstream_latency: float = 0.0, counter: UpstreamCounter | None = None
+) -> Iterator[UpstreamCounter]:
+    """yfinance 공급자와 Tavily 호출을 fixture 대체 구현으로 바꾸는 컨텍스트를 엽니다.
+
+    Args:
+        fixtures: 반환할 fixture 묶음
+        upstream_latency: 업스트림 호출마다 대기할 시간 (초)
+        counter: 호출 수를 기록할 카운터 (기본값: 새 카운터)
+
+    Yields:
+        UpstreamCounter: 업스트림 호출 카운터
+    """
+    import src.data.providers as providers
+    import src.data.scheduler as scheduler
+    import src.tools.news_search as news_search
+
+    counter = counter or UpstreamCounter()
+    fake_yf = FakeYFinance(fixtures, upstream_latency, counter)
+    tavily = FakeTavilyClient(fixtures, upstream_latency, counter)
+    async_tavily = FakeAsyncTavilyClient(fixtures, upstream_latency, counter)
+
+    with ExitStack() as stack:
+        # 설정과 관계없이 yfinance 공급자 경로를 측정
+        stack.enter_context(mock.patch.object(providers, "_yfinance", lambda: fake_yf))
+        stack.enter_context(mock.patch.object(providers, "_provider", providers.YFinanceProvider()))
+        # fixture 업스트림은 스로틀링하지 않으므로 속도 제한 없이 재시도/병합 경로만 거침
+        stack.enter_context(mock.patch.object(scheduler, "_scheduler", scheduler.UpstreamScheduler()))
+        stack.enter_context(mock.patch.object(news_search, "get_tavily_client", lambda: tavily))
+        stack.enter_context(mock.patch.object(news_search, "get_async_tavily_client", lambda: async_tavily))
+        yield counter
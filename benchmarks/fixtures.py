@@ -0,0 +1,183 @@
+"""벤치마크용 yfinance/Tavily 응답 fixture를 기록하고 불러오는 모듈입니다.
+
+fixture 디렉터리에는 종목마다 세 파일을 둡니다.
+
+- `<TICKER>.history.csv`: 일봉 OHLCV (Date, Open, High, Low, Close, Volume)
+- `<TICKER>.info.json`: `yf.Ticker(...).info` 딕셔너리
+- `<TICKER>.news.json`: Tavily 검색 응답 (`{"results": [...]}`)
+
+`LocalFileProvider`(`MARKET_DATA_PROVIDER=local`)도 같은 형식을 읽으므로 기록한 디렉터리를
+`LOCAL_DATA_DIR`로 지정하면 에이전트를 오프라인으로 실행할 수 있습니다.
+기록된 fixture가 없는 종목은 시드 고정 랜덤 워크로 합성하므로 네트워크 없이도 항상 같은 입력으로 측정합니다.
+저장소에는 기록된 fixture를 포함하지 않으므로, `--record`로 기록하기 전에는 모든 종목이 합성 데이터로 측정됩니다.
+"""
+
+import json
+from dataclasses import dataclass, field
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+DEFAULT_FIXTURE_DIR = Path(__file__).parent / "fixtures"
+
+# 합성 fixture 기본 길이 (약 2년치 영업일)
+_SYNTHETIC_DAYS = 520
+
+
+@dataclass
+class FixtureSet:
+    """종목별 가격 이력, 종목 정보, 뉴스 응답 fixture 묶음입니다."""
+
+    histories: dict[str, pd.DataFrame] = field(default_factory=dict)
+    infos: dict[str, dict] = field(default_factory=dict)
+    news: dict[str, dict] = field(default_factory=dict)
+    recorded: list[str] = field(default_factory=list)
+
+    @property
+    def tickers(self) -> list[str]:
+        """fixture가 있는 종목 심볼 리스트"""
+        return sorted(self.histories)
+
+    @property
+    def synthetic(self) -> list[str]:
+        """기록된 가격 이력이 없어 합성 데이터를 사용하는 종목 심볼 리스트"""
+        return [ticker for ticker in self.histories if ticker not in self.recorded]
+
+
+def _align_to_today(frame: pd.DataFrame) -> pd.DataFrame:
+    """기록 시점과 관계없이 마지막 봉이 최근 영업일이 되도록 날짜를 영업일 단위로 옮깁니다."""
+    dates = pd.bdate_range(end=pd.Timestamp.now().normalize(), periods=len(frame), tz="America/New_York")
+    aligned = frame.copy()
+    aligned.index = pd.DatetimeIndex(dates, name="Date")
+    return aligned
+
+
+def synthesize(ticker: str, days: int = _SYNTHETIC_DAYS, seed: int | None = None) -> tuple[pd.DataFrame, dict, dict]:
+    """종목 하나의 가격 이력/종목 정보/뉴스 fixture를 시드 고정 랜덤 워크로 합성합니다.
+
+    Args:
+        ticker: 주식 심볼
+        days: 생성할 영업일 수
+        seed: 난수 시드 (기본값: 티커 문자열에서 파생)
+
+    Returns:
+        tuple[pd.DataFrame, dict, dict]: (일봉 이력, info 딕셔너리, Tavily 응답)
+    """
+    symbol = ticker.upper()
+    rng = np.random.default_rng(seed if seed is not None else sum(ord(char) * 31**i for i, char in enumerate(symbol)))
+
+    start_price = rng.uniform(20, 400)
+    returns = rng.normal(0.0004, 0.018, size=days)
+    close = start_price * np.exp(np.cumsum(returns))
+    open_ = close * (1 + rng.normal(0, 0.004, size=days))
+    high = np.maximum(open_, close) * (1 + np.abs(rng.normal(0, 0.006, size=days)))
+    low = np.minimum(open_, close) * (1 - np.abs(rng.normal(0, 0.006, size=days)))
+    volume = rng.integers(1_000_000, 80_000_000, size=days).astype(float)
+
+    history = _align_to_today(pd.DataFrame({"Open": open_, "High": high, "Low": low, "Close": close, "Volume": volume}))
+
+    shares = rng.uniform(2e8, 1.5e10)
+    revenue = rng.uniform(5e9, 4e11)
+    net_income = revenue * rng.uniform(0.02, 0.3)
+    info = {
+        "symbol": symbol,
+        "currentPrice": round(float(close[-1]), 2),
+        "previousClose": round(float(close[-2]), 2),
+        "volume": int(volume[-1]),
+        "marketCap": float(close[-1] * shares),
+        "totalRevenue": revenue,
+        "netIncomeToCommon": net_income,
+        "trailingEps": net_income / shares,
+        "trailingPE": float(close[-1] / (net_income / shares)),
+        "debtToEquity": rng.uniform(10, 250),
+    }
+
+    sentences = [
+        f"{symbol} shares moved after the company reported quarterly results that beat analyst estimates.",
+        f"Analysts raised their price targets on {symbol} citing strong demand and margin expansion.",
+        f"{symbol} faces regulatory scrutiny over its latest acquisition, according to people familiar.",
+        f"Institutional investors increased their stakes in {symbol} during the last quarter.",
+    ]
+    results = []
+    for i in range(6):
+        content = " ".join(sentences[(i + j) % len(sentences)] for j in range(6))
+        results.append(
+            {
+                "title": f"{symbol} news headline {i + 1}",
+                "url": f"https://news.example.com/{symbol.lower()}/{i + 1}",
+                "content": content,
+                "published_date": str((pd.Timestamp.now() - pd.Timedelta(days=i)).date()),
+                "score": round(0.95 - i * 0.12, 2),
+            }
+        )
+    # 신디케이션 중복 기사 (중복 제거 경로 측정용)
+    results.append({**results[0], "url": f"https://mirror.example.com/{symbol.lower()}/1", "score": 0.4})
+
+    return history, info, {"query": f"{symbol} stock news", "results": results}
+
+
+def load_fixtures(tickers: list[str], fixture_dir: str | Path = DEFAULT_FIXTURE_DIR) -> FixtureSet:
+    """기록된 fixture를 불러오고, 없는 종목은 합성합니다.
+
+    Args:
+        tickers: 종목 심볼 리스트
+        fixture_dir: fixture 디렉터리
+
+    Returns:
+        FixtureSet: 종목별 fixture 묶음
+    """
+    fixture_path = Path(fixture_dir)
+    fixtures = FixtureSet()
+    for ticker in dict.fromkeys(ticker.upper() for ticker in tickers):
+        history, info, news = synthesize(ticker)
+
+        history_file = fixture_path / f"{ticker}.history.csv"
+        if history_file.exists():
+            recorded = pd.read_csv(history_file, index_col="Date", parse_dates=True)
+            history = _align_to_today(recorded)
+            fixtures.recorded.append(ticker)
+
+        info_file = fixture_path / f"{ticker}.info.json"
+        if info_file.exists():
+            info = json.loads(info_file.read_text(encoding="utf-8"))
+
+        news_file = fixture_path / f"{ticker}.news.json"
+        if news_file.exists():
+            news = json.loads(news_file.read_text(encoding="utf-8"))
+
+        fixtures.histories[ticker] = history
+        fixtures.infos[ticker] = info
+        fixtures.news[ticker] = news
+    return fixtures
+
+
+def record_fixtures(tickers: list[str], fixture_dir: str | Path = DEFAULT_FIXTURE_DIR, period: str = "2y") -> None:
+    """실제 yfinance/Tavily API를 호출하여 fixture를 기록합니다 (네트워크와 API 키 필요).
+
+    Args:
+        tickers: 종목 심볼 리스트
+        fixture_dir: fixture를 저장할 디렉터리
+        period: 기록할 일봉 기간 (기본값: "2y")
+    """
+    import yfinance as yf
+    from tavily import TavilyClient
+
+    from src.config import settings
+
+    fixture_path = Path(fixture_dir)
+    fixture_path.mkdir(parents=True, exist_ok=True)
+    client = TavilyClient(api_key=settings.tavily_api_key)
+
+    for ticker in dict.fromkeys(ticker.upper() for ticker in tickers):
+        stock = yf.Ticker(ticker)
+        history = stock.history(period=period)[["Open", "High", "Low", "Close", "Volume"]]
+        history.index = history.index.tz_localize(None)
+        history.to_csv(fixture_path / f"{ticker}.history.csv", index_label="Date")
+
+        (fixture_path / f"{ticker}.info.json").write_text(
+            json.dumps(stock.info or {}, ensure_ascii=False, default=str), encoding="utf-8"
+        )
+        news = client.search(query=f"{ticker} stock news", search_depth=settings.news_search_depth, max_results=5)
+        (fixture_path / f"{ticker}.news.json").write_text(json.dumps(news, ensure_ascii=False), encoding="utf-8")
+        print(f"[{ticker}] fixture 기록 완료 ({len(history)}개 봉)")
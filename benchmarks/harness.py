@@ -0,0 +1,308 @@
+"""도구 단위/배치/종목 단위/watchlist 시나리오를 측정하고 기준선과 비교하는 모듈입니다."""
+
+import json
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any
+from unittest import mock
+
+from benchmarks.fakes import BenchmarkChatModel, UpstreamCounter
+from src.config import settings
+
+SCENARIOS = ("imports", "tools", "batch", "single", "watchlist")
+
+_REPO_ROOT = Path(__file__).resolve().parent.parent
+
+# 새 인터프리터에서 측정할 시작 경로: 이름 -> (실행 코드, 이 시점까지 import되면 안 되는 모듈)
+_IMPORT_TARGETS: dict[str, tuple[str, tuple[str, ...]]] = {
+    "main_help": (
+        "import sys; sys.argv = ['main.py', '--help']\ntry:\n    import runpy; runpy.run_path('main.py')\n"
+        "except SystemExit:\n    pass",
+        ("src.agent", "pandas", "yfinance", "tavily", "deepagents", "langchain_google_genai", "langchain_openai"),
+    ),
+    "import_agent": (
+        "import src.agent",
+        ("pandas", "yfinance", "tavily", "deepagents", "langchain_google_genai", "langchain_openai"),
+    ),
+    "import_tools": (
+        # API 키가 없어도 import되어야 하며, import만으로 설정(Settings)을 검증/생성하지 않아야 함
+        "import os\nfor key in ('TAVILY_API_KEY', 'GOOGLE_API_KEY', 'OPENAI_API_KEY'):\n    os.environ.pop(key, None)\n"
+        "import src.tools\nfrom src.config import settings\n"
+        "assert object.__getattribute__(settings, '_instance') is None, 'import 시점에 Settings가 생성됨'",
+        ("yfinance", "tavily", "deepagents", "langchain_google_genai", "langchain_openai"),
+    ),
+    "create_agent": (
+        "from src.agent import create_stock_research_agent; create_stock_research_agent()",
+        ("yfinance", "tavily", "langchain_openai", "src.llm_cache"),
+    ),
+}
+
+
+@dataclass
+class BenchmarkConfig:
+    """벤치마크 실행 설정입니다."""
+
+    tickers: list[str]
+    iterations: int = 5
+    llm_latency: float = 0.2
+    upstream_latency: float = 0.05
+    workers: int = 4
+    scenarios: tuple[str, ...] = SCENARIOS
+
+
+@dataclass
+class BenchmarkResult:
+    """시나리오별 측정값을 `<시나리오>.<대상>.<측정 항목>` 형태의 평면 딕셔너리로 모으는 클래스입니다."""
+
+    metrics: dict[str, float] = field(default_factory=dict)
+    upstream_calls: dict[str, dict[str, int]] = field(default_factory=dict)
+
+    def add_latencies(self, prefix: str, samples: list[float]) -> None:
+        """지연 시간 표본에서 평균/p50/p95와 초당 처리량을 계산하여 기록합니다."""
+        ordered = sorted(samples)
+        self.metrics[f"{prefix}.mean"] = round(statistics.fmean(ordered), 6)
+        self.metrics[f"{prefix}.p50"] = round(_percentile(ordered, 0.50), 6)
+        self.metrics[f"{prefix}.p95"] = round(_percentile(ordered, 0.95), 6)
+        total = sum(ordered)
+        self.metrics[f"{prefix}.throughput"] = round(len(ordered) / total, 4) if total > 0 else float("inf")
+
+
+def _percentile(ordered: list[float], q: float) -> float:
+    """정렬된 표본에서 선형 보간 백분위수를 계산합니다."""
+    if len(ordered) == 1:
+        return ordered[0]
+    position = (len(ordered) - 1) * q
+    lower = int(position)
+    upper = min(lower + 1, len(ordered) - 1)
+    return ordered[lower] + (ordered[upper] - ordered[lower]) * (position - lower)
+
+
+def _timed(func: Callable[[], Any]) -> float:
+    started = time.perf_counter()
+    func()
+    return time.perf_counter() - started
+
+
+@contextmanager
+def isolated_state() -> Iterator[None]:
+    """모든 캐시를 비우고 빈 임시 OHLCV 저장소를 켠 콜드 상태를 만듭니다."""
+    import src.agent as agent_module
+    import src.data.market as market
+    from src.tools.news_search import get_news_cache
+    from src.tools.streaming import streaming_engine
+
+    market.get_market_cache().clear()
+    market.get_compact_cache().clear()
+    get_news_cache().clear()
+    streaming_engine.reset()
+    with tempfile.TemporaryDirectory(prefix="bench-ohlcv-") as store_dir:
+        with (
+            mock.patch.object(settings, "ohlcv_store_enabled", True),
+            mock.patch.object(settings, "ohlcv_store_dir", store_dir),
+            mock.patch.object(market, "_ohlcv_stores", {}),
+            mock.patch.object(agent_module, "_agent_instance", None),
+        ):
+            yield
+
+
+@contextmanager
+def benchmark_settings(config: BenchmarkConfig) -> Iterator[None]:
+    """측정을 방해하는 부가 기능(디스크 캐시, 추적)을 끄고 LLM을 벤치마크 모델로 교체합니다."""
+    import src.agent as agent_module
+
+    model = BenchmarkChatModel(latency=config.llm_latency)
+    with (
+        mock.patch.object(settings, "llm_cache_enabled", False),
+        mock.patch.object(settings, "news_cache_path", None),
+        mock.patch.object(settings, "tracing_enabled", False),
+        mock.patch.object(agent_module, "get_model", lambda: model),
+    ):
+        yield
+
+
+def bench_imports(config: BenchmarkConfig, result: BenchmarkResult, counter: UpstreamCounter) -> None:
+    """새 인터프리터의 시작/import 시간을 측정하고, 지연 로딩해야 할 모듈이 미리 import되면 실패합니다.
+
+    Gemini provider, LLM 캐시 비활성화 기본 설정에서 측정합니다.
+    """
+    env = {
+        **os.environ,
+        "TAVILY_API_KEY": "offline-benchmark",
+        "GOOGLE_API_KEY": "offline-benchmark",
+        "LLM_PROVIDER": "gemini",
+        "LLM_CACHE_ENABLED": "false",
+        "MARKET_DATA_PROVIDER": "yfinance",
+    }
+    report = "\nimport json, sys; print(json.dumps(sorted(sys.modules)))"
+    for name, (code, lazy_modules) in _IMPORT_TARGETS.items():
+        samples = []
+        loaded: list[str] = []
+        for _ in range(config.iterations):
+            started = time.perf_counter()
+            completed = subprocess.run(
+                [sys.executable, "-c", code + report], cwd=_REPO_ROOT, env=env, capture_output=True, text=True
+            )
+            samples.append(time.perf_counter() - started)
+            if completed.returncode != 0:
+                raise RuntimeError(f"import 벤치마크 {name} 실행 실패: {completed.stderr.strip()}")
+            loaded = json.loads(completed.stdout.strip().splitlines()[-1])
+
+        eager = [module for module in lazy_modules if module in loaded]
+        if eager:
+            raise RuntimeError(f"import 벤치마크 {name}: 지연 로딩해야 할 모듈이 import됨 {eager}")
+        result.add_latencies(f"imports.{name}", samples)
+        result.metrics[f"imports.{name}.modules"] = len(loaded)
+
+
+def bench_tools(config: BenchmarkConfig, result: BenchmarkResult, counter: UpstreamCounter) -> None:
+    """도구 함수별 콜드(캐시 없음)/웜(캐시 적중) 지연 시간을 측정합니다."""
+    from src.tools import get_financial_data, get_stock_price, get_technical_summary, search_stock_news
+
+    tools: dict[str, Callable[[str], Any]] = {
+        "get_stock_price": get_stock_price,
+        "get_financial_data": get_financial_data,
+        "get_technical_summary": get_technical_summary,
+        "search_stock_news": search_stock_news,
+    }
+    for name, tool in tools.items():
+        counter.reset()
+        cold: list[float] = []
+        warm: list[float] = []
+        for _ in range(config.iterations):
+            with isolated_state():
+                for ticker in config.tickers:
+                    cold.append(_timed(lambda: tool(ticker)))
+                for ticker in config.tickers:
+                    warm.append(_timed(lambda: tool(ticker)))
+        result.add_latencies(f"tools.{name}.cold", cold)
+        result.add_latencies(f"tools.{name}.warm", warm)
+        result.upstream_calls[f"tools.{name}"] = dict(counter.calls)
+
+
+def bench_batch(config: BenchmarkConfig, result: BenchmarkResult, counter: UpstreamCounter) -> None:
+    """여러 종목을 한 번에 처리하는 배치 함수의 콜드 지연 시간을 측정합니다."""
+    from src.tools import get_stock_prices, get_technical_summaries
+
+    batches: dict[str, Callable[[list[str]], Any]] = {
+        "get_stock_prices": get_stock_prices,
+        "get_technical_summaries": get_technical_summaries,
+    }
+    for name, batch in batches.items():
+        counter.reset()
+        samples = []
+        for _ in range(config.iterations):
+            with isolated_state():
+                samples.append(_timed(lambda: batch(config.tickers)))
+        result.add_latencies(f"batch.{name}", samples)
+        result.upstream_calls[f"batch.{name}"] = dict(counter.calls)
+
+
+def bench_single(config: BenchmarkConfig, result: BenchmarkResult, counter: UpstreamCounter) -> None:
+    """에이전트 한 번의 종목 조사(메인 에이전트 + 세 서브에이전트) 지연 시간을 측정합니다."""
+    from src.agent import create_stock_research_agent, run_research
+
+    counter.reset()
+    samples = []
+    ticker = config.tickers[0]
+    for _ in range(config.iterations):
+        with isolated_state():
+            agent = create_stock_research_agent()
+            samples.append(_timed(lambda: run_research(ticker, agent=agent)))
+    result.add_latencies("single.run_research", samples)
+    result.upstream_calls["single.run_research"] = dict(counter.calls)
+
+
+def bench_watchlist(config: BenchmarkConfig, result: BenchmarkResult, counter: UpstreamCounter) -> None:
+    """watchlist 배치 조사 전체 소요 시간과 종목당 처리량을 측정합니다."""
+    from src.batch import run_watchlist
+
+    counter.reset()
+    samples = []
+    for _ in range(max(1, config.iterations // 2)):
+        with isolated_state(), tempfile.TemporaryDirectory(prefix="bench-reports-") as output_dir:
+            summary = run_watchlist(config.tickers, output_dir, config.workers)
+            samples.append(summary.duration_seconds)
+            if summary.failed:
+                raise RuntimeError(f"watchlist 벤치마크 실패: {[job.error for job in summary.jobs if job.error]}")
+    result.add_latencies("watchlist.run_watchlist", samples)
+    result.metrics["watchlist.run_watchlist.tickers_per_second"] = round(
+        len(config.tickers) / statistics.fmean(samples), 4
+    )
+    result.upstream_calls["watchlist.run_watchlist"] = dict(counter.calls)
+
+
+_RUNNERS = {
+    "imports": bench_imports,
+    "tools": bench_tools,
+    "batch": bench_batch,
+    "single": bench_single,
+    "watchlist": bench_watchlist,
+}
+
+
+def run_benchmarks(
+    config: BenchmarkConfig, counter: UpstreamCounter, on_scenario: Callable[[str], None] | None = None
+) -> BenchmarkResult:
+    """설정된 시나리오를 순서대로 실행합니다 (대체 업스트림 컨텍스트 안에서 호출해야 함).
+
+    Args:
+        config: 벤치마크 설정
+        counter: 대체 업스트림 호출 카운터
+        on_scenario: 시나리오 시작 시 이름을 받아 호출되는 함수 (선택 사항)
+
+    Returns:
+        BenchmarkResult: 시나리오별 측정값
+    """
+    result = BenchmarkResult()
+    with benchmark_settings(config):
+        for scenario in config.scenarios:
+            if on_scenario is not None:
+                on_scenario(scenario)
+            _RUNNERS[scenario](config, result, counter)
+    return result
+
+
+def is_higher_better(metric: str) -> bool:
+    """측정 항목이 클수록 좋은지(처리량) 여부를 반환합니다."""
+    return metric.endswith((".throughput", ".tickers_per_second"))
+
+
+def compare_to_baseline(
+    current: dict[str, float], baseline: dict[str, float], tolerance: float
+) -> list[dict[str, Any]]:
+    """현재 측정값을 기준선과 비교합니다.
+
+    Args:
+        current: 현재 측정값
+        baseline: 기준선 측정값
+        tolerance: 허용 변화율 (예: 0.2는 20%까지 느려져도 회귀로 보지 않음)
+
+    Returns:
+        list[dict[str, Any]]: 항목별 {metric, baseline, current, ratio, status} ("faster", "slower", "same")
+    """
+    rows = []
+    for metric in sorted(set(current) & set(baseline)):
+        before, after = baseline[metric], current[metric]
+        if not before:
+            continue
+        ratio = after / before
+        # 처리량은 클수록, 지연 시간은 작을수록 좋음
+        speedup = ratio if is_higher_better(metric) else (1 / ratio if ratio else float("inf"))
+        if speedup < 1 / (1 + tolerance):
+            status = "slower"
+        elif speedup > 1 + tolerance:
+            status = "faster"
+        else:
+            status = "same"
+        rows.append(
+            {"metric": metric, "baseline": before, "current": after, "ratio": round(ratio, 4), "status": status}
+        )
+    return rows
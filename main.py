@@ -1,11 +1,61 @@
-"""주식 조사 Deep Agent 애플리케이션의 엔트리포인트입니다."""
+"""주식 조사 Deep Agent 애플리케이션의 엔트리포인트입니다.
+
+인자 없이 실행하면 종목 하나를 입력받아 대화형으로 조사하고,
+종목 심볼이나 watchlist 파일을 넘기면 배치 모드로 일괄 조사합니다.
+
+    python main.py                               # 대화형
+    python main.py AAPL TSLA MSFT                # 배치
+    python main.py --file watchlist.txt -w 8     # 파일 기반 배치
+    python main.py --stream AAPL                 # 진행 상황/보고서 토큰 실시간 출력
+    python main.py --serve --port 8000           # 에이전트를 유지하는 HTTP 조사 서비스
+    python main.py --checkpoint AAPL             # 실행 상태를 저장 (실패 시 실행 ID로 재개 가능)
+    python main.py --resume AAPL-20250101T093000-1a2b3c  # 중단된 실행 재개
+    python main.py --refresh AAPL MSFT           # 최근 보고서에서 바뀐 섹션만 다시 생성
+    python main.py --screen --file sp500.txt --top 10  # 유니버스를 사전 선별하여 상위 종목만 조사
+"""
+
+import argparse
 
-from src.agent import create_stock_research_agent
 from src.config import settings
 
 
-def main() -> None:
-    """메인 함수: 주식 조사 에이전트를 실행합니다."""
+def parse_args() -> argparse.Namespace:
+    """명령행 인자를 파싱합니다."""
+    parser = argparse.ArgumentParser(description="주식 조사 Deep Agent")
+    parser.add_argument("tickers", nargs="*", help="배치로 조사할 종목 심볼 (예: AAPL TSLA)")
+    parser.add_argument("-f", "--file", help="종목 심볼 목록 파일 (한 줄에 하나, # 주석 허용)")
+    # 기본값은 설정(BATCH_WORKERS, BATCH_OUTPUT_DIR)에서 실행 시점에 채움 (--help는 설정 검증 없이 동작)
+    parser.add_argument("-w", "--workers", type=int, help="동시에 실행할 최대 작업 수 (기본값: BATCH_WORKERS)")
+    parser.add_argument("-o", "--output-dir", help="보고서 저장 디렉터리 (기본값: BATCH_OUTPUT_DIR)")
+    parser.add_argument(
+        "-s", "--stream", action="store_true", help="진행 상황과 보고서 토큰을 실시간 출력 (종목 순차 실행)"
+    )
+    parser.add_argument("--serve", action="store_true", help="에이전트와 캐시를 유지하는 HTTP 조사 서비스 실행")
+    parser.add_argument("--host", help="서비스 바인드 주소 (기본값: SERVICE_HOST)")
+    parser.add_argument("--port", type=int, help="서비스 포트 (기본값: SERVICE_PORT)")
+    parser.add_argument(
+        "--checkpoint", action="store_true", help="실행 상태와 도구 결과를 저장 (기본값: CHECKPOINT_ENABLED)"
+    )
+    parser.add_argument("--resume", metavar="RUN_ID", help="체크포인트에 저장된 실행을 마지막 단계부터 재개")
+    parser.add_argument(
+        "--refresh", action="store_true", help="저장된 최근 보고서에서 입력 데이터가 바뀐 섹션만 다시 생성"
+    )
+    parser.add_argument(
+        "--screen", action="store_true", help="종목 목록을 기술적 시그널/재무 지표로 사전 선별한 뒤 상위 종목만 조사"
+    )
+    parser.add_argument("--top", type=int, help="스크리닝 후 조사할 상위 종목 수 (기본값: SCREEN_TOP_N)")
+    return parser.parse_args()
+
+
+def run_interactive(stream: bool = False, refresh: bool = False) -> None:
+    """종목 하나를 입력받아 조사 결과를 출력합니다.
+
+    Args:
+        stream: 진행 상황과 보고서 토큰을 실시간으로 출력할지 여부
+        refresh: 저장된 최근 보고서에서 바뀐 섹션만 다시 생성할지 여부
+    """
+    from src.agent import create_stock_research_agent, run_research
+
     print("주식 조사 Deep Agent를 시작합니다...")
     print("-" * 50)
 
@@ -19,26 +69,150 @@ def main() -> None:
         print("종목 심볼이 입력되지 않았습니다.")
         return
 
+    if stream and not refresh:
+        run_streaming([ticker], agent=agent)
+        return
+
     print(f"\n'{ticker}' 종목 분석을 시작합니다...\n")
 
-    # 에이전트 실행 (recursion_limit으로 최대 반복 횟수 제한)
-    result = agent.invoke(
-        {"messages": [{"role": "user", "content": f"{ticker} 주식을 종합적으로 분석해주세요."}]},
-        config={"recursion_limit": settings.max_iterations * 10},  # 서브에이전트 포함 여유 있게 설정
-    )
+    # 에이전트 실행 (증분 갱신 모드에서는 바뀐 섹션만 다시 생성)
+    if refresh:
+        from src.reports import refresh_research
+
+        report = refresh_research(ticker, agent=agent)
+    else:
+        report = run_research(ticker, agent=agent)
 
     # 결과 출력
     print("\n" + "=" * 50)
     print("분석 완료")
     print("=" * 50)
+    print(report)
+
+
+def run_streaming(tickers: list[str], agent=None, run_id: str | None = None) -> None:
+    """종목을 순서대로 조사하며 진행 상황과 보고서 토큰을 실시간으로 출력합니다."""
+    from src.progress import stream_research
+
+    for ticker in tickers:
+        print(f"\n'{ticker}' 종목 분석을 시작합니다 (스트리밍)...\n")
+        report, streamed = stream_research(ticker, agent=agent, run_id=run_id)
+
+        print("\n" + "=" * 50)
+        print(f"{ticker} 분석 완료")
+        print("=" * 50)
+        # 보고서가 파일로 저장되어 토큰으로 출력되지 않은 경우에만 다시 출력
+        if not streamed:
+            print(report)
+
+
+def run_resume(run_id: str, stream: bool = False) -> None:
+    """체크포인트에 저장된 실행을 이어서 진행하고 보고서를 출력합니다.
+
+    Args:
+        run_id: 재개할 실행 ID (실패 시 오류 메시지에 표시됨)
+        stream: 진행 상황과 보고서 토큰을 실시간으로 출력할지 여부
+    """
+    from src.agent import run_research
+    from src.checkpoint import get_run_store
+
+    run = get_run_store().get_run(run_id)
+    if run is None:
+        print(f"실행 ID '{run_id}'를 찾을 수 없습니다 ({settings.checkpoint_path}).")
+        return
+
+    print(f"'{run['ticker']}' 실행 {run_id}을(를) 재개합니다 (이전 상태: {run['status']})...\n")
+    if stream:
+        run_streaming([run["ticker"]], run_id=run_id)
+        return
+
+    report = run_research(run["ticker"], run_id=run_id)
+    print("\n" + "=" * 50)
+    print("분석 완료")
+    print("=" * 50)
+    print(report)
+
+
+def run_batch(tickers: list[str], workers: int, output_dir: str, refresh: bool = False) -> None:
+    """여러 종목을 워커 풀에서 조사(또는 증분 갱신)하고 종목별 보고서와 요약을 저장합니다."""
+    from src.batch import run_watchlist
+
+    print(f"{len(tickers)}개 종목 배치 조사를 시작합니다 (워커 {workers}개, 출력: {output_dir})")
+    print("-" * 50)
+
+    def on_result(job) -> None:
+        status = "완료" if job.status == "success" else f"실패 ({job.error})"
+        print(f"[{job.ticker}] {status} - {job.duration_seconds:.1f}초")
+
+    summary = run_watchlist(tickers, output_dir, workers, on_result=on_result, refresh=refresh)
+
+    print("\n" + "=" * 50)
+    print(f"배치 조사 완료: 성공 {summary.succeeded}개, 실패 {summary.failed}개, 총 {summary.duration_seconds:.1f}초")
+    print("=" * 50)
+    for job in summary.jobs:
+        if job.status == "failed":
+            print(f"  실패 - {job.ticker}: {job.error}")
+
+
+def run_screen(tickers: list[str], top_n: int | None = None) -> list[str]:
+    """종목 유니버스를 스크리닝하여 결과를 출력하고 상위 종목 심볼을 반환합니다."""
+    from src.screener import ScreenCriteria, screen_universe
+
+    criteria = ScreenCriteria.from_settings()
+    if top_n is not None:
+        criteria.top_n = top_n
+
+    print(f"{len(tickers)}개 종목 스크리닝을 시작합니다 (상위 {criteria.top_n}개 선별)")
+    summary = screen_universe(tickers, criteria)
+
+    print(f"평가 {summary.evaluated}개, 조건 통과 {summary.passed}개")
+    print("-" * 50)
+    for rank, result in enumerate(summary.results, 1):
+        pe = f"{result.pe_ratio:.1f}" if result.pe_ratio is not None else "-"
+        print(
+            f"{rank:>3}. {result.symbol:<6} 점수 {result.score:.3f}  ${result.current_price:,.2f}  "
+            f"RSI {result.rsi:.1f}  PER {pe}"
+        )
+    return summary.tickers
+
+
+def main() -> None:
+    """메인 함수: 주식 조사 에이전트를 실행합니다."""
+    args = parse_args()
+    if args.checkpoint or args.resume:
+        settings.checkpoint_enabled = True
+    if args.refresh:
+        settings.report_store_enabled = True
+
+    if args.resume:
+        run_resume(args.resume, stream=args.stream)
+        return
+
+    if args.serve:
+        from src.service import serve
+
+        serve(host=args.host, port=args.port, workers=args.workers)
+        return
+
+    tickers = [ticker.strip().upper() for ticker in args.tickers]
+    if args.file:
+        from src.batch import load_watchlist
+
+        tickers.extend(load_watchlist(args.file))
+    tickers = list(dict.fromkeys(ticker for ticker in tickers if ticker))
+    if args.screen and tickers:
+        tickers = run_screen(tickers, args.top)
+        if not tickers:
+            print("조건을 통과한 종목이 없습니다.")
+            return
 
-    # 마지막 메시지 출력
-    if result.get("messages"):
-        last_message = result["messages"][-1]
-        if hasattr(last_message, "content"):
-            print(last_message.content)
-        else:
-            print(last_message)
+    if tickers and args.stream and not args.refresh:
+        run_streaming(tickers)
+    elif tickers:
+        workers = args.workers if args.workers is not None else settings.batch_workers
+        run_batch(tickers, workers, args.output_dir or settings.batch_output_dir, refresh=args.refresh)
+    else:
+        run_interactive(stream=args.stream, refresh=args.refresh)
 
 
 if __name__ == "__main__":
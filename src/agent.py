@@ -1,73 +1,133 @@
-"""DeepAgents 기반 주식 조사 에이전트를 정의하는 모듈입니다."""
+"""DeepAgents 기반 주식 조사 에이전트를 정의하는 모듈입니다.
 
-from deepagents import create_deep_agent
-from langchain_core.language_models import BaseChatModel
-from langchain_google_genai import ChatGoogleGenerativeAI
-from langchain_openai import ChatOpenAI
+CLI 시작 시간을 줄이기 위해 무거운 의존성(deepagents, LLM SDK, 데이터 도구)은 모듈 import 시점이 아니라
+처음 사용하는 함수 안에서 불러옵니다. LLM SDK는 선택한 provider의 것만 불러옵니다.
+"""
+
+import threading
+from collections.abc import Iterator
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING
 
 from src.config import settings
-from src.prompts import STOCK_RESEARCH_WORKFLOW, SUBAGENT_DELEGATION_INSTRUCTIONS
-from src.subagents import SUBAGENTS
-from src.tools import get_financial_data, get_stock_price, get_technical_summary, search_stock_news
+from src.prompts import PARALLEL_DELEGATION_INSTRUCTIONS, STOCK_RESEARCH_WORKFLOW, SUBAGENT_DELEGATION_INSTRUCTIONS
+
+if TYPE_CHECKING:
+    from langchain_core.language_models import BaseChatModel
+
+    from src.tracing import RunTrace
 
 
-def get_model() -> BaseChatModel:
+def get_model() -> "BaseChatModel":
     """설정에 따라 LLM 인스턴스를 생성하여 반환합니다.
 
+    `llm_cache_enabled`가 켜져 있으면 같은 모델 설정과 메시지에 대한 응답을 로컬 캐시에서 재사용합니다.
+
     Returns:
         설정된 LLM 인스턴스 (ChatGoogleGenerativeAI 또는 ChatOpenAI)
 
     Raises:
         ValueError: 선택한 provider의 API 키가 설정되지 않은 경우
     """
+    cache = None
+    if settings.llm_cache_enabled:
+        from src.llm_cache import get_llm_response_cache
+
+        cache = get_llm_response_cache()
+
     if settings.llm_provider == "openai":
         if not settings.openai_api_key:
             raise ValueError("OpenAI를 사용하려면 OPENAI_API_KEY 환경 변수를 설정해야 합니다.")
+        from langchain_openai import ChatOpenAI
+
         return ChatOpenAI(
             model=settings.openai_model,
             temperature=settings.temperature,
             max_tokens=settings.max_tokens,
             api_key=settings.openai_api_key,
+            cache=cache,
         )
     else:
         if not settings.google_api_key:
             raise ValueError("Gemini를 사용하려면 GOOGLE_API_KEY 환경 변수를 설정해야 합니다.")
+        from langchain_google_genai import ChatGoogleGenerativeAI
+
         return ChatGoogleGenerativeAI(
             model=settings.gemini_model,
             temperature=settings.temperature,
             max_output_tokens=settings.max_tokens,
             google_api_key=settings.google_api_key,
+            cache=cache,
         )
 
 
 def create_stock_research_agent():
     """주식 조사 Deep Agent를 생성합니다.
 
+    반환된 에이전트는 `invoke`/`stream`과 `ainvoke`/`astream`을 모두 지원합니다.
+
     Returns:
         DeepAgent: 주식 조사를 수행하는 에이전트
     """
-    # 시스템 프롬프트 구성
+    from deepagents import create_deep_agent
+
+    from src.subagents import SUBAGENTS
+    from src.tools import (
+        financial_data_agent_tool,
+        news_search_agent_tool,
+        stock_price_agent_tool,
+        technical_summary_agent_tool,
+    )
+
+    model = get_model()
+
+    # 시스템 프롬프트 구성 (병렬 위임 모드에서는 병렬 위임 지침 사용)
+    delegation_instructions = (
+        PARALLEL_DELEGATION_INSTRUCTIONS if settings.parallel_subagents else SUBAGENT_DELEGATION_INSTRUCTIONS
+    )
     system_prompt = f"""
 {STOCK_RESEARCH_WORKFLOW}
 
-{SUBAGENT_DELEGATION_INSTRUCTIONS}
+{delegation_instructions}
 """
 
     # 메인 에이전트가 사용할 커스텀 도구
-    # (서브에이전트 없이 직접 호출할 수도 있음)
+    # (서브에이전트 없이 직접 호출할 수도 있음, ainvoke/astream에서는 비동기 버전 실행)
     custom_tools = [
-        get_stock_price,
-        get_financial_data,
-        get_technical_summary,
-        search_stock_news,
+        stock_price_agent_tool,
+        financial_data_agent_tool,
+        technical_summary_agent_tool,
+        news_search_agent_tool,
     ]
 
+    # 기술적 분석 고속 경로: LLM 대신 규칙 기반 템플릿으로 결과 생성 (처리 불가 시 LLM 서브에이전트)
+    subagents = SUBAGENTS
+    if settings.technical_fast_path:
+        from src.subagents.technical_fast_path import with_technical_fast_path
+
+        subagents = with_technical_fast_path(SUBAGENTS, model)
+
+    # 병렬 위임 모드: 세 분석 서브에이전트를 동시에 실행하는 도구 추가
+    if settings.parallel_subagents:
+        from src.subagents.parallel import create_parallel_analysis_tool
+
+        custom_tools.append(create_parallel_analysis_tool(model, subagents, timeout=settings.subagent_timeout))
+
+    # 체크포인트 모드: 그래프 상태를 실행 ID(thread_id)별로 SQLite에 저장하여 중단된 실행을 재개
+    checkpointer = None
+    if settings.checkpoint_enabled:
+        from src.checkpoint import get_run_store
+
+        checkpointer = get_run_store().checkpointer
+
     # Deep Agent 생성
     agent = create_deep_agent(
-        model=get_model(),
+        model=model,
         tools=custom_tools,
-        subagents=SUBAGENTS,
+        subagents=subagents,
         system_prompt=system_prompt,
+        checkpointer=checkpointer,
     )
 
     return agent
@@ -75,15 +135,169 @@ def create_stock_research_agent():
 
 # 싱글톤 에이전트 인스턴스 (필요 시 사용)
 _agent_instance = None
+_agent_lock = threading.Lock()
 
 
 def get_agent():
     """주식 조사 에이전트 인스턴스를 반환합니다 (싱글톤).
 
+    여러 스레드에서 동시에 호출해도 에이전트는 한 번만 생성됩니다.
+
     Returns:
         DeepAgent: 주식 조사 에이전트
     """
     global _agent_instance
     if _agent_instance is None:
-        _agent_instance = create_stock_research_agent()
+        with _agent_lock:
+            if _agent_instance is None:
+                _agent_instance = create_stock_research_agent()
     return _agent_instance
+
+
+def build_research_input(ticker: str) -> dict:
+    """종목 조사 요청 입력 메시지를 생성합니다.
+
+    Args:
+        ticker: 주식 심볼 (예: "AAPL", "TSLA")
+
+    Returns:
+        dict: 에이전트 invoke에 전달할 입력 상태
+    """
+    return {"messages": [{"role": "user", "content": f"{ticker} 주식을 종합적으로 분석해주세요."}]}
+
+
+def build_research_config(trace: "RunTrace | None" = None, run_id: str | None = None) -> dict:
+    """에이전트 실행 설정을 생성합니다 (recursion_limit으로 최대 반복 횟수 제한).
+
+    Args:
+        trace: LLM 호출과 서브에이전트 실행을 기록할 실행 trace (선택 사항)
+        run_id: 체크포인트를 저장/재개할 실행 ID (선택 사항, 체크포인트 모드에서 사용)
+
+    Returns:
+        dict: 에이전트 invoke에 전달할 config
+    """
+    config: dict = {"recursion_limit": settings.max_iterations * 10}  # 서브에이전트 포함 여유 있게 설정
+    if trace is not None:
+        from src.subagents import SUBAGENTS
+        from src.tracing import TracingCallbackHandler
+
+        subagent_names = {spec["name"] for spec in SUBAGENTS}
+        config["callbacks"] = [TracingCallbackHandler(trace, subagent_names=subagent_names)]
+    if run_id is not None:
+        config["configurable"] = {"thread_id": run_id}
+    return config
+
+
+def extract_report(result: dict) -> str:
+    """에이전트 실행 결과에서 최종 보고서 텍스트를 꺼냅니다.
+
+    에이전트가 `write_file`로 마크다운 보고서를 저장했다면 가장 최근 파일을,
+    그렇지 않으면 마지막 메시지 내용을 반환합니다.
+
+    Args:
+        result: 에이전트 invoke 결과 상태
+
+    Returns:
+        str: 보고서 텍스트
+    """
+    reports = [data for path, data in (result.get("files") or {}).items() if path.endswith(".md")]
+    if reports:
+        latest = max(reports, key=lambda data: data.get("modified_at", ""))
+        return "\n".join(latest["content"])
+
+    if result.get("messages"):
+        last_message = result["messages"][-1]
+        if hasattr(last_message, "content"):
+            return last_message.text if hasattr(last_message, "text") else str(last_message.content)
+        return str(last_message)
+    return ""
+
+
+@dataclass
+class ResearchRun:
+    """조사 실행 하나에 전달할 입력과 설정입니다."""
+
+    input: dict | None  # None이면 마지막 체크포인트부터 재개
+    config: dict
+    run_id: str | None = None
+    completed: dict | None = None  # 이미 완료된 실행이면 마지막 상태
+    fingerprints: dict[str, str] = field(default_factory=dict)  # 실행 중 도구 결과로 계산한 보고서 섹션 지문
+
+
+@contextmanager
+def research_run(ticker: str, agent, run_id: str | None = None) -> Iterator[ResearchRun]:
+    """실행 추적과 (설정 시) 체크포인트를 적용한 조사 실행 컨텍스트를 엽니다.
+
+    `checkpoint_enabled`가 켜져 있으면 실행 ID의 저장된 상태를 확인하여
+    처음 실행이면 조사 입력을, 중단된 실행이면 None(마지막 체크포인트부터 재개)을,
+    이미 완료된 실행이면 마지막 상태(`completed`)를 돌려줍니다. 성공한 실행은 `checkpoint_keep_history`가
+    꺼져 있으면 실행 상태와 최종 상태만 남기고 중간 체크포인트와 도구 결과 기록을 삭제합니다.
+
+    Args:
+        ticker: 주식 심볼 (예: "AAPL", "TSLA")
+        agent: 실행할 에이전트 (체크포인트 모드에서는 checkpointer와 함께 생성된 에이전트)
+        run_id: 실행 ID (체크포인트 모드에서 None이면 새로 생성)
+
+    Yields:
+        ResearchRun: 에이전트 invoke/stream에 전달할 입력과 설정
+
+    Raises:
+        ValueError: 체크포인트 모드에서 에이전트에 checkpointer가 없거나 실행이 실패한 경우
+            (실행 실패 오류 메시지에 재개할 실행 ID 포함)
+    """
+    from src.checkpoint import checkpointed_run, get_run_store, new_run_id
+    from src.reports import observe_fingerprints
+    from src.tracing import trace_run
+
+    store = get_run_store()
+    with trace_run(ticker) as trace, observe_fingerprints(ticker) as fingerprints:
+        if store is None:
+            yield ResearchRun(build_research_input(ticker), build_research_config(trace), fingerprints=fingerprints)
+            return
+
+        if not getattr(agent, "checkpointer", None):
+            raise ValueError(
+                "체크포인트 모드에는 checkpointer와 함께 생성된 에이전트가 필요합니다 "
+                "(CHECKPOINT_ENABLED를 켠 뒤 create_stock_research_agent()로 생성하세요)."
+            )
+        run_id = run_id or new_run_id(ticker)
+        config = build_research_config(trace, run_id)
+        state = agent.get_state(config)
+        if state.values and not state.next:
+            yield ResearchRun(None, config, run_id, completed=state.values)
+            return
+
+        store.set_status(run_id, ticker, "running")
+        try:
+            with checkpointed_run(run_id):
+                yield ResearchRun(
+                    None if state.next else build_research_input(ticker), config, run_id, fingerprints=fingerprints
+                )
+        except Exception as e:
+            store.set_status(run_id, ticker, "failed", str(e))
+            raise ValueError(f"종목 조사 중 오류 발생 (재개할 실행 ID: {run_id}): {str(e)}") from e
+        store.set_status(run_id, ticker, "succeeded")
+        if not settings.checkpoint_keep_history:
+            store.compact_run(run_id)
+
+
+def run_research(ticker: str, agent=None, run_id: str | None = None) -> str:
+    """한 종목에 대한 조사를 실행하고 보고서를 반환합니다.
+
+    Args:
+        ticker: 주식 심볼 (예: "AAPL", "TSLA")
+        agent: 사용할 에이전트 (None이면 싱글톤 에이전트 사용)
+        run_id: 체크포인트 실행 ID (체크포인트 모드에서 같은 ID로 다시 호출하면 중단된 지점부터 재개)
+
+    Returns:
+        str: 보고서 텍스트
+    """
+    agent = agent or get_agent()
+    with research_run(ticker, agent, run_id) as run:
+        result = run.completed or agent.invoke(run.input, config=run.config)
+    report = extract_report(result)
+    if settings.report_store_enabled:
+        from src.reports import record_report
+
+        record_report(ticker, result, report, run.fingerprints)
+    return report
@@ -0,0 +1,155 @@
+"""관심 종목(watchlist)을 일괄 조사하는 배치 실행 모듈입니다."""
+
+import json
+import time
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from dataclasses import asdict, dataclass, field
+from datetime import datetime
+from pathlib import Path
+
+from src.agent import get_agent, run_research
+from src.tickers import normalize_ticker
+
+
+@dataclass
+class BatchJobResult:
+    """종목 하나의 배치 조사 결과를 나타내는 클래스입니다."""
+
+    ticker: str
+    status: str  # "success" 또는 "failed"
+    duration_seconds: float
+    output_path: str | None = None
+    error: str | None = None
+
+
+@dataclass
+class BatchSummary:
+    """배치 조사 전체 요약을 나타내는 클래스입니다."""
+
+    started_at: str
+    finished_at: str
+    workers: int
+    duration_seconds: float
+    jobs: list[BatchJobResult] = field(default_factory=list)
+
+    @property
+    def succeeded(self) -> int:
+        """성공한 작업 수"""
+        return sum(1 for job in self.jobs if job.status == "success")
+
+    @property
+    def failed(self) -> int:
+        """실패한 작업 수"""
+        return sum(1 for job in self.jobs if job.status == "failed")
+
+    def to_dict(self) -> dict:
+        """요약을 직렬화 가능한 딕셔너리로 변환합니다."""
+        data = asdict(self)
+        data["succeeded"] = self.succeeded
+        data["failed"] = self.failed
+        return data
+
+
+def load_watchlist(path: str | Path) -> list[str]:
+    """파일에서 종목 심볼 리스트를 읽습니다.
+
+    한 줄에 하나 또는 쉼표/공백으로 구분된 심볼을 허용하며, `#` 이후는 주석으로 무시합니다.
+
+    Args:
+        path: watchlist 파일 경로
+
+    Returns:
+        list[str]: 중복을 제거한 대문자 심볼 리스트 (파일 순서 유지)
+    """
+    tickers: list[str] = []
+    for line in Path(path).read_text(encoding="utf-8").splitlines():
+        line = line.split("#", 1)[0]
+        tickers.extend(token.strip().upper() for token in line.replace(",", " ").split() if token.strip())
+    return list(dict.fromkeys(tickers))
+
+
+def _research_one(ticker: str, output_dir: Path, agent, refresh: bool = False) -> BatchJobResult:
+    """한 종목을 조사(또는 증분 갱신)하고 보고서를 파일로 저장합니다.
+
+    보고서 파일 이름에 쓰이므로 서비스와 같은 규칙(`normalize_ticker`)으로 심볼을 검증하며,
+    경로 구분자 등이 섞인 심볼(예: "BRK/B", "../x")은 조사하지 않고 실패로 기록합니다.
+    """
+    started = time.perf_counter()
+    try:
+        ticker = normalize_ticker(ticker)
+        if refresh:
+            from src.reports import refresh_research
+
+            report = refresh_research(ticker, agent=agent)
+        else:
+            report = run_research(ticker, agent=agent)
+        output_path = output_dir / f"{ticker}.md"
+        output_path.write_text(report, encoding="utf-8")
+        return BatchJobResult(
+            ticker=ticker,
+            status="success",
+            duration_seconds=round(time.perf_counter() - started, 3),
+            output_path=str(output_path),
+        )
+    except Exception as e:
+        return BatchJobResult(
+            ticker=ticker,
+            status="failed",
+            duration_seconds=round(time.perf_counter() - started, 3),
+            error=str(e),
+        )
+
+
+def run_watchlist(
+    tickers: list[str],
+    output_dir: str | Path,
+    workers: int,
+    on_result: Callable[[BatchJobResult], None] | None = None,
+    refresh: bool = False,
+) -> BatchSummary:
+    """여러 종목을 제한된 크기의 워커 풀에서 조사하고 종목별 보고서와 요약을 저장합니다.
+
+    모든 작업은 `get_agent()`로 얻은 하나의 에이전트 인스턴스를 공유합니다.
+
+    Args:
+        tickers: 조사할 종목 심볼 리스트
+        output_dir: 보고서(`<TICKER>.md`)와 요약(`summary.json`)을 저장할 디렉터리
+        workers: 동시에 실행할 최대 작업 수
+        on_result: 작업 하나가 끝날 때마다 `BatchJobResult`를 받아 호출되는 함수 (선택 사항)
+        refresh: 저장된 최근 보고서에서 바뀐 섹션만 다시 생성할지 여부 (보고서 저장소 필요)
+
+    Returns:
+        BatchSummary: 종목별 소요 시간과 성공/실패를 담은 요약
+    """
+    if workers <= 0:
+        raise ValueError("workers는 1 이상이어야 합니다.")
+
+    output_path = Path(output_dir)
+    output_path.mkdir(parents=True, exist_ok=True)
+    symbols = list(dict.fromkeys(ticker.strip().upper() for ticker in tickers if ticker.strip()))
+
+    started_at = datetime.now()
+    started = time.perf_counter()
+    agent = get_agent()
+
+    results: dict[str, BatchJobResult] = {}
+    with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="research") as executor:
+        futures = {executor.submit(_research_one, symbol, output_path, agent, refresh): symbol for symbol in symbols}
+        for future in as_completed(futures):
+            job = future.result()
+            results[job.ticker] = job
+            if on_result is not None:
+                on_result(job)
+
+    summary = BatchSummary(
+        started_at=started_at.isoformat(timespec="seconds"),
+        finished_at=datetime.now().isoformat(timespec="seconds"),
+        workers=workers,
+        duration_seconds=round(time.perf_counter() - started, 3),
+        jobs=[results[symbol] for symbol in symbols],
+    )
+    (output_path / "summary.json").write_text(
+        json.dumps(summary.to_dict(), ensure_ascii=False, indent=2), encoding="utf-8"
+    )
+    return summary
@@ -0,0 +1,549 @@
+"""조사 실행을 실행 ID 단위로 SQLite에 기록하여 중단된 실행을 이어서 진행하게 하는 모듈입니다.
+
+두 가지를 같은 SQLite 파일에 저장합니다.
+
+- 에이전트 그래프 체크포인트 (`SQLiteCheckpointSaver`): 재개 시 마지막으로 완료된 단계부터 다시 실행
+- 도구 결과 기록 (`ToolJournal`): 재실행되는 서브에이전트가 같은 인자로 도구를 호출하면
+  yfinance/Tavily를 다시 호출하지 않고 기록된 결과를 돌려줌
+
+성공한 실행은 실행 상태와 최종 상태만 남기고 중간 체크포인트와 도구 결과 기록을 정리합니다
+(`RunStore.compact_run`, `checkpoint_keep_history`로 끌 수 있음).
+
+체크포인트 스키마는 `langgraph.checkpoint.memory.InMemorySaver`의 저장 구조(체크포인트/채널 값/대기 중
+쓰기)를 그대로 테이블로 옮긴 것입니다.
+"""
+
+import asyncio
+import json
+import os
+import random
+import sqlite3
+import threading
+import time
+import uuid
+from collections.abc import AsyncIterator, Iterator, Sequence
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any
+
+from langchain_core.runnables import RunnableConfig
+from langgraph.checkpoint.base import (
+    WRITES_IDX_MAP,
+    BaseCheckpointSaver,
+    ChannelVersions,
+    Checkpoint,
+    CheckpointMetadata,
+    CheckpointTuple,
+    SerializerProtocol,
+    get_checkpoint_id,
+    get_checkpoint_metadata,
+)
+
+from src.config import settings
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS runs (
+    run_id TEXT PRIMARY KEY,
+    ticker TEXT NOT NULL,
+    status TEXT NOT NULL,
+    error TEXT,
+    created_at REAL NOT NULL,
+    updated_at REAL NOT NULL
+);
+CREATE TABLE IF NOT EXISTS checkpoints (
+    thread_id TEXT NOT NULL,
+    checkpoint_ns TEXT NOT NULL,
+    checkpoint_id TEXT NOT NULL,
+    parent_checkpoint_id TEXT,
+    checkpoint_type TEXT NOT NULL,
+    checkpoint BLOB NOT NULL,
+    metadata_type TEXT NOT NULL,
+    metadata BLOB NOT NULL,
+    PRIMARY KEY (thread_id, checkpoint_ns, checkpoint_id)
+);
+CREATE TABLE IF NOT EXISTS checkpoint_blobs (
+    thread_id TEXT NOT NULL,
+    checkpoint_ns TEXT NOT NULL,
+    channel TEXT NOT NULL,
+    version TEXT NOT NULL,
+    value_type TEXT NOT NULL,
+    value BLOB,
+    PRIMARY KEY (thread_id, checkpoint_ns, channel, version)
+);
+CREATE TABLE IF NOT EXISTS checkpoint_writes (
+    thread_id TEXT NOT NULL,
+    checkpoint_ns TEXT NOT NULL,
+    checkpoint_id TEXT NOT NULL,
+    task_id TEXT NOT NULL,
+    idx INTEGER NOT NULL,
+    channel TEXT NOT NULL,
+    value_type TEXT NOT NULL,
+    value BLOB,
+    task_path TEXT NOT NULL,
+    PRIMARY KEY (thread_id, checkpoint_ns, checkpoint_id, task_id, idx)
+);
+CREATE TABLE IF NOT EXISTS tool_journal (
+    run_id TEXT NOT NULL,
+    tool TEXT NOT NULL,
+    arguments TEXT NOT NULL,
+    result TEXT NOT NULL,
+    created_at REAL NOT NULL,
+    PRIMARY KEY (run_id, tool, arguments)
+);
+"""
+
+
+class _SQLiteStore:
+    """여러 스레드가 잠금으로 직렬화하여 공유하는 SQLite 연결입니다."""
+
+    def __init__(self, path: str | os.PathLike) -> None:
+        self.path = os.fspath(path)
+        if self.path != ":memory:":
+            os.makedirs(os.path.dirname(os.path.abspath(self.path)), exist_ok=True)
+        self.conn = sqlite3.connect(self.path, check_same_thread=False, timeout=30.0)
+        self.conn.executescript(_SCHEMA)
+        self.conn.commit()
+        self.lock = threading.RLock()
+
+    def close(self) -> None:
+        with self.lock:
+            self.conn.close()
+
+
+class SQLiteCheckpointSaver(BaseCheckpointSaver[str]):
+    """에이전트 그래프 체크포인트를 SQLite에 저장하는 checkpointer입니다.
+
+    `thread_id`로 실행 ID를 사용합니다. 같은 실행 ID로 입력 없이(`None`) 다시 호출하면
+    마지막 체크포인트부터 이어서 실행하며, 완료된 작업의 쓰기(도구 결과 메시지 등)는 재실행하지 않습니다.
+    """
+
+    def __init__(self, store: _SQLiteStore, *, serde: SerializerProtocol | None = None) -> None:
+        """
+        Args:
+            store: 공유 SQLite 연결
+            serde: 체크포인트 직렬화기 (기본값: langgraph 기본 직렬화기)
+        """
+        super().__init__(serde=serde)
+        self.store = store
+
+    def _load_blobs(self, thread_id: str, checkpoint_ns: str, versions: ChannelVersions) -> dict[str, Any]:
+        values: dict[str, Any] = {}
+        for channel, version in versions.items():
+            row = self.store.conn.execute(
+                "SELECT value_type, value FROM checkpoint_blobs "
+                "WHERE thread_id = ? AND checkpoint_ns = ? AND channel = ? AND version = ?",
+                (thread_id, checkpoint_ns, channel, str(version)),
+            ).fetchone()
+            if row is None or row[0] == "empty":
+                continue
+            values[channel] = self.serde.loads_typed((row[0], row[1]))
+        return values
+
+    def _load_writes(self, thread_id: str, checkpoint_ns: str, checkpoint_id: str) -> list[tuple[str, str, Any]]:
+        rows = self.store.conn.execute(
+            "SELECT task_id, channel, value_type, value FROM checkpoint_writes "
+            "WHERE thread_id = ? AND checkpoint_ns = ? AND checkpoint_id = ? ORDER BY task_path, task_id, idx",
+            (thread_id, checkpoint_ns, checkpoint_id),
+        ).fetchall()
+        return [
+            (task_id, channel, self.serde.loads_typed((value_type, value)))
+            for task_id, channel, value_type, value in rows
+        ]
+
+    def _to_tuple(self, thread_id: str, checkpoint_ns: str, row: tuple) -> CheckpointTuple:
+        checkpoint_id, parent_checkpoint_id, checkpoint_type, checkpoint_blob, metadata_type, metadata_blob = row
+        checkpoint: Checkpoint = self.serde.loads_typed((checkpoint_type, checkpoint_blob))
+        return CheckpointTuple(
+            config={
+                "configurable": {
+                    "thread_id": thread_id,
+                    "checkpoint_ns": checkpoint_ns,
+                    "checkpoint_id": checkpoint_id,
+                }
+            },
+            checkpoint={
+                **checkpoint,
+                "channel_values": self._load_blobs(thread_id, checkpoint_ns, checkpoint["channel_versions"]),
+            },
+            metadata=self.serde.loads_typed((metadata_type, metadata_blob)),
+            pending_writes=self._load_writes(thread_id, checkpoint_ns, checkpoint_id),
+            parent_config=(
+                {
+                    "configurable": {
+                        "thread_id": thread_id,
+                        "checkpoint_ns": checkpoint_ns,
+                        "checkpoint_id": parent_checkpoint_id,
+                    }
+                }
+                if parent_checkpoint_id
+                else None
+            ),
+        )
+
+    def get_tuple(self, config: RunnableConfig) -> CheckpointTuple | None:
+        """지정한 체크포인트(또는 최신 체크포인트)를 조회합니다."""
+        thread_id = config["configurable"]["thread_id"]
+        checkpoint_ns = config["configurable"].get("checkpoint_ns", "")
+        columns = "checkpoint_id, parent_checkpoint_id, checkpoint_type, checkpoint, metadata_type, metadata"
+        with self.store.lock:
+            if checkpoint_id := get_checkpoint_id(config):
+                row = self.store.conn.execute(
+                    f"SELECT {columns} FROM checkpoints "
+                    "WHERE thread_id = ? AND checkpoint_ns = ? AND checkpoint_id = ?",
+                    (thread_id, checkpoint_ns, checkpoint_id),
+                ).fetchone()
+            else:
+                row = self.store.conn.execute(
+                    f"SELECT {columns} FROM checkpoints "
+                    "WHERE thread_id = ? AND checkpoint_ns = ? ORDER BY checkpoint_id DESC LIMIT 1",
+                    (thread_id, checkpoint_ns),
+                ).fetchone()
+            return self._to_tuple(thread_id, checkpoint_ns, row) if row is not None else None
+
+    def list(
+        self,
+        config: RunnableConfig | None,
+        *,
+        filter: dict[str, Any] | None = None,
+        before: RunnableConfig | None = None,
+        limit: int | None = None,
+    ) -> Iterator[CheckpointTuple]:
+        """조건에 맞는 체크포인트를 최신순으로 나열합니다."""
+        clauses, params = [], []
+        if config is not None:
+            clauses.append("thread_id = ?")
+            params.append(config["configurable"]["thread_id"])
+            if (checkpoint_ns := config["configurable"].get("checkpoint_ns")) is not None:
+                clauses.append("checkpoint_ns = ?")
+                params.append(checkpoint_ns)
+            if checkpoint_id := get_checkpoint_id(config):
+                clauses.append("checkpoint_id = ?")
+                params.append(checkpoint_id)
+        if before is not None and (before_id := get_checkpoint_id(before)):
+            clauses.append("checkpoint_id < ?")
+            params.append(before_id)
+        where = f"WHERE {' AND '.join(clauses)}" if clauses else ""
+
+        with self.store.lock:
+            rows = self.store.conn.execute(
+                "SELECT thread_id, checkpoint_ns, checkpoint_id, parent_checkpoint_id, checkpoint_type, checkpoint, "
+                f"metadata_type, metadata FROM checkpoints {where} ORDER BY checkpoint_id DESC",
+                params,
+            ).fetchall()
+            tuples = []
+            for thread_id, checkpoint_ns, *row in rows:
+                checkpoint_tuple = self._to_tuple(thread_id, checkpoint_ns, tuple(row))
+                if filter and not all(checkpoint_tuple.metadata.get(k) == v for k, v in filter.items()):
+                    continue
+                tuples.append(checkpoint_tuple)
+                if limit is not None and len(tuples) >= limit:
+                    break
+        yield from tuples
+
+    def put(
+        self,
+        config: RunnableConfig,
+        checkpoint: Checkpoint,
+        metadata: CheckpointMetadata,
+        new_versions: ChannelVersions,
+    ) -> RunnableConfig:
+        """체크포인트와 새 버전의 채널 값을 저장합니다."""
+        copied = checkpoint.copy()
+        thread_id = config["configurable"]["thread_id"]
+        checkpoint_ns = config["configurable"]["checkpoint_ns"]
+        values: dict[str, Any] = copied.pop("channel_values")  # type: ignore[misc]
+
+        blobs = []
+        for channel, version in new_versions.items():
+            value_type, value = self.serde.dumps_typed(values[channel]) if channel in values else ("empty", b"")
+            blobs.append((thread_id, checkpoint_ns, channel, str(version), value_type, value))
+        checkpoint_type, checkpoint_blob = self.serde.dumps_typed(copied)
+        metadata_type, metadata_blob = self.serde.dumps_typed(get_checkpoint_metadata(config, metadata))
+
+        with self.store.lock:
+            self.store.conn.executemany("INSERT OR REPLACE INTO checkpoint_blobs VALUES (?, ?, ?, ?, ?, ?)", blobs)
+            self.store.conn.execute(
+                "INSERT OR REPLACE INTO checkpoints VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                (
+                    thread_id,
+                    checkpoint_ns,
+                    checkpoint["id"],
+                    config["configurable"].get("checkpoint_id"),
+                    checkpoint_type,
+                    checkpoint_blob,
+                    metadata_type,
+                    metadata_blob,
+                ),
+            )
+            self.store.conn.commit()
+        return {
+            "configurable": {
+                "thread_id": thread_id,
+                "checkpoint_ns": checkpoint_ns,
+                "checkpoint_id": checkpoint["id"],
+            }
+        }
+
+    def put_writes(
+        self,
+        config: RunnableConfig,
+        writes: Sequence[tuple[str, Any]],
+        task_id: str,
+        task_path: str = "",
+    ) -> None:
+        """완료된 작업의 중간 쓰기를 저장합니다 (재개 시 해당 작업을 다시 실행하지 않음)."""
+        thread_id = config["configurable"]["thread_id"]
+        checkpoint_ns = config["configurable"].get("checkpoint_ns", "")
+        checkpoint_id = config["configurable"]["checkpoint_id"]
+
+        rows = []
+        for index, (channel, value) in enumerate(writes):
+            idx = WRITES_IDX_MAP.get(channel, index)
+            value_type, blob = self.serde.dumps_typed(value)
+            rows.append((thread_id, checkpoint_ns, checkpoint_id, task_id, idx, channel, value_type, blob, task_path))
+
+        # 특수 채널(오류/인터럽트 등, idx < 0)만 덮어쓰고 일반 쓰기는 처음 기록을 유지 (InMemorySaver와 동일)
+        with self.store.lock:
+            for row in rows:
+                verb = "INSERT OR REPLACE" if row[4] < 0 else "INSERT OR IGNORE"
+                self.store.conn.execute(f"{verb} INTO checkpoint_writes VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)", row)
+            self.store.conn.commit()
+
+    def delete_thread(self, thread_id: str) -> None:
+        """실행 ID의 체크포인트와 쓰기를 모두 삭제합니다."""
+        with self.store.lock:
+            for table in ("checkpoints", "checkpoint_blobs", "checkpoint_writes"):
+                self.store.conn.execute(f"DELETE FROM {table} WHERE thread_id = ?", (thread_id,))
+            self.store.conn.commit()
+
+    def prune_thread(self, thread_id: str) -> None:
+        """실행 ID의 마지막 최상위 체크포인트(최종 상태)만 남기고 중간 체크포인트와 쓰기를 삭제합니다.
+
+        서브그래프 네임스페이스의 체크포인트와 최종 체크포인트가 참조하지 않는 채널 값도 함께 삭제하므로,
+        정리 후에도 `get_state`는 같은 최종 상태를 돌려줍니다 (이전 단계로의 재개/이력 조회는 불가).
+        """
+        with self.store.lock:
+            row = self.store.conn.execute(
+                "SELECT checkpoint_id, checkpoint_type, checkpoint FROM checkpoints "
+                "WHERE thread_id = ? AND checkpoint_ns = '' ORDER BY checkpoint_id DESC LIMIT 1",
+                (thread_id,),
+            ).fetchone()
+            if row is None:
+                return
+            checkpoint_id, checkpoint_type, checkpoint_blob = row
+            versions = self.serde.loads_typed((checkpoint_type, checkpoint_blob))["channel_versions"]
+
+            conn = self.store.conn
+            conn.execute(
+                "DELETE FROM checkpoints WHERE thread_id = ? AND NOT (checkpoint_ns = '' AND checkpoint_id = ?)",
+                (thread_id, checkpoint_id),
+            )
+            conn.execute("UPDATE checkpoints SET parent_checkpoint_id = NULL WHERE thread_id = ?", (thread_id,))
+            conn.execute(
+                "DELETE FROM checkpoint_writes WHERE thread_id = ? AND NOT (checkpoint_ns = '' AND checkpoint_id = ?)",
+                (thread_id, checkpoint_id),
+            )
+            kept = {(channel, str(version)) for channel, version in versions.items()}
+            blobs = conn.execute(
+                "SELECT checkpoint_ns, channel, version FROM checkpoint_blobs WHERE thread_id = ?", (thread_id,)
+            ).fetchall()
+            conn.executemany(
+                "DELETE FROM checkpoint_blobs "
+                "WHERE thread_id = ? AND checkpoint_ns = ? AND channel = ? AND version = ?",
+                [
+                    (thread_id, checkpoint_ns, channel, version)
+                    for checkpoint_ns, channel, version in blobs
+                    if checkpoint_ns != "" or (channel, version) not in kept
+                ],
+            )
+            conn.commit()
+
+    def get_next_version(self, current: str | None, channel: None) -> str:
+        """단조 증가하는 채널 버전 문자열을 생성합니다 (InMemorySaver와 같은 형식)."""
+        if current is None:
+            current_v = 0
+        elif isinstance(current, int):
+            current_v = current
+        else:
+            current_v = int(current.split(".")[0])
+        return f"{current_v + 1:032}.{random.random():016}"
+
+    # 비동기 메서드는 SQLite 호출이 이벤트 루프를 막지 않도록 동기 메서드를 스레드로 오프로딩
+    async def aget_tuple(self, config: RunnableConfig) -> CheckpointTuple | None:
+        return await asyncio.to_thread(self.get_tuple, config)
+
+    async def alist(
+        self,
+        config: RunnableConfig | None,
+        *,
+        filter: dict[str, Any] | None = None,
+        before: RunnableConfig | None = None,
+        limit: int | None = None,
+    ) -> AsyncIterator[CheckpointTuple]:
+        tuples = await asyncio.to_thread(lambda: list(self.list(config, filter=filter, before=before, limit=limit)))
+        for checkpoint_tuple in tuples:
+            yield checkpoint_tuple
+
+    async def aput(
+        self,
+        config: RunnableConfig,
+        checkpoint: Checkpoint,
+        metadata: CheckpointMetadata,
+        new_versions: ChannelVersions,
+    ) -> RunnableConfig:
+        return await asyncio.to_thread(self.put, config, checkpoint, metadata, new_versions)
+
+    async def aput_writes(
+        self,
+        config: RunnableConfig,
+        writes: Sequence[tuple[str, Any]],
+        task_id: str,
+        task_path: str = "",
+    ) -> None:
+        await asyncio.to_thread(self.put_writes, config, writes, task_id, task_path)
+
+    async def adelete_thread(self, thread_id: str) -> None:
+        await asyncio.to_thread(self.delete_thread, thread_id)
+
+
+class ToolJournal:
+    """실행 ID별로 (도구 이름, 인자) -> 결과 문자열을 기록하는 클래스입니다."""
+
+    def __init__(self, store: _SQLiteStore) -> None:
+        self.store = store
+
+    @staticmethod
+    def _arguments(arguments: dict[str, Any]) -> str:
+        return json.dumps(arguments, ensure_ascii=False, sort_keys=True, default=str)
+
+    def lookup(self, run_id: str, tool: str, arguments: dict[str, Any]) -> str | None:
+        """기록된 도구 결과를 조회합니다 (없으면 None)."""
+        with self.store.lock:
+            row = self.store.conn.execute(
+                "SELECT result FROM tool_journal WHERE run_id = ? AND tool = ? AND arguments = ?",
+                (run_id, tool, self._arguments(arguments)),
+            ).fetchone()
+        return row[0] if row is not None else None
+
+    def record(self, run_id: str, tool: str, arguments: dict[str, Any], result: str) -> None:
+        """도구 결과를 기록합니다."""
+        with self.store.lock:
+            self.store.conn.execute(
+                "INSERT OR REPLACE INTO tool_journal VALUES (?, ?, ?, ?, ?)",
+                (run_id, tool, self._arguments(arguments), result, time.time()),
+            )
+            self.store.conn.commit()
+
+    def delete_run(self, run_id: str) -> None:
+        """실행 ID의 도구 결과 기록을 삭제합니다."""
+        with self.store.lock:
+            self.store.conn.execute("DELETE FROM tool_journal WHERE run_id = ?", (run_id,))
+            self.store.conn.commit()
+
+
+class RunStore:
+    """실행 ID별 체크포인트, 도구 결과 기록, 실행 상태를 하나의 SQLite 파일로 관리하는 클래스입니다."""
+
+    def __init__(self, path: str | os.PathLike) -> None:
+        """
+        Args:
+            path: SQLite 파일 경로 (없으면 생성)
+        """
+        self._store = _SQLiteStore(path)
+        self.checkpointer = SQLiteCheckpointSaver(self._store)
+        self.journal = ToolJournal(self._store)
+
+    def get_run(self, run_id: str) -> dict | None:
+        """실행 상태({run_id, ticker, status, error, created_at, updated_at})를 조회합니다."""
+        with self._store.lock:
+            row = self._store.conn.execute(
+                "SELECT run_id, ticker, status, error, created_at, updated_at FROM runs WHERE run_id = ?", (run_id,)
+            ).fetchone()
+        if row is None:
+            return None
+        return dict(zip(("run_id", "ticker", "status", "error", "created_at", "updated_at"), row, strict=True))
+
+    def set_status(self, run_id: str, ticker: str, status: str, error: str | None = None) -> None:
+        """실행 상태를 기록합니다 ("running", "succeeded", "failed")."""
+        now = time.time()
+        with self._store.lock:
+            self._store.conn.execute(
+                "INSERT INTO runs VALUES (?, ?, ?, ?, ?, ?) "
+                "ON CONFLICT(run_id) DO UPDATE SET status = excluded.status, error = excluded.error, "
+                "updated_at = excluded.updated_at",
+                (run_id, ticker, status, error, now, now),
+            )
+            self._store.conn.commit()
+
+    def compact_run(self, run_id: str) -> None:
+        """성공한 실행의 실행 상태와 최종 상태만 남기고 중간 체크포인트와 도구 결과 기록을 삭제합니다."""
+        self.checkpointer.prune_thread(run_id)
+        self.journal.delete_run(run_id)
+
+    def delete_run(self, run_id: str) -> None:
+        """실행의 체크포인트, 도구 결과 기록, 상태를 모두 삭제합니다."""
+        self.checkpointer.delete_thread(run_id)
+        self.journal.delete_run(run_id)
+        with self._store.lock:
+            self._store.conn.execute("DELETE FROM runs WHERE run_id = ?", (run_id,))
+            self._store.conn.commit()
+
+    def close(self) -> None:
+        """SQLite 연결을 닫습니다."""
+        self._store.close()
+
+
+_run_store: RunStore | None = None
+_run_store_lock = threading.Lock()
+
+# 현재 컨텍스트에서 진행 중인 실행 ID (도구 결과 기록에 사용)
+_current_run_id: ContextVar[str | None] = ContextVar("current_run_id", default=None)
+
+
+def get_run_store() -> RunStore | None:
+    """설정에 따라 공유 실행 저장소를 반환합니다 (`checkpoint_enabled`가 꺼져 있으면 None)."""
+    global _run_store
+    if not settings.checkpoint_enabled:
+        return None
+    if _run_store is None:
+        with _run_store_lock:
+            if _run_store is None:
+                _run_store = RunStore(settings.checkpoint_path)
+    return _run_store
+
+
+def new_run_id(ticker: str) -> str:
+    """종목 심볼과 시각으로 새 실행 ID를 생성합니다 (예: "AAPL-20250101T093000-1a2b3c")."""
+    return f"{ticker.upper()}-{time.strftime('%Y%m%dT%H%M%S')}-{uuid.uuid4().hex[:6]}"
+
+
+@contextmanager
+def checkpointed_run(run_id: str) -> Iterator[None]:
+    """도구 결과를 실행 ID 단위로 기록/재사용하는 컨텍스트를 엽니다."""
+    token = _current_run_id.set(run_id)
+    try:
+        yield
+    finally:
+        _current_run_id.reset(token)
+
+
+def journal_lookup(tool: str, arguments: dict[str, Any]) -> str | None:
+    """진행 중인 실행에서 같은 도구/인자의 기록된 결과를 조회합니다 (없거나 기록 중이 아니면 None)."""
+    run_id = _current_run_id.get()
+    store = get_run_store() if run_id is not None else None
+    if store is None:
+        return None
+    return store.journal.lookup(run_id, tool, arguments)
+
+
+def journal_record(tool: str, arguments: dict[str, Any], result: str) -> None:
+    """진행 중인 실행이 있으면 도구 결과를 기록합니다."""
+    run_id = _current_run_id.get()
+    store = get_run_store() if run_id is not None else None
+    if store is not None:
+        store.journal.record(run_id, tool, arguments, result)
+
+
+def is_journaling() -> bool:
+    """현재 컨텍스트에서 도구 결과를 기록 중인지 여부를 반환합니다."""
+    return _current_run_id.get() is not None and settings.checkpoint_enabled
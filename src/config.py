@@ -1,6 +1,7 @@
 """애플리케이션 설정 및 환경 변수를 관리하는 모듈입니다."""
 
-from typing import Literal
+import threading
+from typing import Any, Literal
 
 from pydantic import Field
 from pydantic_settings import BaseSettings, SettingsConfigDict
@@ -27,14 +28,157 @@ class Settings(BaseSettings):
     temperature: float = Field(default=0.7, description="LLM 온도 값")
     max_tokens: int = Field(default=8000, description="최대 토큰 수")
 
+    # LLM 응답 캐시 설정 (같은 프롬프트 재실행 시 모델 호출 생략)
+    llm_cache_enabled: bool = Field(default=False, description="LLM 응답을 로컬 SQLite 파일에 캐시할지 여부")
+    llm_cache_path: str = Field(default=".cache/llm_cache.sqlite", description="LLM 응답 캐시 파일 경로")
+    llm_cache_max_entries: int = Field(default=5000, description="LLM 응답 캐시 최대 항목 수 (LRU)")
+    llm_cache_max_age: float | None = Field(default=604800.0, description="LLM 응답 캐시 유효 시간 (초, 비우면 무기한)")
+
     # Tavily API
     tavily_api_key: str = Field(description="Tavily API 키")
+    news_search_depth: Literal["basic", "advanced"] = Field(default="advanced", description="기본 뉴스 검색 깊이")
+
+    # 뉴스 검색 결과 캐시 설정
+    news_cache_ttl: float = Field(default=900.0, description="뉴스 검색 결과 캐시 유효 시간 (초)")
+    news_cache_max_entries: int = Field(default=256, description="뉴스 검색 결과 캐시 최대 항목 수 (LRU)")
+    news_cache_path: str | None = Field(default=None, description="뉴스 캐시 파일 경로 (설정 시 재시작 후에도 유지)")
+    news_cache_save_interval: float = Field(
+        default=5.0, description="뉴스 캐시 파일 저장 지연 시간 (초, 그동안의 변경을 한 번에 저장하고 종료 시에도 저장)"
+    )
+
+    # 뉴스 중복 제거 설정
+    news_dedup_enabled: bool = Field(default=True, description="거의 같은 뉴스 기사를 하나로 합칠지 여부")
+    news_dedup_max_distance: int = Field(default=12, description="같은 기사로 판단할 최대 SimHash 해밍 거리 (0-64)")
+
+    # 도구 출력 형식 설정
+    tool_output_format: Literal["verbose", "compact", "json"] = Field(
+        default="verbose", description="도구 출력 형식 (verbose: 사람용 장식 포함, compact: 간결한 텍스트, json)"
+    )
+    tool_token_budgets: dict[str, int] = Field(
+        default_factory=dict, description="compact/json 형식의 도구별 토큰 예산 (미지정 도구는 기본값 사용)"
+    )
 
     # Deep Agent 최대 반복 횟수 설정
     max_iterations: int = Field(default=3, description="최대 반복 횟수")
 
+    # 서브에이전트 병렬 위임 설정
+    parallel_subagents: bool = Field(default=False, description="세 분석 서브에이전트를 동시에 실행할지 여부")
+    subagent_timeout: float = Field(default=180.0, description="병렬 위임 시 서브에이전트 결과 대기 시간 (초)")
+    technical_fast_path: bool = Field(
+        default=False, description="기술적 분석을 LLM 없이 규칙 기반 템플릿으로 생성할지 여부 (실패 시 LLM 사용)"
+    )
+
+    # 배치(watchlist) 조사 설정
+    batch_workers: int = Field(default=4, description="배치 조사 시 동시에 실행할 최대 작업 수")
+    batch_output_dir: str = Field(default="reports", description="배치 조사 보고서 저장 디렉터리")
+
+    # 상주형 조사 서비스 설정
+    service_host: str = Field(default="127.0.0.1", description="조사 서비스 바인드 주소")
+    service_port: int = Field(default=8000, description="조사 서비스 포트")
+    service_workers: int = Field(default=2, description="조사 서비스에서 동시에 실행할 최대 작업 수")
+    service_queue_size: int = Field(default=32, description="조사 서비스 작업 대기열 최대 길이 (초과 시 503)")
+    service_max_jobs: int = Field(default=1000, description="보관할 최대 작업 수 (오래된 완료 작업부터 삭제)")
+    service_max_wait: float = Field(default=300.0, description="작업 조회 시 완료를 기다리는 최대 시간 (초)")
+
+    # 시장 데이터 캐시 설정
+    market_cache_max_entries: int = Field(default=1024, description="시장 데이터 캐시 최대 항목 수 (LRU)")
+    market_cache_info_ttl: float = Field(default=60.0, description="종목 정보(info) 캐시 유효 시간 (초)")
+    market_cache_history_ttl: float = Field(default=300.0, description="가격 이력(history) 캐시 유효 시간 (초)")
+    market_cache_intraday_ttl: float = Field(default=30.0, description="장중 분봉(intraday) 캐시 유효 시간 (초)")
+    market_cache_fundamentals_ttl: float = Field(
+        default=86400.0, description="스크리너용 재무 지표(PER, 부채비율, EPS) 캐시 유효 시간 (초)"
+    )
+    compact_cache_max_entries: int = Field(
+        default=20000, description="일괄 조회용 압축 가격 이력 캐시 최대 종목 수 (종목당 약 2KB, LRU)"
+    )
+
+    # 시장 데이터 공급자 설정
+    market_data_provider: str = Field(
+        default="yfinance", description='시장 데이터 공급자 ("yfinance", "local" 또는 "<모듈>:<클래스>")'
+    )
+    local_data_dir: str = Field(default="data/market", description="local 공급자가 읽을 CSV/Parquet/JSON 디렉터리")
+
+    # 업스트림 호출 스케줄러 설정 (속도 제한은 0이면 비활성화)
+    yfinance_rate_limit: float = Field(default=5.0, description="yfinance 초당 최대 요청 수")
+    yfinance_burst: int = Field(default=10, description="yfinance 순간 허용 요청 수")
+    tavily_rate_limit: float = Field(default=2.0, description="Tavily 초당 최대 요청 수")
+    tavily_burst: int = Field(default=5, description="Tavily 순간 허용 요청 수")
+    upstream_max_retries: int = Field(default=4, description="스로틀링(429 등) 오류 시 최대 재시도 횟수")
+    upstream_retry_base_delay: float = Field(default=1.0, description="첫 재시도 대기 시간 (초, 재시도마다 두 배)")
+    upstream_retry_max_delay: float = Field(default=30.0, description="재시도 대기 시간 상한 (초)")
+
+    # 로컬 OHLCV 저장소 설정
+    ohlcv_store_enabled: bool = Field(
+        default=False, description="일봉 이력을 로컬 디스크에 저장하고 증분 조회할지 여부"
+    )
+    ohlcv_store_dir: str = Field(
+        default=".cache/ohlcv",
+        description="일봉 OHLCV 저장 디렉터리 (공급자별 하위 디렉터리, 종목별 파일 잠금으로 워커 간 공유 가능)",
+    )
+
+    # 체크포인트(재개 가능한 실행) 설정
+    checkpoint_enabled: bool = Field(
+        default=False, description="실행 상태와 도구 결과를 저장하여 중단된 실행을 재개할지 여부"
+    )
+    checkpoint_path: str = Field(
+        default=".cache/checkpoints.sqlite", description="체크포인트/도구 결과 기록 SQLite 파일 경로"
+    )
+    checkpoint_keep_history: bool = Field(
+        default=False,
+        description="성공한 실행의 중간 체크포인트/도구 결과 기록을 유지할지 여부 (끄면 실행 상태와 최종 상태만 유지)",
+    )
+
+    # 보고서 저장소 설정 (증분 갱신)
+    report_store_enabled: bool = Field(default=False, description="조사 보고서를 섹션 지문과 함께 저장할지 여부")
+    report_store_path: str = Field(default=".cache/reports.sqlite", description="보고서 저장소 SQLite 파일 경로")
+
+    # 유니버스 스크리너 설정 (에이전트 조사 전 사전 선별)
+    screen_top_n: int = Field(default=10, description="스크리닝 후 에이전트 조사로 넘길 상위 종목 수")
+    screen_signals: list[str] = Field(default=["BUY"], description="통과시킬 기술적 시그널 (BUY/SELL/NEUTRAL)")
+    screen_max_pe: float | None = Field(default=40.0, description="최대 PER (None이면 필터 미적용)")
+    screen_max_debt_to_equity: float | None = Field(default=200.0, description="최대 부채비율 (%, None이면 미적용)")
+    screen_min_eps: float | None = Field(default=0.0, description="최소 EPS (None이면 필터 미적용)")
+
+    # 실행 추적(tracing) 설정
+    tracing_enabled: bool = Field(default=False, description="도구/서브에이전트/LLM 지연 시간과 토큰 사용량 기록 여부")
+    trace_dir: str | None = Field(default="traces", description="실행별 JSON trace와 집계 파일 저장 디렉터리")
+
     model_config = SettingsConfigDict(env_file=".env", case_sensitive=False, extra="ignore")
 
 
-# 싱글톤 인스턴스
-settings = Settings()
+class _LazySettings:
+    """처음 속성에 접근할 때 `Settings`를 생성하는 지연 로딩 프록시입니다.
+
+    import 시점에 환경 변수/.env 검증이 일어나지 않으므로 `--help`처럼 설정이 필요 없는 경로는
+    API 키 없이도 실행되며, 누락된 설정은 실제로 사용할 때 오류로 드러납니다.
+    """
+
+    def __init__(self) -> None:
+        object.__setattr__(self, "_instance", None)
+        object.__setattr__(self, "_lock", threading.Lock())
+
+    def _load(self) -> Settings:
+        instance = object.__getattribute__(self, "_instance")
+        if instance is None:
+            with object.__getattribute__(self, "_lock"):
+                instance = object.__getattribute__(self, "_instance")
+                if instance is None:
+                    instance = Settings()
+                    object.__setattr__(self, "_instance", instance)
+        return instance
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._load(), name)
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        setattr(self._load(), name, value)
+
+    def __delattr__(self, name: str) -> None:
+        delattr(self._load(), name)
+
+    def __repr__(self) -> str:
+        return repr(self._load())
+
+
+# 싱글톤 인스턴스 (처음 사용할 때 생성)
+settings: Settings = _LazySettings()  # type: ignore[assignment]
@@ -0,0 +1,54 @@
+"""시장 데이터 조회와 캐시 계층을 정의하는 모듈입니다."""
+
+from src.data.cache import CacheStats, MarketDataCache
+from src.data.compact import CompactHistory, Fundamentals, PriceMatrix, Quote
+from src.data.market import (
+    build_wide_frame,
+    get_cache_stats,
+    get_compact_cache,
+    get_compact_histories,
+    get_fundamentals,
+    get_intraday_bars,
+    get_market_cache,
+    get_price_histories,
+    get_price_history,
+    get_price_matrix,
+    get_ticker_info,
+)
+from src.data.providers import (
+    LocalFileProvider,
+    MarketDataProvider,
+    YFinanceProvider,
+    get_market_data_provider,
+    set_market_data_provider,
+)
+from src.data.scheduler import TokenBucket, UpstreamScheduler, get_upstream_scheduler, is_throttling_error
+
+__all__ = [
+    "CacheStats",
+    "MarketDataCache",
+    "get_market_cache",
+    "get_ticker_info",
+    "get_price_history",
+    "get_price_histories",
+    "get_intraday_bars",
+    "build_wide_frame",
+    "CompactHistory",
+    "PriceMatrix",
+    "Quote",
+    "Fundamentals",
+    "get_compact_cache",
+    "get_compact_histories",
+    "get_price_matrix",
+    "get_fundamentals",
+    "get_cache_stats",
+    "MarketDataProvider",
+    "YFinanceProvider",
+    "LocalFileProvider",
+    "get_market_data_provider",
+    "set_market_data_provider",
+    "TokenBucket",
+    "UpstreamScheduler",
+    "get_upstream_scheduler",
+    "is_throttling_error",
+]
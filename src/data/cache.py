@@ -0,0 +1,276 @@
+"""시장 데이터 캐시 계층을 정의하는 모듈입니다."""
+
+import json
+import os
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Callable, Hashable
+from dataclasses import dataclass
+from typing import Any
+
+from src.tracing import record_event
+
+CacheKey = tuple[str, str, tuple[Hashable, ...]]
+
+
+@dataclass
+class CacheStats:
+    """데이터 종류별 캐시 통계를 나타내는 클래스입니다."""
+
+    hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+    expirations: int = 0
+
+    @property
+    def hit_rate(self) -> float:
+        """전체 조회 중 캐시 적중 비율 (0-1)"""
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+    def to_dict(self) -> dict[str, float]:
+        """통계를 직렬화 가능한 딕셔너리로 변환합니다."""
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "expirations": self.expirations,
+            "hit_rate": round(self.hit_rate, 4),
+        }
+
+
+class MarketDataCache:
+    """(티커, 데이터 종류) 단위로 값을 보관하는 TTL + LRU 캐시입니다.
+
+    모든 도구가 하나의 프로세스 전역 인스턴스를 공유하여 동일 종목에 대한
+    중복 업스트림 호출을 줄입니다. 여러 스레드에서 동시에 사용해도 안전합니다.
+    """
+
+    def __init__(
+        self,
+        max_entries: int,
+        ttls: dict[str, float] | None = None,
+        default_ttl: float = 60.0,
+        clock: Callable[[], float] = time.time,
+    ) -> None:
+        """캐시를 초기화합니다.
+
+        Args:
+            max_entries: 보관할 최대 항목 수 (초과 시 가장 오래 사용되지 않은 항목부터 제거)
+            ttls: 데이터 종류별 유효 시간 (초)
+            default_ttl: ttls에 없는 데이터 종류의 기본 유효 시간 (초)
+            clock: 현재 시각(초)을 반환하는 함수
+        """
+        if max_entries <= 0:
+            raise ValueError("max_entries는 1 이상이어야 합니다.")
+
+        self.max_entries = max_entries
+        self.ttls = dict(ttls or {})
+        self.default_ttl = default_ttl
+        self._clock = clock
+        self._entries: OrderedDict[CacheKey, tuple[float, Any]] = OrderedDict()
+        self._stats: dict[str, CacheStats] = {}
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def make_key(ticker: str, kind: str, params: tuple[Hashable, ...] = ()) -> CacheKey:
+        """캐시 키를 생성합니다 (티커는 대문자로 정규화)."""
+        return (ticker.strip().upper(), kind, params)
+
+    def ttl_for(self, kind: str) -> float:
+        """데이터 종류별 유효 시간을 반환합니다."""
+        return self.ttls.get(kind, self.default_ttl)
+
+    def _stats_for(self, kind: str) -> CacheStats:
+        stats = self._stats.get(kind)
+        if stats is None:
+            stats = self._stats[kind] = CacheStats()
+        return stats
+
+    def get(self, ticker: str, kind: str, *params: Hashable) -> tuple[bool, Any]:
+        """캐시된 값을 조회합니다.
+
+        Args:
+            ticker: 주식 심볼
+            kind: 데이터 종류 (예: "info", "history")
+            *params: 같은 종류 안에서 값을 구분하는 추가 파라미터 (예: 조회 기간)
+
+        Returns:
+            tuple[bool, Any]: (적중 여부, 캐시된 값 또는 None)
+        """
+        key = self.make_key(ticker, kind, params)
+        with self._lock:
+            stats = self._stats_for(kind)
+            entry = self._entries.get(key)
+            if entry is None:
+                stats.misses += 1
+                record_event("cache_misses")
+                return False, None
+
+            expires_at, value = entry
+            if expires_at <= self._clock():
+                del self._entries[key]
+                stats.expirations += 1
+                stats.misses += 1
+                record_event("cache_misses")
+                return False, None
+
+            self._entries.move_to_end(key)
+            stats.hits += 1
+            record_event("cache_hits")
+            return True, value
+
+    def set(self, ticker: str, kind: str, value: Any, *params: Hashable, ttl: float | None = None) -> None:
+        """값을 캐시에 저장합니다.
+
+        Args:
+            ticker: 주식 심볼
+            kind: 데이터 종류
+            value: 저장할 값
+            *params: 같은 종류 안에서 값을 구분하는 추가 파라미터
+            ttl: 이 항목에만 적용할 유효 시간 (초, 기본값: 데이터 종류별 설정)
+        """
+        key = self.make_key(ticker, kind, params)
+        expires_at = self._clock() + (self.ttl_for(kind) if ttl is None else ttl)
+        with self._lock:
+            self._entries[key] = (expires_at, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                (_, evicted_kind, _), _ = self._entries.popitem(last=False)
+                self._stats_for(evicted_kind).evictions += 1
+
+    def get_or_fetch[T](
+        self,
+        ticker: str,
+        kind: str,
+        fetch: Callable[[], T],
+        *params: Hashable,
+        cache_if: Callable[[T], bool] | None = None,
+    ) -> T:
+        """캐시에 값이 있으면 반환하고, 없으면 fetch를 호출해 저장한 뒤 반환합니다.
+
+        Args:
+            ticker: 주식 심볼
+            kind: 데이터 종류
+            fetch: 캐시 미스 시 업스트림에서 값을 가져오는 함수
+            *params: 같은 종류 안에서 값을 구분하는 추가 파라미터
+            cache_if: 가져온 값을 캐시할지 판단하는 함수 (빈 응답 캐싱 방지용)
+
+        Returns:
+            캐시되었거나 새로 가져온 값
+        """
+        hit, value = self.get(ticker, kind, *params)
+        if hit:
+            return value
+
+        value = fetch()
+        if cache_if is None or cache_if(value):
+            self.set(ticker, kind, value, *params)
+        return value
+
+    def invalidate(self, ticker: str | None = None, kind: str | None = None) -> int:
+        """조건에 맞는 캐시 항목을 제거합니다.
+
+        Args:
+            ticker: 제거할 티커 (None이면 모든 티커)
+            kind: 제거할 데이터 종류 (None이면 모든 종류)
+
+        Returns:
+            int: 제거된 항목 수
+        """
+        normalized = ticker.strip().upper() if ticker else None
+        with self._lock:
+            keys = [
+                key
+                for key in self._entries
+                if (normalized is None or key[0] == normalized) and (kind is None or key[1] == kind)
+            ]
+            for key in keys:
+                del self._entries[key]
+            return len(keys)
+
+    def clear(self) -> None:
+        """모든 항목과 통계를 초기화합니다."""
+        with self._lock:
+            self._entries.clear()
+            self._stats.clear()
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._entries)
+
+    def save(self, path: str | os.PathLike) -> None:
+        """만료되지 않은 항목을 JSON 파일로 저장합니다 (값은 JSON 직렬화 가능해야 함).
+
+        임시 파일에 기록한 뒤 교체하므로 저장 중 중단되어도 기존 파일은 손상되지 않습니다.
+
+        Args:
+            path: 저장할 파일 경로
+        """
+        now = self._clock()
+        with self._lock:
+            records = [
+                {"ticker": ticker, "kind": kind, "params": list(params), "expires_at": expires_at, "value": value}
+                for (ticker, kind, params), (expires_at, value) in self._entries.items()
+                if expires_at > now
+            ]
+
+        tmp_path = f"{os.fspath(path)}.{os.getpid()}.{threading.get_ident()}.tmp"
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        try:
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump(records, f, ensure_ascii=False)
+            os.replace(tmp_path, path)
+        finally:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+
+    def load(self, path: str | os.PathLike) -> int:
+        """`save`로 저장한 파일에서 만료되지 않은 항목을 불러옵니다.
+
+        Args:
+            path: 불러올 파일 경로 (없으면 아무것도 하지 않음)
+
+        Returns:
+            int: 불러온 항목 수
+        """
+        if not os.path.exists(path):
+            return 0
+
+        try:
+            with open(path, encoding="utf-8") as f:
+                records = json.load(f)
+        except (OSError, ValueError):
+            return 0
+
+        now = self._clock()
+        loaded = 0
+        with self._lock:
+            for record in records:
+                if record["expires_at"] <= now:
+                    continue
+                key = self.make_key(record["ticker"], record["kind"], tuple(record["params"]))
+                self._entries[key] = (record["expires_at"], record["value"])
+                loaded += 1
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+        return loaded
+
+    def stats(self) -> dict[str, dict[str, float]]:
+        """데이터 종류별 통계와 전체 합계를 반환합니다.
+
+        Returns:
+            dict[str, dict[str, float]]: {"info": {...}, "history": {...}, "total": {...}}
+        """
+        with self._lock:
+            result = {kind: stats.to_dict() for kind, stats in self._stats.items()}
+            total = CacheStats(
+                hits=sum(s.hits for s in self._stats.values()),
+                misses=sum(s.misses for s in self._stats.values()),
+                evictions=sum(s.evictions for s in self._stats.values()),
+                expirations=sum(s.expirations for s in self._stats.values()),
+            )
+            result["total"] = total.to_dict()
+            result["total"]["size"] = len(self._entries)
+            return result
@@ -0,0 +1,256 @@
+"""대규모 종목 유니버스를 메모리에 상주시키기 위한 압축 가격 이력과 경량 레코드를 정의하는 모듈입니다.
+
+일괄(유니버스) 경로는 yfinance DataFrame 전체(OHLCV + 배당/분할, float64, pandas 오버헤드) 대신
+다음 표현을 사용하고, pydantic 모델(`StockPrice`, `FinancialData`)은 도구 경계에서만 생성합니다.
+
+- `CompactHistory`: 종목 하나의 종가/거래량 float32 배열 + 날짜 인덱스 (같은 거래일 배열은 종목 간 공유)
+  + 시세용 마지막 두 종가/마지막 거래량 원래 정밀도 값 (float32는 2^24 이상 거래량과 고가 종목 센트 단위가 부정확)
+- `PriceMatrix`: 여러 종목을 (날짜 x 종목) float32 배열로 정렬한 행렬 (종목별 지표는 자기 거래일 봉만으로 계산)
+- `Quote`, `Fundamentals`: `__slots__` 기반 시세/재무 레코드 (`to_model()`로 pydantic 모델 변환)
+"""
+
+import hashlib
+import threading
+import weakref
+from dataclasses import dataclass
+
+import numpy as np
+import pandas as pd
+
+from src.models.stock import FinancialData, StockPrice
+
+
+class _DateIndexPool:
+    """내용이 같은 날짜 배열을 하나로 공유하는 풀입니다 (사용하는 종목이 없어지면 자동 해제)."""
+
+    def __init__(self) -> None:
+        self._arrays: weakref.WeakValueDictionary[bytes, np.ndarray] = weakref.WeakValueDictionary()
+        self._lock = threading.Lock()
+
+    def intern(self, dates: np.ndarray) -> np.ndarray:
+        """같은 내용의 공유 배열을 반환합니다 (처음 보는 배열이면 읽기 전용으로 등록)."""
+        key = hashlib.blake2b(dates.tobytes(), digest_size=16).digest()
+        with self._lock:
+            shared = self._arrays.get(key)
+            if shared is None:
+                shared = np.array(dates, dtype="datetime64[D]")
+                shared.flags.writeable = False
+                self._arrays[key] = shared
+            return shared
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._arrays)
+
+
+# 프로세스 전역 날짜 인덱스 풀 (같은 거래소 종목은 거래일 배열 하나를 공유)
+date_index_pool = _DateIndexPool()
+
+
+def _to_dates(index: pd.Index) -> np.ndarray:
+    """가격 이력 인덱스를 타임존 없는 일 단위 날짜 배열로 변환합니다."""
+    index = pd.DatetimeIndex(index)
+    if index.tz is not None:
+        index = index.tz_localize(None)
+    return index.normalize().to_numpy(dtype="datetime64[D]")
+
+
+@dataclass(slots=True, frozen=True)
+class CompactHistory:
+    """종목 하나의 일봉 종가/거래량을 float32 배열로 보관하는 압축 가격 이력입니다.
+
+    배열은 지표 계산용이며, 시세(`Quote`)는 float64/int로 따로 보관한 마지막 두 종가와 마지막 거래량으로 만듭니다.
+    """
+
+    dates: np.ndarray  # datetime64[D], 종목 간 공유되는 읽기 전용 배열
+    close: np.ndarray  # float32
+    volume: np.ndarray  # float32
+    last_close: float = np.nan  # 마지막 종가 (float64)
+    previous_close: float = np.nan  # 직전 거래일 종가 (float64)
+    last_volume: int = 0  # 마지막 봉 거래량
+
+    @classmethod
+    def from_frame(cls, frame: pd.DataFrame) -> "CompactHistory":
+        """yfinance 형식 가격 이력 DataFrame에서 종가/거래량만 압축하여 생성합니다."""
+        frame = frame[~frame.index.duplicated(keep="last")].sort_index()
+        close = frame["Close"].to_numpy(dtype=np.float32) if "Close" in frame else np.full(len(frame), np.nan, "f4")
+        volume = frame["Volume"].to_numpy(dtype=np.float32) if "Volume" in frame else np.zeros(len(frame), "f4")
+
+        # 시세용 값은 float32로 줄이기 전 원래 정밀도로 보관 (종가가 있는 자기 봉 기준)
+        bars = frame[frame["Close"].notna()] if "Close" in frame else frame.iloc[:0]
+        closes = bars["Close"].to_numpy(dtype=np.float64) if len(bars) else np.array([])
+        last_volume = bars["Volume"].iloc[-1] if len(bars) and "Volume" in bars else 0
+        return cls(
+            dates=date_index_pool.intern(_to_dates(frame.index)),
+            close=close,
+            volume=volume,
+            last_close=float(closes[-1]) if len(closes) else np.nan,
+            previous_close=float(closes[-2]) if len(closes) > 1 else np.nan,
+            last_volume=0 if pd.isna(last_volume) else int(last_volume),
+        )
+
+    def __len__(self) -> int:
+        return len(self.close)
+
+    @property
+    def nbytes(self) -> int:
+        """종목 고유 배열의 바이트 수 (공유 날짜 인덱스 제외)"""
+        return self.close.nbytes + self.volume.nbytes
+
+
+@dataclass(slots=True, frozen=True)
+class PriceMatrix:
+    """여러 종목의 종가/거래량을 (날짜 x 종목) float32 배열로 정렬한 행렬입니다.
+
+    종목에 봉이 없는 날짜(상장 전, 거래 정지, 다른 거래소 휴장일)는 NaN으로 남기며 직전 값으로 채우지 않습니다
+    (`build_wide_frame`과 동일). 종목별 최신 값과 지표는 `packed()`로 각 종목 자신의 봉만 모아 계산합니다.
+    """
+
+    dates: np.ndarray  # datetime64[D]
+    symbols: tuple[str, ...]
+    close: np.ndarray  # float32 (날짜 x 종목)
+    volume: np.ndarray  # float32 (날짜 x 종목)
+    last_close: np.ndarray  # float64 (종목), 시세용 원래 정밀도 값
+    previous_close: np.ndarray  # float64 (종목)
+    last_volume: np.ndarray  # int64 (종목)
+    last_dates: np.ndarray  # datetime64[D] (종목), 종가가 있는 마지막 봉의 날짜 (없으면 NaT)
+
+    @classmethod
+    def from_histories(cls, histories: dict[str, CompactHistory]) -> "PriceMatrix":
+        """종목별 압축 이력을 합집합 날짜 인덱스에 맞춰 정렬합니다."""
+        symbols = tuple(histories)
+        # 공유된 날짜 배열은 한 번만 합침
+        unique_indexes = {id(history.dates): history.dates for history in histories.values()}
+        dates = np.unique(np.concatenate(list(unique_indexes.values()))) if unique_indexes else np.array([], "M8[D]")
+
+        close = np.full((len(dates), len(symbols)), np.nan, dtype=np.float32)
+        volume = np.full((len(dates), len(symbols)), np.nan, dtype=np.float32)
+        for column, history in enumerate(histories.values()):
+            rows = np.searchsorted(dates, history.dates)
+            close[rows, column] = history.close
+            volume[rows, column] = history.volume
+        return cls(
+            dates=dates,
+            symbols=symbols,
+            close=close,
+            volume=volume,
+            last_close=np.array([history.last_close for history in histories.values()], dtype=np.float64),
+            previous_close=np.array([history.previous_close for history in histories.values()], dtype=np.float64),
+            last_volume=np.array([history.last_volume for history in histories.values()], dtype=np.int64),
+            last_dates=np.array([_last_valid_date(history) for history in histories.values()], dtype="M8[D]"),
+        )
+
+    def __len__(self) -> int:
+        return len(self.dates)
+
+    @property
+    def nbytes(self) -> int:
+        """행렬 전체의 바이트 수"""
+        return (
+            self.dates.nbytes
+            + self.close.nbytes
+            + self.volume.nbytes
+            + self.last_close.nbytes
+            + self.previous_close.nbytes
+            + self.last_volume.nbytes
+            + self.last_dates.nbytes
+        )
+
+    def packed(self) -> tuple[np.ndarray, np.ndarray]:
+        """종목마다 종가가 있는 봉만 모아 아래쪽(최신)으로 정렬한 (종가, 거래량) 배열을 반환합니다.
+
+        각 열의 마지막 행은 그 종목의 마지막 봉, 그 앞 행은 그 종목의 직전 거래일 봉이며 남는 위쪽은 NaN입니다.
+        거래일이 다른 종목이 섞여 있어도 이동평균/RSI가 종목 자신의 거래일 기준으로 계산됩니다.
+        """
+        order = np.argsort(~np.isnan(self.close), axis=0, kind="stable")
+        return np.take_along_axis(self.close, order, axis=0), np.take_along_axis(self.volume, order, axis=0)
+
+    def latest_quotes(self) -> "dict[str, Quote]":
+        """종목별 자신의 마지막 두 봉으로 시세 레코드를 만듭니다 (`get_stock_prices`와 같은 규칙).
+
+        float32 행렬이 아니라 원래 정밀도로 보관한 종가/거래량을 사용합니다.
+        """
+        if len(self) < 2:
+            return {}
+        quotes = {}
+        for column, symbol in enumerate(self.symbols):
+            current, previous = self.last_close[column], self.previous_close[column]
+            if np.isnan(current):
+                continue
+            quotes[symbol] = Quote(
+                symbol,
+                float(current),
+                0.0 if np.isnan(previous) else float(previous),
+                int(self.last_volume[column]),
+            )
+        return quotes
+
+
+def _last_valid_date(history: CompactHistory) -> np.datetime64:
+    """종가가 있는 마지막 봉의 날짜를 반환합니다 (없으면 NaT)."""
+    valid = np.flatnonzero(~np.isnan(history.close))
+    return history.dates[valid[-1]] if len(valid) else np.datetime64("NaT", "D")
+
+
+@dataclass(slots=True, frozen=True)
+class Quote:
+    """일괄 경로에서 사용하는 경량 시세 레코드입니다."""
+
+    symbol: str
+    current_price: float
+    previous_close: float
+    volume: int
+    market_cap: float | None = None
+
+    @property
+    def change_percent(self) -> float:
+        """전일 대비 등락률 (%)"""
+        if self.previous_close > 0:
+            return (self.current_price - self.previous_close) / self.previous_close * 100
+        return 0.0
+
+    def to_model(self) -> StockPrice:
+        """도구 경계에서 사용할 `StockPrice` 모델로 변환합니다."""
+        return StockPrice(
+            symbol=self.symbol,
+            current_price=round(self.current_price, 2),
+            previous_close=round(self.previous_close, 2),
+            change_percent=round(self.change_percent, 2),
+            volume=self.volume,
+            market_cap=self.market_cap,
+        )
+
+
+@dataclass(slots=True, frozen=True)
+class Fundamentals:
+    """일괄 경로에서 사용하는 경량 재무 레코드입니다."""
+
+    symbol: str
+    revenue: float | None = None
+    net_income: float | None = None
+    eps: float | None = None
+    pe_ratio: float | None = None
+    debt_to_equity: float | None = None
+
+    @classmethod
+    def from_info(cls, symbol: str, info: dict) -> "Fundamentals":
+        """yfinance 형식 info 딕셔너리에서 재무 지표만 꺼내 생성합니다 (`get_financial_data`와 같은 필드)."""
+        return cls(
+            symbol=symbol.upper(),
+            revenue=info.get("totalRevenue"),
+            net_income=info.get("netIncomeToCommon"),
+            eps=info.get("trailingEps"),
+            pe_ratio=info.get("trailingPE"),
+            debt_to_equity=info.get("debtToEquity"),
+        )
+
+    def to_model(self) -> FinancialData:
+        """도구 경계에서 사용할 `FinancialData` 모델로 변환합니다."""
+        return FinancialData(
+            symbol=self.symbol,
+            revenue=self.revenue,
+            net_income=self.net_income,
+            eps=self.eps,
+            pe_ratio=self.pe_ratio,
+            debt_to_equity=self.debt_to_equity,
+        )
@@ -0,0 +1,361 @@
+"""공유 캐시를 거쳐 시장 데이터를 조회하는 모듈입니다.
+
+모든 도구는 업스트림을 직접 호출하지 않고 이 모듈의 함수를 사용하며,
+캐시 미스에서만 설정된 `MarketDataProvider`(기본값: yfinance)를 호출합니다.
+"""
+
+import threading
+from pathlib import Path
+
+import pandas as pd
+
+from src.config import settings
+from src.data.cache import MarketDataCache
+from src.data.compact import CompactHistory, Fundamentals, PriceMatrix
+from src.data.providers import get_market_data_provider
+from src.data.store import OHLCVStore, period_start
+
+# 프로세스 전역 시장 데이터 캐시와 일괄(유니버스) 경로용 압축 캐시 (처음 사용할 때 설정으로 생성)
+_market_cache: MarketDataCache | None = None
+_compact_cache: MarketDataCache | None = None
+_cache_lock = threading.Lock()
+
+
+def get_market_cache() -> MarketDataCache:
+    """프로세스 전역 시장 데이터 캐시를 반환합니다 (싱글톤, import 시점에는 설정을 읽지 않음)."""
+    global _market_cache
+    if _market_cache is None:
+        with _cache_lock:
+            if _market_cache is None:
+                _market_cache = MarketDataCache(
+                    max_entries=settings.market_cache_max_entries,
+                    ttls={
+                        "info": settings.market_cache_info_ttl,
+                        "history": settings.market_cache_history_ttl,
+                        "intraday": settings.market_cache_intraday_ttl,
+                    },
+                )
+    return _market_cache
+
+
+def get_compact_cache() -> MarketDataCache:
+    """일괄 경로용 압축 캐시를 반환합니다 (DataFrame 대신 float32 종가/거래량과 경량 재무 레코드만 보관)."""
+    global _compact_cache
+    if _compact_cache is None:
+        with _cache_lock:
+            if _compact_cache is None:
+                _compact_cache = MarketDataCache(
+                    max_entries=settings.compact_cache_max_entries,
+                    ttls={
+                        "compact": settings.market_cache_history_ttl,
+                        "fundamentals": settings.market_cache_fundamentals_ttl,
+                    },
+                )
+    return _compact_cache
+
+
+# 공급자별 로컬 OHLCV 저장소 (저장소 하위 디렉터리 이름 -> 저장소, 처음 사용할 때 생성)
+_ohlcv_stores: dict[str, OHLCVStore] = {}
+
+
+def get_ohlcv_store() -> OHLCVStore | None:
+    """설정에 따라 현재 공급자의 로컬 OHLCV 저장소를 반환합니다 (비활성화 시 None).
+
+    저장소 디렉터리는 공급자별로 나뉘므로(`<ohlcv_store_dir>/<공급자>`) 공급자를 바꿔도
+    다른 공급자가 저장한 봉에 증분 조회 결과를 이어 붙이지 않습니다.
+    """
+    if not settings.ohlcv_store_enabled:
+        return None
+    namespace = get_market_data_provider().store_namespace
+    store = _ohlcv_stores.get(namespace)
+    if store is None:
+        store = _ohlcv_stores.setdefault(namespace, OHLCVStore(Path(settings.ohlcv_store_dir) / namespace))
+    return store
+
+
+def _provider_key() -> str:
+    """캐시 키에 포함할 현재 공급자 이름을 반환합니다.
+
+    공급자를 바꾸면(`set_market_data_provider`) 이전 공급자가 받은 값이 캐시 히트로 반환되지 않도록
+    모든 캐시 항목을 공급자별로 구분합니다.
+    """
+    return get_market_data_provider().store_namespace
+
+
+def get_ticker_info(ticker: str) -> dict:
+    """종목 정보(yfinance 형식 info 딕셔너리)를 캐시를 거쳐 조회합니다.
+
+    Args:
+        ticker: 주식 심볼 (예: "AAPL", "TSLA")
+
+    Returns:
+        dict: yfinance info 딕셔너리 (데이터가 없으면 빈 딕셔너리)
+    """
+    return get_market_cache().get_or_fetch(
+        ticker,
+        "info",
+        lambda: get_market_data_provider().get_info(ticker),
+        _provider_key(),
+        cache_if=bool,
+    )
+
+
+def get_fundamentals(ticker: str) -> Fundamentals:
+    """종목의 재무 지표 레코드를 압축 캐시를 거쳐 조회합니다.
+
+    재무 지표는 분기마다 바뀌므로 현재가가 포함된 종목 정보(info)보다 훨씬 긴 유효 시간
+    (`MARKET_CACHE_FUNDAMENTALS_TTL`)으로 보관합니다. 유니버스 스크리닝처럼 수백 종목을 반복 조회하는 경로용입니다.
+
+    Args:
+        ticker: 주식 심볼 (예: "AAPL", "TSLA")
+
+    Returns:
+        Fundamentals: 매출액, 순이익, EPS, PER, 부채비율 레코드 (데이터가 없는 필드는 None)
+    """
+    symbol = ticker.strip().upper()
+    return get_compact_cache().get_or_fetch(
+        symbol,
+        "fundamentals",
+        lambda: Fundamentals.from_info(symbol, get_ticker_info(symbol)),
+        _provider_key(),
+        cache_if=lambda record: record != Fundamentals(symbol),
+    )
+
+
+def get_price_history(ticker: str, period: str = "1y", interval: str = "1d") -> pd.DataFrame:
+    """OHLCV 가격 이력을 캐시를 거쳐 조회합니다.
+
+    일봉은 로컬 OHLCV 저장소를 먼저 읽고, 마지막 저장 봉 이후만 업스트림에서 받아 추가합니다.
+    반환되는 DataFrame은 여러 도구가 공유하므로 호출자는 수정하지 않아야 합니다.
+
+    Args:
+        ticker: 주식 심볼 (예: "AAPL", "TSLA")
+        period: 조회 기간 (기본값: "1y")
+        interval: 봉 간격 (기본값: "1d")
+
+    Returns:
+        pd.DataFrame: OHLCV 가격 이력 (데이터가 없으면 빈 DataFrame)
+    """
+    return get_market_cache().get_or_fetch(
+        ticker,
+        "history",
+        lambda: _fetch_history(ticker, period, interval),
+        _provider_key(),
+        period,
+        interval,
+        cache_if=lambda frame: not frame.empty,
+    )
+
+
+def get_intraday_bars(ticker: str, period: str = "1d", interval: str = "1m") -> pd.DataFrame:
+    """장중 분봉을 캐시를 거쳐 조회합니다.
+
+    일봉보다 짧은 유효 시간("intraday")을 사용하며 로컬 저장소는 거치지 않습니다.
+
+    Args:
+        ticker: 주식 심볼 (예: "AAPL", "TSLA")
+        period: 조회 기간 (기본값: "1d", 1분봉은 최대 7일)
+        interval: 봉 간격 (기본값: "1m")
+
+    Returns:
+        pd.DataFrame: 시간 오름차순 분봉 (데이터가 없으면 빈 DataFrame)
+    """
+    return get_market_cache().get_or_fetch(
+        ticker,
+        "intraday",
+        lambda: get_market_data_provider().get_history(ticker, period=period, interval=interval),
+        _provider_key(),
+        period,
+        interval,
+        cache_if=lambda frame: not frame.empty,
+    )
+
+
+def _fetch_history(ticker: str, period: str, interval: str) -> pd.DataFrame:
+    """캐시 미스 시 저장소 또는 공급자에서 가격 이력을 가져옵니다."""
+    provider = get_market_data_provider()
+    store = get_ohlcv_store()
+    if store is None or interval != "1d":
+        return provider.get_history(ticker, period=period, interval=interval)
+
+    def fetch(period: str | None, start: str | None) -> pd.DataFrame:
+        return provider.get_history(ticker, period=period, start=start, interval=interval)
+
+    return store.load_history(ticker, period, fetch)
+
+
+def _download(symbols: list[str], **kwargs) -> dict[str, pd.DataFrame]:
+    """공급자의 일괄 조회로 여러 종목을 받아 종목별 DataFrame으로 반환합니다."""
+    if not symbols:
+        return {}
+    return get_market_data_provider().get_histories(symbols, **kwargs)
+
+
+def _download_with_store(store: OHLCVStore, symbols: list[str], period: str) -> dict[str, pd.DataFrame]:
+    """저장소에 있는 종목은 증분만, 없는 종목은 전체 기간을 일괄 요청으로 받습니다.
+
+    증분 요청은 시작일이 같은 종목끼리 묶어 보내므로, 오래 갱신되지 않은 종목 하나 때문에
+    나머지 종목까지 긴 기간을 다시 받지 않습니다. 수정 주가가 바뀐 종목(`matches_stored` 불일치)은
+    저장된 이력을 버리고 콜드 종목과 함께 전체 기간을 받습니다.
+    """
+    cold: list[str] = []
+    warm: dict[str, list[str]] = {}
+    for symbol in symbols:
+        start = store.incremental_start(symbol, period)
+        if start is None:
+            cold.append(symbol)
+        else:
+            warm.setdefault(start, []).append(symbol)
+
+    histories: dict[str, pd.DataFrame] = {}
+    for start, group in warm.items():
+        fresh = _download(group, start=start, interval="1d")
+        for symbol in group:
+            frame = fresh.get(symbol, pd.DataFrame())
+            if store.matches_stored(symbol, frame):
+                histories[symbol] = store.save_fetched(symbol, period, frame, incremental=True)
+            else:
+                store.invalidate(symbol)
+                cold.append(symbol)
+
+    for symbol, frame in _download(cold, period=period, interval="1d").items():
+        histories[symbol] = store.save_fetched(symbol, period, frame, incremental=False)
+
+    return {symbol: histories[symbol] for symbol in symbols if symbol in histories and not histories[symbol].empty}
+
+
+def get_price_histories(tickers: list[str], period: str = "1y", interval: str = "1d") -> dict[str, pd.DataFrame]:
+    """여러 종목의 OHLCV 가격 이력을 한 번의 일괄 요청으로 조회합니다.
+
+    캐시에 있는 종목은 재사용하고, 나머지는 공급자의 일괄 요청(yfinance는 `yf.download`)으로 받아
+    종목별로 분리한 뒤 캐시에 저장합니다. 로컬 저장소가 켜져 있으면 저장된 종목은
+    마지막 저장 봉 이후만 받습니다. 이후 단일 종목 도구도 같은 데이터를 재사용합니다.
+
+    Args:
+        tickers: 주식 심볼 리스트
+        period: 조회 기간 (기본값: "1y")
+        interval: 봉 간격 (기본값: "1d")
+
+    Returns:
+        dict[str, pd.DataFrame]: 대문자 티커별 가격 이력 (데이터가 없는 종목은 제외)
+    """
+    symbols = list(dict.fromkeys(ticker.strip().upper() for ticker in tickers if ticker.strip()))
+    provider_key = _provider_key()
+    histories: dict[str, pd.DataFrame] = {}
+    missing: list[str] = []
+
+    for symbol in symbols:
+        hit, frame = get_market_cache().get(symbol, "history", provider_key, period, interval)
+        if hit:
+            histories[symbol] = frame
+        else:
+            missing.append(symbol)
+
+    if missing:
+        store = get_ohlcv_store()
+        if store is not None and interval == "1d" and period_start(period) is not None:
+            fetched = _download_with_store(store, missing, period)
+        else:
+            fetched = _download(missing, period=period, interval=interval)
+
+        for symbol, frame in fetched.items():
+            get_market_cache().set(symbol, "history", frame, provider_key, period, interval)
+            histories[symbol] = frame
+
+    return {symbol: histories[symbol] for symbol in symbols if symbol in histories}
+
+
+def get_compact_histories(tickers: list[str], period: str = "1y") -> dict[str, CompactHistory]:
+    """여러 종목의 일봉 종가/거래량을 압축 형식으로 조회합니다.
+
+    `get_price_histories`와 같은 일괄 요청/로컬 저장소 경로를 사용하지만, 캐시 미스로 받은 DataFrame은
+    압축 이력으로 바꾼 뒤 버리고 압축 캐시에만 보관하므로 수천 종목을 메모리에 유지할 수 있습니다.
+    시장 데이터 캐시에 이미 있는 DataFrame은 다시 받지 않고 변환합니다.
+
+    Args:
+        tickers: 주식 심볼 리스트
+        period: 조회 기간 (기본값: "1y")
+
+    Returns:
+        dict[str, CompactHistory]: 대문자 티커별 압축 이력 (데이터가 없는 종목은 제외)
+    """
+    symbols = list(dict.fromkeys(ticker.strip().upper() for ticker in tickers if ticker.strip()))
+    provider_key = _provider_key()
+    histories: dict[str, CompactHistory] = {}
+    missing: list[str] = []
+
+    for symbol in symbols:
+        hit, history = get_compact_cache().get(symbol, "compact", provider_key, period)
+        if not hit:
+            frame_hit, frame = get_market_cache().get(symbol, "history", provider_key, period, "1d")
+            history = CompactHistory.from_frame(frame) if frame_hit else None
+            if history is not None:
+                get_compact_cache().set(symbol, "compact", history, provider_key, period)
+        if history is not None:
+            histories[symbol] = history
+        else:
+            missing.append(symbol)
+
+    if missing:
+        store = get_ohlcv_store()
+        if store is not None and period_start(period) is not None:
+            fetched = _download_with_store(store, missing, period)
+        else:
+            fetched = _download(missing, period=period, interval="1d")
+
+        for symbol, frame in fetched.items():
+            history = CompactHistory.from_frame(frame)
+            get_compact_cache().set(symbol, "compact", history, provider_key, period)
+            histories[symbol] = history
+
+    return {symbol: histories[symbol] for symbol in symbols if symbol in histories}
+
+
+def get_price_matrix(tickers: list[str], period: str = "1y") -> PriceMatrix:
+    """여러 종목의 종가/거래량을 (날짜 x 종목) float32 행렬로 조회합니다.
+
+    Args:
+        tickers: 주식 심볼 리스트
+        period: 조회 기간 (기본값: "1y")
+
+    Returns:
+        PriceMatrix: 데이터가 있는 종목만 요청 순서대로 담은 행렬
+    """
+    return PriceMatrix.from_histories(get_compact_histories(tickers, period))
+
+
+def build_wide_frame(histories: dict[str, pd.DataFrame], column: str = "Close") -> pd.DataFrame:
+    """종목별 가격 이력에서 한 컬럼을 뽑아 (날짜 x 종목) 형태의 넓은 DataFrame으로 정렬합니다.
+
+    종목에 봉이 없는 날짜(상장 전, 거래 정지, 다른 거래소 휴장일)는 직전 값으로 채우지 않고 NaN으로 남깁니다.
+    채우면 멈춘 종목이 최신 가격처럼 보이고, 거래일이 다른 종목의 "직전 봉"이 자기 직전 거래일이 아니게 됩니다.
+
+    Args:
+        histories: 티커별 가격 이력
+        column: 사용할 컬럼 이름 (기본값: "Close")
+
+    Returns:
+        pd.DataFrame: 날짜 인덱스, 티커 컬럼의 넓은 DataFrame
+    """
+    columns = {}
+    for symbol, frame in histories.items():
+        series = frame[column]
+        # 단일 종목 조회(타임존 포함)와 일괄 조회(타임존 없음) 인덱스를 맞춤
+        if getattr(series.index, "tz", None) is not None:
+            series = series.tz_localize(None)
+        columns[symbol] = series
+
+    if not columns:
+        return pd.DataFrame()
+
+    return pd.DataFrame(columns).sort_index()
+
+
+def get_cache_stats() -> dict[str, dict[str, float]]:
+    """시장 데이터 캐시의 적중/미스 통계를 반환합니다 (압축 캐시는 "compact", "fundamentals" 항목)."""
+    stats = get_market_cache().stats()
+    compact = get_compact_cache().stats()
+    for kind in ("compact", "fundamentals"):
+        if kind in compact:
+            stats[kind] = compact[kind]
+    return stats
@@ -0,0 +1,290 @@
+"""시장 데이터 업스트림(공급자)을 교체할 수 있도록 추상화한 모듈입니다.
+
+`src.data.market`은 캐시와 로컬 OHLCV 저장소를 거친 뒤 캐시 미스에서만 공급자를 호출합니다.
+공급자는 `Settings.market_data_provider`로 선택합니다.
+
+- `"yfinance"`: yfinance API (기본값)
+- `"local"`: `Settings.local_data_dir`의 CSV/Parquet/JSON 파일
+- `"<모듈>:<클래스>"`: `MarketDataProvider`를 구현한 사내 피드 등 임의의 클래스
+"""
+
+import importlib
+import json
+import re
+import threading
+from abc import ABC, abstractmethod
+from collections.abc import Callable
+from pathlib import Path
+from typing import Any
+
+import pandas as pd
+
+from src.config import settings
+from src.data.scheduler import get_upstream_scheduler
+from src.data.store import period_start
+from src.tracing import record_event
+
+_EMPTY_COLUMNS = ["Open", "High", "Low", "Close", "Volume"]
+
+
+def _yfinance():
+    """yfinance 모듈을 처음 사용할 때 불러옵니다 (다른 공급자를 쓰면 import하지 않음)."""
+    import yfinance
+
+    return yfinance
+
+
+class MarketDataProvider(ABC):
+    """시장 데이터 공급자 인터페이스입니다.
+
+    시세와 재무 지표는 모두 `get_info`의 yfinance 형식 info 딕셔너리
+    (`currentPrice`, `marketCap`, `trailingPE` 등)로 제공하고, 가격 이력은 yfinance와 같은
+    컬럼(Open, High, Low, Close, Volume)과 날짜 인덱스의 DataFrame으로 제공합니다.
+    """
+
+    name: str = "custom"
+
+    @property
+    def store_namespace(self) -> str:
+        """로컬 OHLCV 저장소에서 이 공급자의 봉을 보관할 하위 디렉터리 이름입니다.
+
+        공급자마다 수정 주가 기준과 거래일이 다를 수 있으므로 공급자별로 저장소를 나눕니다.
+        `name`을 지정하지 않은 공급자는 `<모듈>.<클래스>` 경로를 사용합니다.
+        """
+        name = self.name
+        if name == MarketDataProvider.name:
+            name = f"{type(self).__module__}.{type(self).__qualname__}"
+        return re.sub(r"[^A-Za-z0-9._-]", "_", name)
+
+    @abstractmethod
+    def get_info(self, ticker: str) -> dict:
+        """종목 정보(시세/재무 지표) 딕셔너리를 반환합니다 (없으면 빈 딕셔너리)."""
+
+    @abstractmethod
+    def get_history(
+        self, ticker: str, period: str | None = None, start: str | None = None, interval: str = "1d"
+    ) -> pd.DataFrame:
+        """가격 이력을 반환합니다 (없으면 빈 DataFrame).
+
+        Args:
+            ticker: 주식 심볼
+            period: 조회 기간 (예: "1y", `start`와 함께 쓰지 않음)
+            start: 조회 시작일 ("YYYY-MM-DD", 증분 조회용)
+            interval: 봉 간격 (기본값: "1d")
+        """
+
+    def get_infos(self, tickers: list[str]) -> dict[str, dict]:
+        """여러 종목의 정보를 반환합니다 (기본 구현은 종목별 `get_info` 호출)."""
+        return {ticker: self.get_info(ticker) for ticker in tickers}
+
+    def get_histories(
+        self, tickers: list[str], period: str | None = None, start: str | None = None, interval: str = "1d"
+    ) -> dict[str, pd.DataFrame]:
+        """여러 종목의 가격 이력을 반환합니다 (데이터가 없는 종목은 제외).
+
+        기본 구현은 종목별 `get_history`를 호출하며, 일괄 조회를 지원하는 공급자는 재정의합니다.
+        """
+        histories = {}
+        for ticker in tickers:
+            frame = self.get_history(ticker, period=period, start=start, interval=interval)
+            if not frame.empty:
+                histories[ticker] = frame
+        return histories
+
+
+class YFinanceProvider(MarketDataProvider):
+    """yfinance API를 사용하는 공급자입니다.
+
+    모든 호출은 업스트림 스케줄러를 거치므로 속도 제한과 스로틀링 재시도가 적용되고,
+    동시에 들어온 같은 요청은 한 번만 호출됩니다.
+    """
+
+    name = "yfinance"
+
+    def _call[T](self, key: tuple, fetch: Callable[[], T]) -> T:
+        def counted() -> T:
+            record_event("yfinance_calls")
+            return fetch()
+
+        return get_upstream_scheduler().call(self.name, key, counted)
+
+    def get_info(self, ticker: str) -> dict:
+        symbol = ticker.upper()
+        return self._call(("info", symbol), lambda: _yfinance().Ticker(symbol).info or {})
+
+    def get_history(
+        self, ticker: str, period: str | None = None, start: str | None = None, interval: str = "1d"
+    ) -> pd.DataFrame:
+        symbol = ticker.upper()
+        return self._call(
+            ("history", symbol, period, start, interval),
+            lambda: _yfinance().Ticker(symbol).history(period=period, start=start, interval=interval),
+        )
+
+    def get_histories(
+        self, tickers: list[str], period: str | None = None, start: str | None = None, interval: str = "1d"
+    ) -> dict[str, pd.DataFrame]:
+        """`yf.download` 한 번으로 여러 종목을 받아 종목별 DataFrame으로 분리합니다."""
+        if not tickers:
+            return {}
+
+        kwargs: dict[str, Any] = {"start": start} if start is not None else {"period": period}
+        data = self._call(
+            ("download", tuple(sorted(tickers)), period, start, interval),
+            lambda: _yfinance().download(
+                tickers, group_by="ticker", auto_adjust=True, progress=False, threads=True, interval=interval, **kwargs
+            ),
+        )
+        if data is None or data.empty:
+            return {}
+
+        frames: dict[str, pd.DataFrame] = {}
+        for symbol in tickers:
+            if isinstance(data.columns, pd.MultiIndex):
+                if symbol not in data.columns.get_level_values(0):
+                    continue
+                frame = data[symbol]
+            else:
+                frame = data
+
+            frame = frame.dropna(how="all")
+            if not frame.empty:
+                frames[symbol] = frame
+        return frames
+
+
+class LocalFileProvider(MarketDataProvider):
+    """로컬 디렉터리의 파일을 읽는 공급자입니다 (테스트/재현/오프라인 분석용).
+
+    디렉터리 구성 (벤치마크 fixture와 같은 형식):
+
+    - `<TICKER>.history.parquet` 또는 `<TICKER>.history.csv`: 일봉 OHLCV (Date 인덱스)
+    - `<TICKER>.history.<interval>.parquet|csv`: 일봉 외 간격 (예: `AAPL.history.1m.csv`)
+    - `<TICKER>.info.json`: yfinance 형식 info 딕셔너리
+
+    파일은 수정 시각이 바뀔 때만 다시 읽습니다.
+    """
+
+    name = "local"
+
+    def __init__(self, data_dir: str | Path) -> None:
+        """로컬 파일 공급자를 초기화합니다.
+
+        Args:
+            data_dir: 데이터 파일 디렉터리
+        """
+        self.data_dir = Path(data_dir)
+        self._frames: dict[Path, tuple[float, pd.DataFrame]] = {}
+        self._lock = threading.Lock()
+
+    def _history_path(self, ticker: str, interval: str) -> Path | None:
+        stem = f"{ticker.upper()}.history" if interval == "1d" else f"{ticker.upper()}.history.{interval}"
+        for suffix in (".parquet", ".csv"):
+            path = self.data_dir / f"{stem}{suffix}"
+            if path.exists():
+                return path
+        return None
+
+    def _read_frame(self, path: Path) -> pd.DataFrame:
+        mtime = path.stat().st_mtime
+        with self._lock:
+            cached = self._frames.get(path)
+        if cached is not None and cached[0] == mtime:
+            return cached[1]
+
+        try:
+            if path.suffix == ".parquet":
+                frame = pd.read_parquet(path)
+            else:
+                frame = pd.read_csv(path, index_col=0)
+            # 서머타임 전후로 UTC 오프셋이 섞인 인덱스(yfinance 내보내기)는 UTC로 통일
+            has_offset = bool(frame.index.astype(str).str.contains(r"[+-]\d\d:\d\d$").any())
+            index = pd.to_datetime(frame.index, utc=has_offset)
+        except Exception as e:
+            raise ValueError(f"로컬 시장 데이터 파일 {path} 읽기 중 오류 발생: {str(e)}") from e
+
+        frame.index = pd.DatetimeIndex(index, name="Date")
+        frame = frame.sort_index()
+        with self._lock:
+            self._frames[path] = (mtime, frame)
+        return frame
+
+    def get_info(self, ticker: str) -> dict:
+        path = self.data_dir / f"{ticker.upper()}.info.json"
+        if not path.exists():
+            return {}
+        try:
+            return json.loads(path.read_text(encoding="utf-8")) or {}
+        except Exception as e:
+            raise ValueError(f"로컬 종목 정보 파일 {path} 읽기 중 오류 발생: {str(e)}") from e
+
+    def get_history(
+        self, ticker: str, period: str | None = None, start: str | None = None, interval: str = "1d"
+    ) -> pd.DataFrame:
+        path = self._history_path(ticker, interval)
+        if path is None:
+            return pd.DataFrame(columns=_EMPTY_COLUMNS)
+
+        frame = self._read_frame(path)
+        begin = pd.Timestamp(start) if start is not None else (period_start(period) if period else None)
+        if begin is None:
+            return frame.copy()
+        index = frame.index.tz_localize(None) if frame.index.tz is not None else frame.index
+        return frame[index >= begin].copy()
+
+
+# 설정 이름 -> 공급자 생성 함수
+_PROVIDER_FACTORIES = {
+    "yfinance": YFinanceProvider,
+    "local": lambda: LocalFileProvider(settings.local_data_dir),
+}
+
+_provider: MarketDataProvider | None = None
+_provider_lock = threading.Lock()
+
+
+def create_market_data_provider(name: str) -> MarketDataProvider:
+    """이름 또는 `"<모듈>:<클래스>"` 경로로 공급자를 생성합니다.
+
+    Args:
+        name: "yfinance", "local" 또는 "package.module:ClassName"
+
+    Returns:
+        MarketDataProvider: 생성된 공급자
+    """
+    factory = _PROVIDER_FACTORIES.get(name)
+    if factory is not None:
+        return factory()
+
+    module_name, _, class_name = name.partition(":")
+    if not class_name:
+        raise ValueError(f"지원하지 않는 시장 데이터 공급자: {name}")
+    try:
+        provider_class = getattr(importlib.import_module(module_name), class_name)
+    except Exception as e:
+        raise ValueError(f"시장 데이터 공급자 {name} 로딩 중 오류 발생: {str(e)}") from e
+    provider = provider_class()
+    if not isinstance(provider, MarketDataProvider):
+        raise ValueError(f"{name}은(는) MarketDataProvider를 구현하지 않았습니다.")
+    return provider
+
+
+def get_market_data_provider() -> MarketDataProvider:
+    """설정에 따른 시장 데이터 공급자를 반환합니다 (싱글톤)."""
+    global _provider
+    if _provider is None:
+        with _provider_lock:
+            if _provider is None:
+                _provider = create_market_data_provider(settings.market_data_provider)
+    return _provider
+
+
+def set_market_data_provider(provider: MarketDataProvider | None) -> None:
+    """사용할 공급자를 직접 지정합니다 (None이면 다음 조회 때 설정에서 다시 생성).
+
+    시장 데이터 캐시 키에는 공급자 이름(`store_namespace`)이 포함되므로, 바꾸기 전 공급자가
+    받은 값은 새 공급자의 조회에서 반환되지 않습니다.
+    """
+    global _provider
+    with _provider_lock:
+        _provider = provider
@@ -0,0 +1,356 @@
+"""업스트림(yfinance, Tavily 등) 호출을 한곳에서 조절하는 스케줄러 모듈입니다.
+
+모든 업스트림 호출은 공급자 이름과 요청 키로 `UpstreamScheduler.call`/`acall`을 거칩니다.
+
+- 공급자별 토큰 버킷: 초당 요청 수와 순간 허용량(burst)을 넘지 않도록 호출 전에 대기
+- 재시도: 스로틀링 오류(HTTP 429, `YFRateLimitError`, `UsageLimitExceededError`)는 지터를 섞은
+  지수 백오프로 다시 시도하고, 그 밖의 오류는 바로 전달
+- 단일 실행(single-flight): 같은 공급자/키의 요청이 진행 중이면 새로 호출하지 않고 그 결과를 함께 받음
+  (공유하는 것은 결과와 일반 예외뿐이며, 먼저 시작한 호출자가 취소/인터럽트되면 기다리던 호출자가 다시 호출)
+"""
+
+import asyncio
+import copy
+import random
+import re
+import threading
+import time
+from collections.abc import Awaitable, Callable, Hashable
+from dataclasses import dataclass, field
+from typing import Any
+
+from src.config import settings
+from src.tracing import record_event
+
+# 스로틀링으로 판단하는 예외 클래스 이름 (SDK를 import하지 않고 이름으로 비교)
+_THROTTLING_ERRORS = frozenset({"YFRateLimitError", "UsageLimitExceededError", "RateLimitError"})
+_STATUS_429 = re.compile(r"\b429\b")
+
+
+def is_throttling_error(error: BaseException) -> bool:
+    """업스트림의 요청 한도 초과(스로틀링) 오류인지 판단합니다.
+
+    Args:
+        error: 업스트림 호출에서 발생한 예외
+
+    Returns:
+        bool: 재시도할 스로틀링 오류이면 True
+    """
+    if type(error).__name__ in _THROTTLING_ERRORS:
+        return True
+    response = getattr(error, "response", None)
+    if getattr(response, "status_code", None) == 429:
+        return True
+    text = str(error)
+    return bool(_STATUS_429.search(text)) or "too many requests" in text.lower()
+
+
+class TokenBucket:
+    """초당 `rate`개씩 채워지고 최대 `capacity`개까지 쌓이는 토큰 버킷입니다 (스레드 안전).
+
+    토큰이 없으면 다음 토큰이 채워질 때까지의 대기 시간을 예약하므로 동시에 기다리는 호출자도
+    도착 순서대로 `1 / rate`초 간격으로 나뉘어 진행합니다.
+    """
+
+    def __init__(self, rate: float, capacity: float, clock: Callable[[], float] = time.monotonic) -> None:
+        """
+        Args:
+            rate: 초당 채워지는 토큰 수 (초당 허용 요청 수)
+            capacity: 최대 토큰 수 (순간 허용량)
+            clock: 현재 시각(초)을 반환하는 함수
+        """
+        if rate <= 0 or capacity < 1:
+            raise ValueError("rate는 0보다 크고 capacity는 1 이상이어야 합니다.")
+        self.rate = rate
+        self.capacity = capacity
+        self._clock = clock
+        self._tokens = capacity
+        self._updated = clock()
+        self._lock = threading.Lock()
+
+    def reserve(self) -> float:
+        """토큰 하나를 예약하고 사용 전까지 기다려야 할 시간(초)을 반환합니다."""
+        with self._lock:
+            now = self._clock()
+            self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+            self._updated = now
+            self._tokens -= 1
+            return 0.0 if self._tokens >= 0 else -self._tokens / self.rate
+
+
+@dataclass
+class ProviderStats:
+    """공급자별 업스트림 호출 통계를 나타내는 클래스입니다."""
+
+    calls: int = 0  # 실제 업스트림 호출 수 (재시도 포함)
+    retries: int = 0
+    throttled: int = 0  # 스로틀링 오류 수
+    coalesced: int = 0  # 진행 중인 같은 요청의 결과를 함께 받은 수
+    waited_seconds: float = 0.0  # 토큰 버킷과 재시도 백오프로 대기한 시간
+
+    def to_dict(self) -> dict[str, float]:
+        """통계를 직렬화 가능한 딕셔너리로 변환합니다."""
+        return {
+            "calls": self.calls,
+            "retries": self.retries,
+            "throttled": self.throttled,
+            "coalesced": self.coalesced,
+            "waited_seconds": round(self.waited_seconds, 3),
+        }
+
+
+@dataclass
+class _Flight:
+    """진행 중인 업스트림 요청 하나입니다 (같은 키의 후속 호출자가 완료를 기다림)."""
+
+    done: threading.Event = field(default_factory=threading.Event)
+    result: Any = None
+    error: Exception | None = None
+    abandoned: bool = False  # 먼저 시작한 호출자가 취소/인터럽트되어 결과가 없음 (기다리던 호출자가 다시 호출)
+    # 완료를 기다리는 비동기 호출자 (이벤트 루프, Future) - 스레드를 점유하지 않고 기다림
+    waiters: list[tuple[asyncio.AbstractEventLoop, asyncio.Future]] = field(default_factory=list)
+
+
+def _wake(future: asyncio.Future) -> None:
+    if not future.done():
+        future.set_result(None)
+
+
+def _follower_error(error: Exception) -> Exception:
+    """병합된 호출자에게 던질 새 예외를 만듭니다 (여러 스레드가 같은 예외 객체를 동시에 다시 던지지 않도록).
+
+    가능하면 같은 타입의 복사본을, 복사할 수 없으면 RuntimeError를 반환하며 원래 예외는 `from`으로 연결합니다.
+    """
+    try:
+        return copy.copy(error)
+    except Exception:
+        return RuntimeError(f"병합된 업스트림 요청 실패: {error}")
+
+
+class UpstreamScheduler:
+    """공급자별 속도 제한, 스로틀링 재시도, 동일 요청 병합을 적용하여 업스트림을 호출하는 클래스입니다."""
+
+    def __init__(
+        self,
+        rate_limits: dict[str, tuple[float, float]] | None = None,
+        max_retries: int = 4,
+        base_delay: float = 1.0,
+        max_delay: float = 30.0,
+    ) -> None:
+        """
+        Args:
+            rate_limits: 공급자 -> (초당 요청 수, 순간 허용량). 없는 공급자는 속도 제한 없음
+            max_retries: 스로틀링 오류 시 최대 재시도 횟수
+            base_delay: 첫 재시도 대기 시간 (초, 재시도마다 두 배)
+            max_delay: 재시도 대기 시간 상한 (초)
+        """
+        self.max_retries = max_retries
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self._buckets = {
+            provider: TokenBucket(rate, burst) for provider, (rate, burst) in (rate_limits or {}).items() if rate > 0
+        }
+        self._flights: dict[tuple[str, Hashable], _Flight] = {}
+        self._stats: dict[str, ProviderStats] = {}
+        self._lock = threading.Lock()
+
+    def _stats_for(self, provider: str) -> ProviderStats:
+        stats = self._stats.get(provider)
+        if stats is None:
+            stats = self._stats[provider] = ProviderStats()
+        return stats
+
+    def _count(self, provider: str, name: str, n: float = 1) -> None:
+        with self._lock:
+            stats = self._stats_for(provider)
+            setattr(stats, name, getattr(stats, name) + n)
+
+    def _throttle_delay(self, provider: str) -> float:
+        """토큰 버킷에서 호출 전 대기 시간을 예약합니다."""
+        bucket = self._buckets.get(provider)
+        delay = bucket.reserve() if bucket is not None else 0.0
+        self._count(provider, "calls")
+        if delay > 0:
+            self._count(provider, "waited_seconds", delay)
+        return delay
+
+    def _backoff_delay(self, provider: str, attempt: int) -> float:
+        """재시도 대기 시간을 계산합니다 (지수 증가 + 지터, 상한 적용)."""
+        delay = min(self.max_delay, self.base_delay * 2**attempt)
+        delay = delay / 2 + random.uniform(0, delay / 2)
+        self._count(provider, "retries")
+        self._count(provider, "throttled")
+        self._count(provider, "waited_seconds", delay)
+        record_event("upstream_retries")
+        return delay
+
+    def _join(self, provider: str, key: Hashable | None) -> tuple[_Flight | None, bool]:
+        """같은 요청이 진행 중이면 (그 요청, False)를, 아니면 새로 등록한 (요청, True)를 반환합니다."""
+        if key is None:
+            return None, True
+        with self._lock:
+            flight = self._flights.get((provider, key))
+            if flight is not None:
+                self._stats_for(provider).coalesced += 1
+                record_event("upstream_coalesced")
+                return flight, False
+            flight = self._flights[(provider, key)] = _Flight()
+            return flight, True
+
+    def _land(
+        self,
+        provider: str,
+        key: Hashable | None,
+        flight: _Flight | None,
+        result: Any = None,
+        error: Exception | None = None,
+        abandoned: bool = False,
+    ) -> None:
+        """요청 결과를 기다리던 호출자에게 전달하고 진행 중 목록에서 제거합니다."""
+        if flight is None:
+            return
+        with self._lock:
+            flight.result, flight.error, flight.abandoned = result, error, abandoned
+            del self._flights[(provider, key)]
+            flight.done.set()
+            waiters, flight.waiters = flight.waiters, []
+        for loop, future in waiters:
+            try:
+                loop.call_soon_threadsafe(_wake, future)
+            except RuntimeError:
+                # 이미 닫힌 이벤트 루프의 호출자는 더 이상 기다리지 않음
+                pass
+
+    def _follow[T](self, flight: _Flight) -> tuple[bool, T]:
+        """완료된 요청의 결과를 (결과 사용 여부, 결과)로 반환합니다 (일반 예외는 새 예외로 다시 던짐)."""
+        if flight.abandoned:
+            return False, None
+        if flight.error is not None:
+            raise _follower_error(flight.error) from flight.error
+        return True, flight.result
+
+    def call[T](self, provider: str, key: Hashable | None, fetch: Callable[[], T]) -> T:
+        """업스트림을 호출합니다 (속도 제한, 스로틀링 재시도, 동일 요청 병합 적용).
+
+        Args:
+            provider: 공급자 이름 (예: "yfinance", "tavily")
+            key: 동일 요청 판단 키 (None이면 병합하지 않음)
+            fetch: 실제 업스트림을 호출하는 함수
+
+        Returns:
+            fetch의 반환값 (병합된 경우 먼저 시작한 요청의 결과)
+        """
+        while True:
+            flight, leader = self._join(provider, key)
+            if leader:
+                break
+            flight.done.wait()
+            completed, result = self._follow(flight)
+            if completed:
+                return result
+
+        try:
+            result = self._run(provider, fetch)
+        except Exception as e:
+            self._land(provider, key, flight, error=e)
+            raise
+        except BaseException:
+            self._land(provider, key, flight, abandoned=True)
+            raise
+        self._land(provider, key, flight, result=result)
+        return result
+
+    def _run[T](self, provider: str, fetch: Callable[[], T]) -> T:
+        """속도 제한을 지키며 호출하고, 스로틀링 오류는 백오프 후 다시 시도합니다."""
+        attempt = 0
+        while True:
+            delay = self._throttle_delay(provider)
+            if delay > 0:
+                time.sleep(delay)
+            try:
+                return fetch()
+            except Exception as e:
+                if attempt >= self.max_retries or not is_throttling_error(e):
+                    raise
+                time.sleep(self._backoff_delay(provider, attempt))
+                attempt += 1
+
+    async def acall[T](self, provider: str, key: Hashable | None, fetch: Callable[[], Awaitable[T]]) -> T:
+        """`call`의 비동기 버전입니다 (대기는 이벤트 루프를 막지 않음, 진행 중 요청은 동기 호출과 공유).
+
+        Args:
+            provider: 공급자 이름 (예: "yfinance", "tavily")
+            key: 동일 요청 판단 키 (None이면 병합하지 않음)
+            fetch: 실제 업스트림을 호출하는 코루틴 함수
+
+        Returns:
+            fetch의 반환값 (병합된 경우 먼저 시작한 요청의 결과)
+        """
+        while True:
+            flight, leader = self._join(provider, key)
+            if leader:
+                break
+            loop = asyncio.get_running_loop()
+            future = loop.create_future()
+            with self._lock:
+                if flight.done.is_set():
+                    future.set_result(None)
+                else:
+                    flight.waiters.append((loop, future))
+            await future
+            completed, result = self._follow(flight)
+            if completed:
+                return result
+
+        try:
+            result = await self._arun(provider, fetch)
+        except Exception as e:
+            self._land(provider, key, flight, error=e)
+            raise
+        except BaseException:
+            self._land(provider, key, flight, abandoned=True)
+            raise
+        self._land(provider, key, flight, result=result)
+        return result
+
+    async def _arun[T](self, provider: str, fetch: Callable[[], Awaitable[T]]) -> T:
+        """`_run`의 비동기 버전입니다."""
+        attempt = 0
+        while True:
+            delay = self._throttle_delay(provider)
+            if delay > 0:
+                await asyncio.sleep(delay)
+            try:
+                return await fetch()
+            except Exception as e:
+                if attempt >= self.max_retries or not is_throttling_error(e):
+                    raise
+                await asyncio.sleep(self._backoff_delay(provider, attempt))
+                attempt += 1
+
+    def stats(self) -> dict[str, dict[str, float]]:
+        """공급자별 호출 통계를 반환합니다."""
+        with self._lock:
+            return {provider: stats.to_dict() for provider, stats in self._stats.items()}
+
+
+_scheduler: UpstreamScheduler | None = None
+_scheduler_lock = threading.Lock()
+
+
+def get_upstream_scheduler() -> UpstreamScheduler:
+    """설정에 따른 프로세스 전역 업스트림 스케줄러를 반환합니다 (싱글톤)."""
+    global _scheduler
+    if _scheduler is None:
+        with _scheduler_lock:
+            if _scheduler is None:
+                _scheduler = UpstreamScheduler(
+                    rate_limits={
+                        "yfinance": (settings.yfinance_rate_limit, settings.yfinance_burst),
+                        "tavily": (settings.tavily_rate_limit, settings.tavily_burst),
+                    },
+                    max_retries=settings.upstream_max_retries,
+                    base_delay=settings.upstream_retry_base_delay,
+                    max_delay=settings.upstream_retry_max_delay,
+                )
+    return _scheduler
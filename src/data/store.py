@@ -0,0 +1,295 @@
+"""일봉 OHLCV를 로컬 디스크에 보관하는 저장소를 정의하는 모듈입니다.
+
+종목마다 하나의 구조화 NumPy 파일(`<TICKER>.npy`)을 두고 메모리 맵으로 읽습니다.
+쓰기는 임시 파일에 기록한 뒤 `os.replace`로 교체하므로, 여러 워커 프로세스가
+같은 디렉터리를 공유해도 읽는 쪽은 항상 완전한 파일만 보게 됩니다. 읽기-수정-쓰기(`upsert`)와 삭제는
+종목별 잠금 파일(`<TICKER>.lock`)에 `fcntl.flock`을 걸어 프로세스 사이에서도 직렬화합니다
+(`fcntl`이 없는 플랫폼에서는 프로세스 안의 스레드 잠금만 적용).
+"""
+
+import json
+import os
+import threading
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from pathlib import Path
+from typing import BinaryIO
+
+import numpy as np
+import pandas as pd
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+
+OHLCV_DTYPE = np.dtype(
+    [
+        ("date", "datetime64[D]"),
+        ("open", "f8"),
+        ("high", "f8"),
+        ("low", "f8"),
+        ("close", "f8"),
+        ("volume", "f8"),
+    ]
+)
+
+# yfinance 컬럼 이름 <-> 저장소 필드 이름
+_COLUMNS = {"Open": "open", "High": "high", "Low": "low", "Close": "close", "Volume": "volume"}
+
+# 증분 조회의 겹치는 봉 종가가 저장된 값과 이 상대 오차 이상 다르면 수정 주가가 다시 계산된 것으로 판단
+ADJUSTMENT_TOLERANCE = 1e-4
+
+# yfinance period 문자열 -> 조회 시작일 오프셋
+_PERIOD_OFFSETS = {
+    "1d": pd.DateOffset(days=1),
+    "5d": pd.DateOffset(days=5),
+    "1mo": pd.DateOffset(months=1),
+    "3mo": pd.DateOffset(months=3),
+    "6mo": pd.DateOffset(months=6),
+    "1y": pd.DateOffset(years=1),
+    "2y": pd.DateOffset(years=2),
+    "5y": pd.DateOffset(years=5),
+    "10y": pd.DateOffset(years=10),
+}
+
+
+def period_start(period: str, today: pd.Timestamp | None = None) -> pd.Timestamp | None:
+    """yfinance period 문자열을 조회 시작일로 변환합니다.
+
+    Args:
+        period: 조회 기간 (예: "3mo", "1y", "ytd")
+        today: 기준일 (기본값: 오늘)
+
+    Returns:
+        pd.Timestamp | None: 시작일 (지원하지 않는 기간이면 None)
+    """
+    today = (today or pd.Timestamp.now()).normalize()
+    if period == "ytd":
+        return pd.Timestamp(year=today.year, month=1, day=1)
+    offset = _PERIOD_OFFSETS.get(period)
+    return today - offset if offset is not None else None
+
+
+def frame_to_records(frame: pd.DataFrame) -> np.ndarray:
+    """yfinance 가격 이력 DataFrame을 저장소 레코드 배열로 변환합니다."""
+    index = frame.index
+    if getattr(index, "tz", None) is not None:
+        index = index.tz_localize(None)
+
+    records = np.empty(len(frame), dtype=OHLCV_DTYPE)
+    records["date"] = pd.DatetimeIndex(index).normalize().to_numpy(dtype="datetime64[D]")
+    for column, field in _COLUMNS.items():
+        records[field] = frame[column].to_numpy(dtype=float) if column in frame else np.nan
+    return records
+
+
+def records_to_frame(records: np.ndarray) -> pd.DataFrame:
+    """저장소 레코드 배열을 yfinance와 같은 컬럼의 DataFrame으로 변환합니다."""
+    return pd.DataFrame(
+        {column: np.asarray(records[field]) for column, field in _COLUMNS.items()},
+        index=pd.DatetimeIndex(np.asarray(records["date"]).astype("datetime64[ns]"), name="Date"),
+    )
+
+
+class OHLCVStore:
+    """티커별 일봉 OHLCV를 메모리 맵 NumPy 파일로 보관하는 저장소입니다."""
+
+    def __init__(self, root: str | Path) -> None:
+        """저장소를 초기화합니다.
+
+        Args:
+            root: 파일을 저장할 디렉터리 (없으면 생성)
+        """
+        self.root = Path(root)
+        self.root.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+
+    def path_for(self, ticker: str) -> Path:
+        """티커의 데이터 파일 경로를 반환합니다."""
+        return self.root / f"{ticker.strip().upper()}.npy"
+
+    def _meta_path(self, ticker: str) -> Path:
+        return self.root / f"{ticker.strip().upper()}.meta.json"
+
+    @contextmanager
+    def _locked(self, ticker: str) -> Iterator[None]:
+        """티커 파일을 프로세스 안의 스레드와 같은 디렉터리를 쓰는 다른 프로세스 사이에서 배타적으로 잠급니다."""
+        with self._lock:
+            if fcntl is None:
+                yield
+                return
+            with open(self.root / f"{ticker.strip().upper()}.lock", "a") as lock_file:
+                fcntl.flock(lock_file, fcntl.LOCK_EX)
+                try:
+                    yield
+                finally:
+                    fcntl.flock(lock_file, fcntl.LOCK_UN)
+
+    def read(self, ticker: str) -> np.ndarray:
+        """저장된 레코드를 메모리 맵으로 읽습니다 (없으면 빈 배열).
+
+        Args:
+            ticker: 주식 심볼
+
+        Returns:
+            np.ndarray: 날짜 오름차순 OHLCV 레코드 (읽기 전용)
+        """
+        path = self.path_for(ticker)
+        if not path.exists():
+            return np.empty(0, dtype=OHLCV_DTYPE)
+        return np.load(path, mmap_mode="r")
+
+    def covered_from(self, ticker: str) -> pd.Timestamp | None:
+        """저장된 데이터가 빠짐없이 보장하는 시작일을 반환합니다.
+
+        상장일 이후만 데이터가 있는 종목도 매번 전체를 다시 받지 않도록,
+        마지막 전체 조회에서 요청한 시작일을 별도 메타 파일에 기록해 둡니다.
+        """
+        meta_path = self._meta_path(ticker)
+        if not meta_path.exists():
+            return None
+        try:
+            return pd.Timestamp(json.loads(meta_path.read_text())["covered_from"])
+        except (ValueError, KeyError):
+            return None
+
+    def _atomic_write(self, path: Path, write: Callable[[BinaryIO], object]) -> None:
+        tmp_path = path.with_name(f".{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+        try:
+            with open(tmp_path, "wb") as f:
+                write(f)
+            os.replace(tmp_path, path)
+        finally:
+            tmp_path.unlink(missing_ok=True)
+
+    def upsert(self, ticker: str, frame: pd.DataFrame, covered_from: pd.Timestamp | None = None) -> np.ndarray:
+        """새 봉을 저장된 이력 뒤에 추가합니다.
+
+        새 데이터의 첫 날짜 이후로 저장된 봉은 새 데이터로 대체합니다
+        (장중에 저장된 미완성 마지막 봉을 갱신하기 위함).
+
+        Args:
+            ticker: 주식 심볼
+            frame: yfinance 가격 이력 DataFrame
+            covered_from: 전체 조회 시 요청한 시작일 (증분 추가 시 None)
+
+        Returns:
+            np.ndarray: 병합 후 전체 레코드
+        """
+        new_records = frame_to_records(frame)
+        with self._locked(ticker):
+            stored = np.array(self.read(ticker))
+            if len(new_records):
+                stored = stored[stored["date"] < new_records["date"][0]]
+            merged = np.concatenate([stored, new_records])
+
+            self._atomic_write(self.path_for(ticker), lambda f: np.save(f, merged))
+            if covered_from is not None:
+                meta = json.dumps({"covered_from": covered_from.date().isoformat()}).encode()
+                self._atomic_write(self._meta_path(ticker), lambda f: f.write(meta))
+            return merged
+
+    def invalidate(self, ticker: str) -> None:
+        """티커의 저장 데이터와 메타 파일을 삭제합니다 (다음 조회는 전체 기간)."""
+        with self._locked(ticker):
+            self.path_for(ticker).unlink(missing_ok=True)
+            self._meta_path(ticker).unlink(missing_ok=True)
+
+    def matches_stored(self, ticker: str, frame: pd.DataFrame) -> bool:
+        """증분으로 받은 봉이 저장된 봉과 같은 수정 주가 기준인지 확인합니다.
+
+        yfinance는 분할/배당이 생기면 과거 봉 전체를 다시 수정하므로, 겹치는 완성 봉의 종가가
+        저장된 값과 다르면 저장된 이력 뒤에 새 봉을 이어 붙일 수 없습니다. 마지막 저장 봉은
+        장중 미완성일 수 있어 비교하지 않으며, 비교할 봉이 없으면 일치하는 것으로 봅니다.
+
+        Args:
+            ticker: 주식 심볼
+            frame: `incremental_start` 이후로 받은 가격 이력
+
+        Returns:
+            bool: 겹치는 봉의 종가가 허용 오차(`ADJUSTMENT_TOLERANCE`) 안에서 같으면 True
+        """
+        stored = self.read(ticker)
+        if frame.empty or len(stored) < 2:
+            return True
+        complete = stored[:-1]
+        fetched = frame_to_records(frame)
+        _, stored_idx, fetched_idx = np.intersect1d(complete["date"], fetched["date"], return_indices=True)
+        return bool(
+            np.allclose(
+                complete["close"][stored_idx],
+                fetched["close"][fetched_idx],
+                rtol=ADJUSTMENT_TOLERANCE,
+                atol=0,
+                equal_nan=True,
+            )
+        )
+
+    def incremental_start(self, ticker: str, period: str) -> str | None:
+        """증분 조회를 시작할 날짜를 반환합니다.
+
+        저장된 데이터가 요청 기간을 덮고 있으면 마지막 두 저장 봉 중 앞 봉의 날짜를 반환합니다
+        (마지막 봉은 장중 미완성일 수 있어 다시 받고, 그 앞의 완성 봉은 `matches_stored`에서
+        수정 주가 변경 여부를 확인하는 데 사용합니다). 콜드 스타트이거나 더 긴 기간을
+        요청한 경우에는 None을 반환하며, 이때는 전체 기간을 조회해야 합니다.
+
+        Args:
+            ticker: 주식 심볼
+            period: 조회 기간 (예: "1y")
+
+        Returns:
+            str | None: "YYYY-MM-DD" 형식의 증분 조회 시작일
+        """
+        start = period_start(period)
+        stored = self.read(ticker)
+        covered_from = self.covered_from(ticker)
+        if start is None or len(stored) == 0 or covered_from is None or covered_from > start:
+            return None
+        return pd.Timestamp(stored["date"][max(0, len(stored) - 2)]).date().isoformat()
+
+    def save_fetched(self, ticker: str, period: str, frame: pd.DataFrame, incremental: bool) -> pd.DataFrame:
+        """업스트림에서 받은 봉을 저장하고 요청 기간의 이력을 반환합니다.
+
+        Args:
+            ticker: 주식 심볼
+            period: 조회 기간 (예: "1y")
+            frame: 업스트림에서 받은 가격 이력 (비어 있을 수 있음)
+            incremental: `incremental_start` 이후만 받은 증분 데이터인지 여부
+
+        Returns:
+            pd.DataFrame: 요청 기간의 OHLCV 이력 (Open, High, Low, Close, Volume)
+        """
+        start = period_start(period)
+        if frame.empty:
+            records = np.array(self.read(ticker)) if incremental else np.empty(0, dtype=OHLCV_DTYPE)
+        else:
+            records = self.upsert(ticker, frame, covered_from=None if incremental else start)
+
+        if start is not None:
+            records = records[records["date"] >= np.datetime64(start.date(), "D")]
+        return records_to_frame(records)
+
+    def load_history(self, ticker: str, period: str, fetch: Callable[..., pd.DataFrame]) -> pd.DataFrame:
+        """저장소를 기준으로 일봉 이력을 반환하고, 부족한 봉만 업스트림에서 받아 추가합니다.
+
+        Args:
+            ticker: 주식 심볼
+            period: 조회 기간 (예: "1y")
+            fetch: `fetch(period=..., start=...)` 형태로 yfinance 일봉 이력을 가져오는 함수
+
+        Returns:
+            pd.DataFrame: 요청 기간의 OHLCV 이력 (Open, High, Low, Close, Volume)
+        """
+        if period_start(period) is None:
+            # "max" 등 시작일을 알 수 없는 기간은 저장소를 거치지 않음
+            return fetch(period=period, start=None)
+
+        start = self.incremental_start(ticker, period)
+        if start is not None:
+            frame = fetch(period=None, start=start)
+            if self.matches_stored(ticker, frame):
+                return self.save_fetched(ticker, period, frame, incremental=True)
+            # 분할/배당으로 수정 주가가 바뀌었으면 저장된 이력을 버리고 전체 기간을 다시 받음
+            self.invalidate(ticker)
+        return self.save_fetched(ticker, period, fetch(period=period, start=None), incremental=False)
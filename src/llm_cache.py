@@ -0,0 +1,215 @@
+"""LLM 응답을 로컬 SQLite 파일에 저장하는 완전 일치(exact-match) 캐시 모듈입니다."""
+
+import hashlib
+import os
+import sqlite3
+import threading
+import time
+import warnings
+from collections.abc import Callable, Sequence
+from typing import Any
+
+from langchain_core.caches import RETURN_VAL_TYPE, BaseCache
+from langchain_core.load import dumps, loads
+
+from src.config import settings
+from src.data.cache import CacheStats
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS llm_cache (
+    key TEXT PRIMARY KEY,
+    llm_string TEXT NOT NULL,
+    generations TEXT NOT NULL,
+    created_at REAL NOT NULL,
+    accessed_at REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_llm_cache_accessed_at ON llm_cache (accessed_at);
+CREATE INDEX IF NOT EXISTS idx_llm_cache_created_at ON llm_cache (created_at);
+"""
+
+
+class SQLiteLLMCache(BaseCache):
+    """(모델 설정, 직렬화된 메시지) 단위로 LLM 응답을 보관하는 SQLite 캐시입니다.
+
+    키에 쓰이는 `llm_string`에는 provider, 모델 이름, 온도 등 모델 설정과 바인딩된 도구가
+    모두 포함되므로 설정이 하나라도 다르면 캐시를 공유하지 않습니다. 오래된 항목은 생성 시각
+    기준으로 만료되고, 최대 항목 수를 넘으면 가장 오래 사용되지 않은 항목부터 제거됩니다.
+    """
+
+    def __init__(
+        self,
+        path: str | os.PathLike,
+        max_entries: int,
+        max_age: float | None = None,
+        clock: Callable[[], float] = time.time,
+    ) -> None:
+        """캐시를 초기화합니다.
+
+        Args:
+            path: SQLite 파일 경로 (없으면 생성)
+            max_entries: 보관할 최대 항목 수
+            max_age: 항목 유효 시간 (초, None이면 만료 없음)
+            clock: 현재 시각(초)을 반환하는 함수
+        """
+        if max_entries <= 0:
+            raise ValueError("max_entries는 1 이상이어야 합니다.")
+
+        self.path = os.fspath(path)
+        self.max_entries = max_entries
+        self.max_age = max_age
+        self._clock = clock
+        self._stats = CacheStats()
+        self._lock = threading.Lock()
+
+        if self.path != ":memory:":
+            os.makedirs(os.path.dirname(os.path.abspath(self.path)), exist_ok=True)
+        # 배치/병렬 실행에서 여러 스레드가 하나의 연결을 공유 (접근은 잠금으로 직렬화)
+        self._conn = sqlite3.connect(self.path, check_same_thread=False, timeout=30.0)
+        self._conn.executescript(_SCHEMA)
+        self._conn.commit()
+
+    @staticmethod
+    def make_key(prompt: str, llm_string: str) -> str:
+        """모델 설정과 프롬프트로 캐시 키(SHA-256)를 생성합니다."""
+        digest = hashlib.sha256()
+        digest.update(llm_string.encode("utf-8"))
+        digest.update(b"\x00")
+        digest.update(prompt.encode("utf-8"))
+        return digest.hexdigest()
+
+    def _is_expired(self, created_at: float, now: float) -> bool:
+        return self.max_age is not None and created_at + self.max_age <= now
+
+    def lookup(self, prompt: str, llm_string: str) -> RETURN_VAL_TYPE | None:
+        """캐시된 응답을 조회합니다.
+
+        Args:
+            prompt: 직렬화된 입력 메시지
+            llm_string: 직렬화된 모델 설정
+
+        Returns:
+            캐시된 Generation 리스트 (없거나 만료되었으면 None)
+        """
+        key = self.make_key(prompt, llm_string)
+        now = self._clock()
+        with self._lock:
+            row = self._conn.execute("SELECT generations, created_at FROM llm_cache WHERE key = ?", (key,)).fetchone()
+            if row is None:
+                self._stats.misses += 1
+                return None
+
+            generations, created_at = row
+            if self._is_expired(created_at, now):
+                self._conn.execute("DELETE FROM llm_cache WHERE key = ?", (key,))
+                self._conn.commit()
+                self._stats.expirations += 1
+                self._stats.misses += 1
+                return None
+
+            self._conn.execute("UPDATE llm_cache SET accessed_at = ? WHERE key = ?", (now, key))
+            self._conn.commit()
+            self._stats.hits += 1
+
+        try:
+            return _loads_generations(generations)
+        except Exception:
+            # 직렬화 형식이 바뀐 항목은 미스로 처리 (다음 호출에서 덮어씀)
+            return None
+
+    def update(self, prompt: str, llm_string: str, return_val: RETURN_VAL_TYPE) -> None:
+        """응답을 캐시에 저장하고 필요하면 만료/초과 항목을 제거합니다.
+
+        Args:
+            prompt: 직렬화된 입력 메시지
+            llm_string: 직렬화된 모델 설정
+            return_val: 저장할 Generation 리스트
+        """
+        key = self.make_key(prompt, llm_string)
+        generations = dumps(list(return_val))
+        now = self._clock()
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO llm_cache (key, llm_string, generations, created_at, accessed_at) "
+                "VALUES (?, ?, ?, ?, ?)",
+                (key, llm_string, generations, now, now),
+            )
+            self._evict(now)
+            self._conn.commit()
+
+    def _evict(self, now: float) -> None:
+        """만료된 항목과 최대 항목 수를 넘는 항목을 제거합니다 (잠금 안에서 호출)."""
+        if self.max_age is not None:
+            cursor = self._conn.execute("DELETE FROM llm_cache WHERE created_at <= ?", (now - self.max_age,))
+            self._stats.expirations += cursor.rowcount
+
+        (count,) = self._conn.execute("SELECT COUNT(*) FROM llm_cache").fetchone()
+        overflow = count - self.max_entries
+        if overflow > 0:
+            cursor = self._conn.execute(
+                "DELETE FROM llm_cache WHERE key IN (SELECT key FROM llm_cache ORDER BY accessed_at LIMIT ?)",
+                (overflow,),
+            )
+            self._stats.evictions += cursor.rowcount
+
+    def clear(self, **kwargs: Any) -> None:
+        """모든 항목과 통계를 초기화합니다."""
+        with self._lock:
+            self._conn.execute("DELETE FROM llm_cache")
+            self._conn.commit()
+            self._stats = CacheStats()
+
+    def __len__(self) -> int:
+        with self._lock:
+            (count,) = self._conn.execute("SELECT COUNT(*) FROM llm_cache").fetchone()
+            return count
+
+    def stats(self) -> dict[str, float]:
+        """적중/미스/제거 통계와 현재 항목 수를 반환합니다."""
+        with self._lock:
+            result = self._stats.to_dict()
+            (result["size"],) = self._conn.execute("SELECT COUNT(*) FROM llm_cache").fetchone()
+            return result
+
+    def close(self) -> None:
+        """SQLite 연결을 닫습니다."""
+        with self._lock:
+            self._conn.close()
+
+
+def _loads_generations(text: str) -> Sequence[Any]:
+    """직렬화된 Generation 리스트를 복원합니다."""
+    with warnings.catch_warnings():
+        # langchain_core.load.loads의 beta 경고 억제
+        warnings.simplefilter("ignore")
+        return loads(text, allowed_objects="core")
+
+
+# 프로세스 전역 LLM 응답 캐시 (처음 사용할 때 생성)
+_llm_cache: SQLiteLLMCache | None = None
+_llm_cache_lock = threading.Lock()
+
+
+def get_llm_response_cache() -> SQLiteLLMCache | None:
+    """설정에 따라 공유 LLM 응답 캐시를 반환합니다.
+
+    Returns:
+        SQLiteLLMCache | None: 캐시 인스턴스 (`llm_cache_enabled`가 꺼져 있으면 None)
+    """
+    global _llm_cache
+    if not settings.llm_cache_enabled:
+        return None
+    if _llm_cache is None:
+        with _llm_cache_lock:
+            if _llm_cache is None:
+                _llm_cache = SQLiteLLMCache(
+                    settings.llm_cache_path,
+                    max_entries=settings.llm_cache_max_entries,
+                    max_age=settings.llm_cache_max_age,
+                )
+    return _llm_cache
+
+
+def get_llm_cache_stats() -> dict[str, float] | None:
+    """공유 LLM 응답 캐시의 통계를 반환합니다 (캐시가 꺼져 있으면 None)."""
+    cache = get_llm_response_cache()
+    return cache.stats() if cache is not None else None
@@ -13,6 +13,7 @@ class NewsItem(BaseModel):
     content: str = Field(description="뉴스 내용")
     published_date: str | None = Field(None, description="발행일")
     score: float | None = Field(None, description="관련도 점수")
+    merged_count: int = Field(1, description="하나로 합쳐진 유사 기사 수 (자기 자신 포함)")
 
 
 class ResearchReport(BaseModel):
@@ -30,7 +31,12 @@ class ResearchReport(BaseModel):
     # 결론
     recommendation: str = Field(description="투자 의견")
     key_risks: list[str] = Field(default_factory=list, description="주요 리스크")
+    conclusion: str = Field("", description="종합 의견")
 
     # 메타데이터
     iteration_count: int = Field(description="반복 횟수")
     confidence_score: float = Field(ge=0, le=1, description="신뢰도 점수")
+    fingerprints: dict[str, str] = Field(
+        default_factory=dict, description="섹션별 입력 데이터 지문 (증분 갱신 시 변경 여부 판단)"
+    )
+    refreshed_sections: list[str] = Field(default_factory=list, description="이번 실행에서 새로 생성한 섹션")
@@ -0,0 +1,147 @@
+"""에이전트 실행 진행 상황과 최종 보고서 토큰을 실시간으로 출력하는 스트리밍 모듈입니다."""
+
+import sys
+import time
+from typing import Any, TextIO
+
+from langchain_core.messages import AIMessage, ToolMessage
+
+from src.agent import extract_report, get_agent, research_run
+from src.config import settings
+
+# 서브에이전트에 작업을 위임하는 deepagents 도구 이름
+_TASK_TOOL = "task"
+
+
+class ProgressPrinter:
+    """그래프 스트림 이벤트를 사람이 읽을 수 있는 진행 로그로 출력하는 클래스입니다.
+
+    - 메인 에이전트의 서브에이전트 시작/완료 (소요 시간 포함)
+    - 메인 에이전트와 서브에이전트의 도구 호출
+    - 메인 에이전트의 응답 토큰 (도착하는 즉시 출력)
+    """
+
+    def __init__(self, out: TextIO | None = None) -> None:
+        """출력 대상을 지정하여 초기화합니다.
+
+        Args:
+            out: 진행 로그를 쓸 스트림 (기본값: sys.stdout)
+        """
+        self.out = out or sys.stdout
+        self.started = time.perf_counter()
+        self.streamed_text = ""
+        self._subagents: dict[str, tuple[str, float]] = {}  # tool_call_id -> (서브에이전트 이름, 시작 시각)
+        self._in_tokens = False
+
+    def _elapsed(self) -> str:
+        return f"[{time.perf_counter() - self.started:6.1f}s]"
+
+    def log(self, text: str) -> None:
+        """경과 시간과 함께 이벤트 한 줄을 출력합니다 (토큰 출력 중이었다면 줄을 바꾼 뒤 출력)."""
+        if self._in_tokens:
+            self.out.write("\n")
+            self._in_tokens = False
+        self.out.write(f"{self._elapsed()} {text}\n")
+        self.out.flush()
+
+    def handle(self, namespace: tuple[str, ...], mode: str, data: Any) -> None:
+        """스트림 이벤트 하나를 처리합니다.
+
+        Args:
+            namespace: 이벤트가 발생한 그래프 경로 (빈 튜플이면 메인 에이전트)
+            mode: 스트림 모드 ("updates" 또는 "messages")
+            data: 스트림 모드별 이벤트 데이터
+        """
+        if mode == "messages":
+            self._handle_token(namespace, *data)
+        elif mode == "updates":
+            for update in (data or {}).values():
+                messages = update.get("messages") if isinstance(update, dict) else None
+                # Overwrite(전체 메시지 재기록) 등 리스트가 아닌 업데이트는 새 이벤트가 아니므로 무시
+                if isinstance(messages, list):
+                    for message in messages:
+                        self._handle_message(namespace, message)
+
+    def _handle_token(self, namespace: tuple[str, ...], chunk: Any, metadata: dict) -> None:
+        """메인 에이전트의 응답 토큰을 출력합니다 (서브에이전트 토큰은 출력하지 않음)."""
+        if namespace or not isinstance(chunk, AIMessage):
+            return
+        text = chunk.text
+        if not text:
+            return
+        if not self._in_tokens:
+            self.out.write(f"{self._elapsed()} ")
+            self._in_tokens = True
+        self.out.write(text)
+        self.out.flush()
+        self.streamed_text += text
+
+    def _handle_message(self, namespace: tuple[str, ...], message: Any) -> None:
+        """노드 업데이트에 포함된 메시지로 도구 호출과 서브에이전트 시작/완료를 출력합니다."""
+        prefix = "  └ " if namespace else ""
+        if isinstance(message, AIMessage):
+            for tool_call in message.tool_calls:
+                if not namespace and tool_call["name"] == _TASK_TOOL:
+                    name = tool_call["args"].get("subagent_type", "?")
+                    self._subagents[tool_call["id"]] = (name, time.perf_counter())
+                    self.log(f"서브에이전트 시작: {name}")
+                else:
+                    self.log(f"{prefix}도구 호출: {tool_call['name']}({_format_args(tool_call['args'])})")
+        elif isinstance(message, ToolMessage):
+            started = self._subagents.pop(message.tool_call_id, None) if not namespace else None
+            if started is not None:
+                name, started_at = started
+                self.log(f"서브에이전트 완료: {name} ({time.perf_counter() - started_at:.1f}초)")
+            elif message.status == "error":
+                self.log(f"{prefix}도구 오류: {message.name}")
+
+
+def _format_args(args: dict, limit: int = 60) -> str:
+    """도구 인자를 한 줄로 요약합니다."""
+    text = ", ".join(f"{key}={value!r}" for key, value in args.items())
+    return text if len(text) <= limit else text[: limit - 1] + "…"
+
+
+def stream_research(ticker: str, agent=None, out: TextIO | None = None, run_id: str | None = None) -> tuple[str, bool]:
+    """한 종목에 대한 조사를 스트리밍 모드로 실행하며 진행 상황을 출력합니다.
+
+    서브에이전트 내부 이벤트까지 받기 위해 `subgraphs=True`로 스트리밍합니다.
+
+    Args:
+        ticker: 주식 심볼 (예: "AAPL", "TSLA")
+        agent: 사용할 에이전트 (None이면 싱글톤 에이전트 사용)
+        out: 진행 로그를 쓸 스트림 (기본값: sys.stdout)
+        run_id: 체크포인트 실행 ID (체크포인트 모드에서 같은 ID로 다시 호출하면 중단된 지점부터 재개)
+
+    Returns:
+        tuple[str, bool]: (보고서 텍스트, 보고서가 이미 토큰으로 모두 출력되었는지 여부)
+    """
+    agent = agent or get_agent()
+    printer = ProgressPrinter(out)
+    final_state: dict = {}
+
+    with research_run(ticker, agent, run_id) as run:
+        if run.run_id is not None:
+            printer.log(f"실행 ID: {run.run_id}" + (" (재개)" if run.input is None and not run.completed else ""))
+        if run.completed:
+            final_state = run.completed
+        else:
+            for namespace, mode, data in agent.stream(
+                run.input,
+                config=run.config,
+                stream_mode=["updates", "messages", "values"],
+                subgraphs=True,
+            ):
+                if mode == "values":
+                    if not namespace:
+                        final_state = data
+                    continue
+                printer.handle(namespace, mode, data)
+
+    printer.log("실행 완료")
+    report = extract_report(final_state)
+    if settings.report_store_enabled:
+        from src.reports import record_report
+
+        record_report(ticker, final_state, report, run.fingerprints)
+    return report, bool(report) and report.strip() in printer.streamed_text
@@ -0,0 +1,466 @@
+"""조사 보고서를 종목/생성 시각 기준으로 저장하고, 입력 데이터가 바뀐 섹션만 다시 생성하는 모듈입니다.
+
+섹션별 재생성 기준 (섹션 지문):
+
+- 기술적 분석: 가격이 계속 바뀌므로 매 실행마다 다시 생성
+- 뉴스/감성 분석: 뉴스 검색 결과의 URL 집합이 바뀌었을 때
+- 펀더멘털 분석: `FinancialData` 필드 값(매출액, 순이익, EPS, PER, 부채비율)이 바뀌었을 때
+
+증분 갱신(`refresh_research`)은 바뀐 섹션의 서브에이전트만 실행하고 나머지 섹션은 최근 보고서에서 그대로
+재사용한 뒤, 요약/투자 의견/리스크/결론만 LLM 한 번으로 다시 종합합니다.
+"""
+
+import contextvars
+import hashlib
+import json
+import logging
+import os
+import re
+import sqlite3
+import threading
+from collections.abc import Callable, Iterator
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from contextvars import ContextVar
+from datetime import datetime
+from typing import Any
+
+from langchain_core.messages import AIMessage, HumanMessage, SystemMessage, ToolMessage
+
+from src.config import settings
+from src.models.research import ResearchReport
+from src.prompts import REPORT_REFRESH_PROMPT
+
+logger = logging.getLogger(__name__)
+
+# 섹션 -> (ResearchReport 필드, 담당 서브에이전트, 보고서 제목)
+SECTIONS: dict[str, tuple[str, str, str]] = {
+    "fundamental": ("fundamental_analysis", "fundamental-analyst", "펀더멘털 분석"),
+    "technical": ("technical_analysis", "technical-analyst", "기술적 분석"),
+    "sentiment": ("sentiment_analysis", "sentiment-analyst", "뉴스/감성 분석"),
+}
+
+# 보고서 마크다운 제목 키워드 -> 필드
+_HEADINGS = {
+    "요약": "summary",
+    "펀더멘털": "fundamental_analysis",
+    "기술적": "technical_analysis",
+    "감성": "sentiment_analysis",
+    "뉴스": "sentiment_analysis",
+    "리스크": "key_risks",
+    "결론": "conclusion",
+}
+
+_RECOMMENDATION_PATTERN = re.compile(r"투자\s*의견\s*[:：]\s*\**\s*([^\n*]+)")
+_CONFIDENCE_PATTERN = re.compile(r"신뢰도\s*[:：]\s*\**\s*(\d+(?:\.\d+)?)\s*%")
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS reports (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    ticker TEXT NOT NULL,
+    generated_at TEXT NOT NULL,
+    report TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_reports_ticker_generated_at ON reports (ticker, generated_at);
+"""
+
+
+class ReportStore:
+    """`ResearchReport`를 (종목, 생성 시각) 인덱스로 보관하는 SQLite 저장소입니다."""
+
+    def __init__(self, path: str | os.PathLike) -> None:
+        """
+        Args:
+            path: SQLite 파일 경로 (없으면 생성)
+        """
+        self.path = os.fspath(path)
+        if self.path != ":memory:":
+            os.makedirs(os.path.dirname(os.path.abspath(self.path)), exist_ok=True)
+        self._conn = sqlite3.connect(self.path, check_same_thread=False, timeout=30.0)
+        self._conn.executescript(_SCHEMA)
+        self._conn.commit()
+        self._lock = threading.Lock()
+
+    def save(self, report: ResearchReport) -> int:
+        """보고서를 저장하고 행 ID를 반환합니다."""
+        with self._lock:
+            cursor = self._conn.execute(
+                "INSERT INTO reports (ticker, generated_at, report) VALUES (?, ?, ?)",
+                (report.ticker.upper(), report.generated_at.isoformat(), report.model_dump_json()),
+            )
+            self._conn.commit()
+            return cursor.lastrowid
+
+    def latest(self, ticker: str) -> ResearchReport | None:
+        """종목의 가장 최근 보고서를 반환합니다 (없으면 None)."""
+        reports = self.history(ticker, limit=1)
+        return reports[0] if reports else None
+
+    def history(self, ticker: str, limit: int = 10) -> list[ResearchReport]:
+        """종목의 보고서를 최신순으로 반환합니다."""
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT report FROM reports WHERE ticker = ? ORDER BY generated_at DESC LIMIT ?",
+                (ticker.upper(), limit),
+            ).fetchall()
+        return [ResearchReport.model_validate_json(row[0]) for row in rows]
+
+    def close(self) -> None:
+        """SQLite 연결을 닫습니다."""
+        with self._lock:
+            self._conn.close()
+
+
+_report_store: ReportStore | None = None
+_report_store_lock = threading.Lock()
+
+
+def get_report_store() -> ReportStore | None:
+    """설정에 따라 공유 보고서 저장소를 반환합니다 (`report_store_enabled`가 꺼져 있으면 None)."""
+    global _report_store
+    if not settings.report_store_enabled:
+        return None
+    if _report_store is None:
+        with _report_store_lock:
+            if _report_store is None:
+                _report_store = ReportStore(settings.report_store_path)
+    return _report_store
+
+
+def _digest(payload: Any) -> str:
+    text = json.dumps(payload, ensure_ascii=False, sort_keys=True, default=str)
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()[:16]
+
+
+def financial_fingerprint(data) -> str:
+    """`FinancialData`의 펀더멘털 섹션 지문을 계산합니다 (심볼 제외 필드 값 기준)."""
+    return _digest(data.model_dump(exclude={"symbol"}))
+
+
+def news_fingerprint(items) -> str:
+    """뉴스 검색 결과의 감성 분석 섹션 지문을 계산합니다 (URL 집합 기준)."""
+    return _digest(sorted(item.url for item in items))
+
+
+def compute_fingerprints(ticker: str) -> dict[str, str]:
+    """섹션별 입력 데이터 지문을 새로 조회하여 계산합니다 (증분 갱신의 변경 감지용).
+
+    데이터를 가져오지 못한 섹션과 기술적 분석은 지문이 없으므로 항상 다시 생성 대상이 됩니다.
+    조회 결과는 시장 데이터/뉴스 캐시에 남으므로 이어서 실행되는 서브에이전트는 같은 데이터를 재사용합니다.
+
+    Args:
+        ticker: 주식 심볼 (예: "AAPL", "TSLA")
+
+    Returns:
+        dict[str, str]: 섹션 -> 지문
+    """
+    from src.tools.news_search import search_stock_news
+    from src.tools.stock_data import get_financial_data
+
+    fingerprints: dict[str, str] = {}
+    try:
+        fingerprints["fundamental"] = financial_fingerprint(get_financial_data(ticker))
+    except ValueError:
+        pass
+    try:
+        fingerprints["sentiment"] = news_fingerprint(search_stock_news(ticker))
+    except ValueError:
+        pass
+    return fingerprints
+
+
+# 현재 조사 실행에서 도구가 실제로 반환한 데이터의 섹션 지문 (종목, 섹션 -> 지문)
+_observed_fingerprints: ContextVar[tuple[str, dict[str, str]] | None] = ContextVar(
+    "observed_fingerprints", default=None
+)
+
+
+@contextmanager
+def observe_fingerprints(ticker: str) -> Iterator[dict[str, str]]:
+    """조사 실행 동안 서브에이전트 도구가 받은 데이터로 섹션 지문을 모으는 컨텍스트를 엽니다.
+
+    저장되는 지문이 보고서 섹션이 실제로 사용한 데이터와 같도록, 실행이 끝난 뒤 다시 조회하지 않고
+    도구 결과(`observe_section_data`)에서 계산합니다. 기록에서 재사용된 도구 호출(체크포인트 재개)처럼
+    관찰하지 못한 섹션은 지문이 없으므로 다음 증분 갱신 때 다시 생성됩니다.
+
+    Args:
+        ticker: 조사 대상 종목 심볼
+
+    Yields:
+        dict[str, str]: 실행 중 채워지는 섹션 -> 지문
+    """
+    fingerprints: dict[str, str] = {}
+    token = _observed_fingerprints.set((ticker.strip().upper(), fingerprints))
+    try:
+        yield fingerprints
+    finally:
+        _observed_fingerprints.reset(token)
+
+
+def observe_section_data(section: str, ticker: str, fingerprint: Callable[[], str]) -> None:
+    """조사 실행 중이면 대상 종목 도구 결과의 섹션 지문을 기록합니다 (다른 종목 조회는 무시).
+
+    Args:
+        section: `SECTIONS` 키 (예: "fundamental", "sentiment")
+        ticker: 도구가 조회한 종목 심볼
+        fingerprint: 지문을 계산하는 함수 (기록할 때만 호출)
+    """
+    observed = _observed_fingerprints.get()
+    if observed is None or ticker.strip().upper() != observed[0]:
+        return
+    observed[1][section] = fingerprint()
+
+
+def stale_sections(previous: ResearchReport | None, fingerprints: dict[str, str]) -> list[str]:
+    """이전 보고서와 현재 지문을 비교하여 다시 생성할 섹션을 반환합니다.
+
+    Args:
+        previous: 가장 최근 보고서 (없으면 모든 섹션이 대상)
+        fingerprints: `compute_fingerprints` 결과
+
+    Returns:
+        list[str]: 다시 생성할 섹션 (`SECTIONS` 키, 정의 순서)
+    """
+    if previous is None:
+        return list(SECTIONS)
+    stale = []
+    for section, (field, _, _) in SECTIONS.items():
+        current = fingerprints.get(section)
+        if current is None or previous.fingerprints.get(section) != current or not getattr(previous, field):
+            stale.append(section)
+    return stale
+
+
+def _split_sections(markdown: str) -> dict[str, str]:
+    """보고서 마크다운을 `## 제목` 단위로 나눠 필드별 본문으로 반환합니다."""
+    sections: dict[str, str] = {}
+    for block in re.split(r"^##\s+", markdown, flags=re.MULTILINE)[1:]:
+        heading, _, body = block.partition("\n")
+        for keyword, field in _HEADINGS.items():
+            if keyword in heading:
+                sections.setdefault(field, body.strip())
+                break
+    return sections
+
+
+def _subagent_outputs(result: dict) -> dict[str, str]:
+    """에이전트 실행 상태에서 서브에이전트별 결과 텍스트를 꺼냅니다 (`task` 위임과 병렬 위임 모두 지원)."""
+    names: dict[str, str] = {}
+    outputs: dict[str, str] = {}
+    for message in result.get("messages") or []:
+        if isinstance(message, AIMessage):
+            for tool_call in message.tool_calls:
+                if tool_call["name"] == "task":
+                    names[tool_call["id"]] = tool_call["args"].get("subagent_type", "")
+        elif isinstance(message, ToolMessage):
+            if message.tool_call_id in names:
+                outputs[names[message.tool_call_id]] = message.text
+            elif message.name == "run_parallel_analysis":
+                for block in re.split(r"^##\s+", message.text, flags=re.MULTILINE)[1:]:
+                    name, _, body = block.partition("\n")
+                    outputs[name.strip()] = body.strip()
+    return outputs
+
+
+def _conclusion_fields(markdown: str) -> dict[str, Any]:
+    """요약/투자 의견/신뢰도/리스크/결론을 마크다운에서 추출합니다."""
+    sections = _split_sections(markdown)
+    summary_lines = [
+        line
+        for line in sections.get("summary", "").splitlines()
+        if not (_RECOMMENDATION_PATTERN.search(line) or _CONFIDENCE_PATTERN.search(line))
+    ]
+    recommendation = _RECOMMENDATION_PATTERN.search(markdown)
+    confidence = _CONFIDENCE_PATTERN.search(markdown)
+    risks = [
+        line.strip().lstrip("-*").strip()
+        for line in sections.get("key_risks", "").splitlines()
+        if line.strip().startswith(("-", "*"))
+    ]
+    return {
+        "summary": "\n".join(summary_lines).strip() or (markdown.strip() if not sections else ""),
+        "recommendation": recommendation.group(1).strip() if recommendation else "",
+        "confidence_score": min(float(confidence.group(1)) / 100, 1.0) if confidence else 0.0,
+        "key_risks": risks,
+        "conclusion": sections.get("conclusion", ""),
+    }
+
+
+def build_report(
+    ticker: str, result: dict, markdown: str, fingerprints: dict[str, str] | None = None
+) -> ResearchReport:
+    """전체 조사 실행 결과를 `ResearchReport`로 변환합니다.
+
+    분석 섹션은 서브에이전트 결과를 우선 사용하고, 없으면 보고서 마크다운의 해당 제목 아래 본문을 사용합니다.
+
+    Args:
+        ticker: 주식 심볼
+        result: 에이전트 실행 결과 상태
+        markdown: 최종 보고서 텍스트
+        fingerprints: 섹션별 입력 데이터 지문
+
+    Returns:
+        ResearchReport: 저장할 보고서
+    """
+    outputs = _subagent_outputs(result)
+    sections = _split_sections(markdown)
+    analyses = {field: outputs.get(name) or sections.get(field, "") for field, name, _ in SECTIONS.values()}
+    return ResearchReport(
+        ticker=ticker.upper(),
+        **analyses,
+        **_conclusion_fields(markdown),
+        iteration_count=sum(1 for message in result.get("messages") or [] if isinstance(message, AIMessage)),
+        fingerprints=fingerprints or {},
+        refreshed_sections=list(SECTIONS),
+    )
+
+
+def record_report(
+    ticker: str, result: dict, markdown: str, fingerprints: dict[str, str] | None = None
+) -> ResearchReport | None:
+    """보고서 저장소가 켜져 있으면 전체 조사 결과를 섹션 지문과 함께 저장합니다.
+
+    저장에 실패해도 조사 결과는 이미 나왔으므로 예외를 올리지 않고 경고 로그만 남깁니다.
+
+    Args:
+        ticker: 주식 심볼
+        result: 에이전트 실행 결과 상태
+        markdown: 최종 보고서 텍스트
+        fingerprints: 실행 중 관찰한 섹션 지문 (`observe_fingerprints`, 없는 섹션은 다음 갱신 때 다시 생성)
+
+    Returns:
+        ResearchReport | None: 저장한 보고서 (저장소가 꺼져 있거나 저장에 실패하면 None)
+    """
+    try:
+        store = get_report_store()
+        if store is None:
+            return None
+        report = build_report(ticker, result, markdown, fingerprints)
+        store.save(report)
+    except Exception:
+        logger.warning("보고서 저장 중 오류 발생 (%s), 보고서는 저장하지 않고 반환합니다.", ticker, exc_info=True)
+        return None
+    return report
+
+
+def render_report(report: ResearchReport) -> str:
+    """`ResearchReport`를 에이전트 보고서와 같은 형식의 마크다운으로 변환합니다."""
+    risks = "\n".join(f"- {risk}" for risk in report.key_risks) or "- (없음)"
+    parts = [
+        f"# {report.ticker} 주식 분석 보고서",
+        f"생성 시각: {report.generated_at.isoformat(timespec='seconds')}",
+        f"## 요약\n- 투자 의견: {report.recommendation or '-'}\n- 신뢰도: {report.confidence_score:.0%}\n\n"
+        f"{report.summary}".rstrip(),
+    ]
+    for section, (field, _, title) in SECTIONS.items():
+        marker = " (갱신)" if section in report.refreshed_sections else ""
+        parts.append(f"## {title}{marker}\n{getattr(report, field) or '(데이터 없음)'}")
+    parts.append(f"## 주요 리스크\n{risks}")
+    parts.append(f"## 결론\n{report.conclusion or '-'}")
+    return "\n\n".join(parts) + "\n"
+
+
+def _run_subagents(ticker: str, names: list[str], config: dict) -> dict[str, str | None]:
+    """서브에이전트를 동시에 실행하고 이름별 결과 텍스트를 반환합니다 (실패하면 None)."""
+    from src.agent import get_model
+    from src.subagents import SUBAGENTS
+    from src.subagents.parallel import build_task_description, compile_subagent
+
+    model = get_model()
+    specs = SUBAGENTS
+    if settings.technical_fast_path:
+        from src.subagents.technical_fast_path import with_technical_fast_path
+
+        specs = with_technical_fast_path(SUBAGENTS, model)
+    graphs = {spec["name"]: compile_subagent(spec, model) for spec in specs if spec["name"] in names}
+
+    def run_one(name: str) -> str | None:
+        state = {"messages": [HumanMessage(content=build_task_description(name, ticker))]}
+        try:
+            messages = graphs[name].invoke(state, {**config, "run_name": name}).get("messages") or []
+        except Exception:
+            return None
+        return messages[-1].text if messages else None
+
+    if not graphs:
+        return {}
+    with ThreadPoolExecutor(max_workers=len(graphs), thread_name_prefix="refresh") as executor:
+        # 콜백/추적 컨텍스트가 작업 스레드에도 전달되도록 컨텍스트를 복사하여 실행
+        futures = {name: executor.submit(contextvars.copy_context().run, run_one, name) for name in graphs}
+        return {name: future.result() for name, future in futures.items()}
+
+
+def refresh_research(ticker: str, agent=None) -> str:
+    """최근 보고서에서 바뀐 섹션만 다시 생성하여 새 보고서를 만들고 저장합니다.
+
+    저장된 보고서가 없으면 전체 조사를 실행합니다. 다시 생성하지 못한 섹션은 이전 내용을 유지하고
+    지문을 갱신하지 않으므로 다음 갱신 때 다시 시도됩니다.
+
+    Args:
+        ticker: 주식 심볼 (예: "AAPL", "TSLA")
+        agent: 저장된 보고서가 없을 때 전체 조사에 사용할 에이전트 (None이면 싱글톤 에이전트 사용)
+
+    Returns:
+        str: 보고서 마크다운
+
+    Raises:
+        ValueError: 보고서 저장소가 꺼져 있거나 재종합 중 오류가 발생한 경우
+    """
+    from src.agent import build_research_config, get_model, run_research
+    from src.tracing import trace_run
+
+    store = get_report_store()
+    if store is None:
+        raise ValueError("증분 갱신을 사용하려면 REPORT_STORE_ENABLED를 켜야 합니다.")
+
+    symbol = ticker.strip().upper()
+    previous = store.latest(symbol)
+    if previous is None:
+        return run_research(symbol, agent=agent)
+
+    with trace_run(symbol) as trace:
+        config = build_research_config(trace)
+        fingerprints = compute_fingerprints(symbol)
+        stale = stale_sections(previous, fingerprints)
+        with observe_fingerprints(symbol) as observed:
+            outputs = _run_subagents(symbol, [SECTIONS[section][1] for section in stale], config)
+
+        analyses = {field: getattr(previous, field) for field, _, _ in SECTIONS.values()}
+        new_fingerprints = dict(previous.fingerprints)
+        refreshed = []
+        for section in stale:
+            field, name, _ = SECTIONS[section]
+            if outputs.get(name):
+                analyses[field] = outputs[name]
+                refreshed.append(section)
+                # 서브에이전트가 실제로 받은 데이터의 지문을 우선 사용
+                current = observed.get(section) or fingerprints.get(section)
+                if current is not None:
+                    new_fingerprints[section] = current
+
+        sections_text = "\n\n".join(
+            f"## {title}{' (갱신)' if section in refreshed else ''}\n{analyses[field]}"
+            for section, (field, _, title) in SECTIONS.items()
+        )
+        try:
+            response = get_model().invoke(
+                [
+                    SystemMessage(content=REPORT_REFRESH_PROMPT),
+                    HumanMessage(content=f"# {symbol} 분석 섹션\n\n{sections_text}"),
+                ],
+                config,
+            )
+        except Exception as e:
+            raise ValueError(f"보고서 재종합 중 오류 발생: {str(e)}") from e
+
+    report = ResearchReport(
+        ticker=symbol,
+        generated_at=datetime.now(),
+        **analyses,
+        **_conclusion_fields(response.text),
+        iteration_count=1,
+        fingerprints=new_fingerprints,
+        refreshed_sections=refreshed,
+    )
+    store.save(report)
+    return render_report(report)
@@ -0,0 +1,198 @@
+"""종목 유니버스를 사전 선별하여 상위 종목만 에이전트 조사로 넘기는 스크리너 모듈입니다.
+
+전체 Deep Agent 실행은 종목당 수십 초와 LLM 비용이 들기 때문에, 먼저 캐시된 데이터만으로
+유니버스 전체를 배열 단위로 평가합니다.
+
+1. 기술적 시그널: `get_technical_summary`와 같은 규칙(50일 이동평균, RSI)을 (날짜 x 종목) 행렬에 한 번에 적용
+   (가격 이력이 행렬의 마지막 날짜보다 먼저 끝난 거래 정지/상장 폐지 종목은 제외)
+2. 재무 필터: 시그널을 통과한 종목만 `FinancialData`의 PER, 부채비율, EPS 조건 적용
+3. 순위: 추세 강도, RSI 여유, 이익수익률, 낮은 부채비율의 백분위 순위 평균
+"""
+
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import asdict, dataclass, field
+
+import numpy as np
+
+from src.config import settings
+from src.data.compact import Fundamentals
+from src.data.market import get_fundamentals, get_price_matrix
+from src.tools.analysis import determine_signals, latest_moving_averages, latest_rsi
+
+
+@dataclass
+class ScreenCriteria:
+    """스크리닝 조건을 나타내는 클래스입니다 (None인 조건은 적용하지 않음)."""
+
+    signals: tuple[str, ...] = ("BUY",)
+    max_pe: float | None = None
+    max_debt_to_equity: float | None = None
+    min_eps: float | None = None
+    top_n: int = 10
+
+    @classmethod
+    def from_settings(cls) -> "ScreenCriteria":
+        """설정(SCREEN_*)에서 기본 조건을 생성합니다."""
+        return cls(
+            signals=tuple(settings.screen_signals),
+            max_pe=settings.screen_max_pe,
+            max_debt_to_equity=settings.screen_max_debt_to_equity,
+            min_eps=settings.screen_min_eps,
+            top_n=settings.screen_top_n,
+        )
+
+
+@dataclass
+class ScreenResult:
+    """스크리닝을 통과한 종목 하나의 평가 결과를 나타내는 클래스입니다."""
+
+    symbol: str
+    score: float  # 0-1, 높을수록 상위
+    signal: str
+    current_price: float
+    ma_50: float | None
+    rsi: float
+    pe_ratio: float | None
+    debt_to_equity: float | None
+    eps: float | None
+
+    def to_dict(self) -> dict:
+        """결과를 직렬화 가능한 딕셔너리로 변환합니다."""
+        return asdict(self)
+
+
+@dataclass
+class ScreenSummary:
+    """스크리닝 전체 결과를 나타내는 클래스입니다."""
+
+    universe: int  # 평가한 종목 수
+    evaluated: int  # 가격 데이터가 충분하고 최신인 종목 수
+    passed: int  # 조건을 통과한 종목 수
+    results: list[ScreenResult] = field(default_factory=list)  # 점수 순 상위 N개
+
+    @property
+    def tickers(self) -> list[str]:
+        """상위 종목 심볼 리스트 (점수 순)"""
+        return [result.symbol for result in self.results]
+
+
+def _load_fundamentals(symbols: list[str], workers: int) -> list[Fundamentals]:
+    """종목별 재무 레코드를 재무 지표 캐시를 거쳐 조회합니다 (캐시 미스는 워커 스레드로 동시에 조회)."""
+
+    def load(symbol: str) -> Fundamentals:
+        try:
+            return get_fundamentals(symbol)
+        except Exception:
+            return Fundamentals(symbol)
+
+    with ThreadPoolExecutor(max_workers=max(1, workers), thread_name_prefix="screen") as executor:
+        return list(executor.map(load, symbols))
+
+
+def _column(records: list[Fundamentals], name: str) -> np.ndarray:
+    """재무 레코드의 한 필드를 float 배열로 변환합니다 (없는 값은 NaN)."""
+    return np.array([np.nan if (value := getattr(record, name)) is None else value for record in records], dtype=float)
+
+
+def _percentile_rank(values: np.ndarray) -> np.ndarray:
+    """값이 클수록 1에 가까운 백분위 순위를 반환합니다 (NaN은 0)."""
+    ranks = np.zeros(len(values))
+    valid = ~np.isnan(values)
+    count = int(valid.sum())
+    if count == 1:
+        ranks[valid] = 1.0
+    elif count > 1:
+        order = np.argsort(np.argsort(values[valid], kind="stable"), kind="stable")
+        ranks[valid] = order / (count - 1)
+    return ranks
+
+
+def _optional(value: float) -> float | None:
+    return None if np.isnan(value) else round(float(value), 2)
+
+
+def screen_universe(tickers: list[str], criteria: ScreenCriteria | None = None, workers: int = 8) -> ScreenSummary:
+    """유니버스 전체에 기술적 시그널과 재무 필터를 적용하고 점수 순 상위 N개를 반환합니다.
+
+    가격 이력은 일괄 조회 한 번(로컬 OHLCV 저장소/압축 캐시 재사용)으로 받고, 재무 지표는 기술적 시그널을
+    통과한 종목만 긴 유효 시간의 재무 지표 캐시(`get_fundamentals`)로 조회하므로, 캐시가 채워져 있으면
+    수백 종목도 몇 초 안에 끝납니다. 콜드 스타트의 종목별 정보 조회는 업스트림 속도 제한을 따릅니다.
+
+    Args:
+        tickers: 평가할 종목 심볼 리스트 (예: S&P 500 구성 종목)
+        criteria: 스크리닝 조건 (기본값: 설정의 SCREEN_* 값)
+        workers: 종목 정보 캐시 미스를 조회할 최대 동시 요청 수
+
+    Returns:
+        ScreenSummary: 평가/통과 종목 수와 점수 순 상위 결과
+
+    Raises:
+        ValueError: 데이터 조회 또는 계산 중 오류 발생
+    """
+    criteria = criteria or ScreenCriteria.from_settings()
+    symbols = list(dict.fromkeys(ticker.strip().upper() for ticker in tickers if ticker.strip()))
+    try:
+        matrix = get_price_matrix(symbols, period="1y")
+        if len(matrix) == 0:
+            return ScreenSummary(universe=len(symbols), evaluated=0, passed=0)
+
+        # 기술적 시그널 (get_technical_summary와 같은 규칙, 종목별 자신의 봉만 float64로 계산)
+        closes = matrix.packed()[0].astype(np.float64)
+        current = matrix.last_close
+        ma_50 = latest_moving_averages(closes, [50])[50]
+        rsi = latest_rsi(closes)
+        signals = determine_signals(current, ma_50, rsi)
+        fresh = matrix.last_dates == matrix.dates[-1]
+        evaluated = ~np.isnan(current) & ~np.isnan(rsi) & fresh
+
+        # 재무 필터는 시그널을 통과한 종목만 조회 (데이터가 없는 종목은 해당 조건을 통과하지 못함)
+        candidates = np.flatnonzero(evaluated & np.isin(signals, criteria.signals))
+        records = _load_fundamentals([matrix.symbols[i] for i in candidates], workers)
+        pe = np.full(len(matrix.symbols), np.nan)
+        debt_to_equity = np.full(len(matrix.symbols), np.nan)
+        eps = np.full(len(matrix.symbols), np.nan)
+        pe[candidates] = _column(records, "pe_ratio")
+        debt_to_equity[candidates] = _column(records, "debt_to_equity")
+        eps[candidates] = _column(records, "eps")
+
+        mask = np.zeros(len(matrix.symbols), dtype=bool)
+        mask[candidates] = True
+        with np.errstate(invalid="ignore"):
+            if criteria.max_pe is not None:
+                mask &= (pe > 0) & (pe <= criteria.max_pe)
+            if criteria.max_debt_to_equity is not None:
+                mask &= debt_to_equity <= criteria.max_debt_to_equity
+            if criteria.min_eps is not None:
+                mask &= eps >= criteria.min_eps
+
+        # 순위 점수: 통과 종목 안에서 각 지표의 백분위 순위 평균
+        passed = np.flatnonzero(mask)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            metrics = [
+                current[passed] / ma_50[passed] - 1,  # 추세 강도
+                70 - rsi[passed],  # 과매수까지 여유
+                np.where(pe[passed] > 0, 1 / pe[passed], np.nan),  # 이익수익률
+                -debt_to_equity[passed],  # 낮은 부채비율
+            ]
+        scores = np.mean([_percentile_rank(metric) for metric in metrics], axis=0) if len(passed) else np.array([])
+
+        ranked = passed[np.argsort(-scores, kind="stable")][: max(0, criteria.top_n)]
+        order = dict(zip(passed.tolist(), scores.tolist(), strict=True))
+        results = [
+            ScreenResult(
+                symbol=matrix.symbols[i],
+                score=round(order[i], 4),
+                signal=str(signals[i]),
+                current_price=round(float(current[i]), 2),
+                ma_50=_optional(ma_50[i]),
+                rsi=round(float(rsi[i]), 2),
+                pe_ratio=_optional(pe[i]),
+                debt_to_equity=_optional(debt_to_equity[i]),
+                eps=_optional(eps[i]),
+            )
+            for i in ranked
+        ]
+        return ScreenSummary(universe=len(symbols), evaluated=int(evaluated.sum()), passed=len(passed), results=results)
+
+    except Exception as e:
+        raise ValueError(f"유니버스 스크리닝 중 오류 발생: {str(e)}") from e
@@ -0,0 +1,375 @@
+"""에이전트와 데이터 캐시를 메모리에 유지하는 상주형 조사 서비스 모듈입니다.
+
+프로세스를 띄울 때 한 번만 모델 클라이언트/도구/에이전트 그래프를 만들고, 이후 요청은
+제한된 크기의 작업 큐와 고정된 수의 워커 스레드로 처리합니다.
+
+HTTP 엔드포인트 (JSON):
+
+- `POST /research`: `{"ticker": "AAPL"}` 또는 `{"tickers": ["AAPL", "MSFT"]}` -> 202, 작업 정보
+- `GET /jobs/<id>`: 작업 상태 (완료 시 보고서 포함, `?wait=초`로 완료까지 대기 가능)
+- `GET /jobs`: 최근 작업 목록 (보고서 제외)
+- `GET /health`: 큐 길이, 실행 중 작업 수, 캐시 통계
+"""
+
+import json
+import queue
+import threading
+import time
+import uuid
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from datetime import datetime
+from http import HTTPStatus
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlparse
+
+from src.agent import get_agent, run_research
+from src.config import settings
+from src.tickers import normalize_ticker
+
+# 워커가 종료 신호를 확인하는 간격 (초)
+_POLL_INTERVAL = 0.5
+
+
+@dataclass
+class ResearchJob:
+    """서비스가 처리하는 조사 작업 하나를 나타내는 클래스입니다."""
+
+    id: str
+    ticker: str
+    status: str = "queued"  # "queued", "running", "succeeded", "failed"
+    created_at: str = field(default_factory=lambda: datetime.now().isoformat(timespec="seconds"))
+    started_at: str | None = None
+    finished_at: str | None = None
+    duration_seconds: float | None = None
+    report: str | None = None
+    error: str | None = None
+    done: threading.Event = field(default_factory=threading.Event, repr=False)
+
+    @property
+    def finished(self) -> bool:
+        """작업이 끝났는지(성공/실패) 여부"""
+        return self.status in ("succeeded", "failed")
+
+    def to_dict(self, include_report: bool = True) -> dict:
+        """작업을 직렬화 가능한 딕셔너리로 변환합니다."""
+        data = {
+            "id": self.id,
+            "ticker": self.ticker,
+            "status": self.status,
+            "created_at": self.created_at,
+            "started_at": self.started_at,
+            "finished_at": self.finished_at,
+            "duration_seconds": self.duration_seconds,
+            "error": self.error,
+        }
+        if include_report:
+            data["report"] = self.report
+        return data
+
+
+class ResearchService:
+    """따뜻한(warm) 에이전트를 공유하는 워커 풀과 제한된 작업 큐를 관리하는 클래스입니다.
+
+    같은 종목의 작업이 이미 대기/실행 중이면 새 작업을 만들지 않고 기존 작업을 반환합니다.
+    완료된 작업은 최근 `max_jobs`개만 보관합니다.
+    """
+
+    def __init__(self, workers: int, max_queue: int, max_jobs: int = 1000, agent=None) -> None:
+        """
+        Args:
+            workers: 동시에 실행할 최대 조사 작업 수
+            max_queue: 대기열에 쌓을 수 있는 최대 작업 수
+            max_jobs: 조회용으로 보관할 최대 작업 수
+            agent: 사용할 에이전트 (None이면 `start()`에서 싱글톤 에이전트 생성)
+        """
+        if workers <= 0:
+            raise ValueError("workers는 1 이상이어야 합니다.")
+        if max_queue <= 0:
+            raise ValueError("max_queue는 1 이상이어야 합니다.")
+
+        self.workers = workers
+        self.max_jobs = max_jobs
+        self.agent = agent
+        self._queue: queue.Queue = queue.Queue(maxsize=max_queue)
+        self._jobs: OrderedDict[str, ResearchJob] = OrderedDict()
+        self._active: dict[str, ResearchJob] = {}  # ticker -> 대기/실행 중 작업
+        self._lock = threading.Lock()
+        self._threads: list[threading.Thread] = []
+        self._running = 0
+        self._stop = threading.Event()
+
+    def start(self) -> None:
+        """에이전트를 미리 생성하고 워커 스레드를 시작합니다."""
+        if self.agent is None:
+            self.agent = get_agent()
+        for index in range(self.workers):
+            thread = threading.Thread(target=self._work, name=f"research-service-{index}", daemon=True)
+            thread.start()
+            self._threads.append(thread)
+
+    def shutdown(self, wait: bool = True) -> None:
+        """워커를 종료합니다.
+
+        새 작업 접수를 멈추고 대기 중인 작업은 실패(취소)로 처리합니다. 실행 중인 작업은 끝까지 진행되며,
+        대기열이 가득 차 있어도 블로킹 없이 바로 반환합니다 (`wait=True`이면 실행 중인 작업이 끝날 때까지 대기).
+
+        Args:
+            wait: 워커 스레드가 종료될 때까지 기다릴지 여부
+        """
+        # submit과 같은 잠금 안에서 설정하여, 종료 후 대기열에 새 작업이 남지 않도록 함
+        with self._lock:
+            self._stop.set()
+        self._cancel_pending()
+        if wait:
+            for thread in self._threads:
+                thread.join()
+        self._threads.clear()
+
+    def _cancel_pending(self) -> None:
+        """대기열에 남은 작업을 모두 꺼내 실패(취소)로 처리합니다."""
+        while True:
+            try:
+                job = self._queue.get_nowait()
+            except queue.Empty:
+                return
+            self._finish(job, None, "failed", "서비스 종료로 취소되었습니다.")
+
+    def submit(self, ticker: str) -> ResearchJob:
+        """조사 작업을 대기열에 추가합니다.
+
+        Args:
+            ticker: 주식 심볼 (예: "AAPL", "TSLA")
+
+        Returns:
+            ResearchJob: 새 작업 또는 같은 종목의 대기/실행 중 작업
+
+        Raises:
+            ValueError: 종목 심볼 형식이 올바르지 않은 경우
+            queue.Full: 대기열이 가득 찼거나 서비스가 종료 중인 경우
+        """
+        symbol = normalize_ticker(ticker)
+
+        with self._lock:
+            if self._stop.is_set():
+                raise queue.Full
+            active = self._active.get(symbol)
+            if active is not None:
+                return active
+
+            job = ResearchJob(id=uuid.uuid4().hex[:12], ticker=symbol)
+            self._queue.put_nowait(job)
+            self._active[symbol] = job
+            self._jobs[job.id] = job
+            self._evict()
+        return job
+
+    def get(self, job_id: str) -> ResearchJob | None:
+        """작업 ID로 작업을 조회합니다."""
+        with self._lock:
+            return self._jobs.get(job_id)
+
+    def recent(self, limit: int = 50) -> list[ResearchJob]:
+        """최근에 생성된 작업을 최신순으로 반환합니다."""
+        with self._lock:
+            return list(reversed(self._jobs.values()))[:limit]
+
+    def stats(self) -> dict:
+        """큐와 작업 상태 통계를 반환합니다."""
+        with self._lock:
+            counts: dict[str, int] = {}
+            for job in self._jobs.values():
+                counts[job.status] = counts.get(job.status, 0) + 1
+            return {
+                "workers": self.workers,
+                "running": self._running,
+                "queued": self._queue.qsize(),
+                "queue_capacity": self._queue.maxsize,
+                "jobs": counts,
+            }
+
+    def _evict(self) -> None:
+        """보관 한도를 넘은 오래된 완료 작업을 제거합니다 (잠금 상태에서 호출)."""
+        overflow = len(self._jobs) - self.max_jobs
+        if overflow <= 0:
+            return
+        for job_id in [job_id for job_id, job in self._jobs.items() if job.finished][:overflow]:
+            del self._jobs[job_id]
+
+    def _finish(self, job: ResearchJob, report: str | None, status: str, error: str | None) -> None:
+        """작업 결과를 기록하고 기다리는 요청을 깨웁니다."""
+        with self._lock:
+            job.report, job.status, job.error = report, status, error
+            job.finished_at = datetime.now().isoformat(timespec="seconds")
+            if self._active.get(job.ticker) is job:
+                del self._active[job.ticker]
+        job.done.set()
+
+    def _work(self) -> None:
+        """대기열에서 작업을 꺼내 실행하는 워커 루프입니다 (종료 신호를 주기적으로 확인)."""
+        while not self._stop.is_set():
+            try:
+                job = self._queue.get(timeout=_POLL_INTERVAL)
+            except queue.Empty:
+                continue
+            if self._stop.is_set():
+                self._finish(job, None, "failed", "서비스 종료로 취소되었습니다.")
+                break
+
+            with self._lock:
+                job.status = "running"
+                job.started_at = datetime.now().isoformat(timespec="seconds")
+                self._running += 1
+
+            started = time.perf_counter()
+            try:
+                report = run_research(job.ticker, agent=self.agent)
+                status, error = "succeeded", None
+            except Exception as e:
+                report, status, error = None, "failed", str(e)
+
+            with self._lock:
+                job.duration_seconds = round(time.perf_counter() - started, 3)
+                self._running -= 1
+            self._finish(job, report, status, error)
+
+
+class _ServiceRequestHandler(BaseHTTPRequestHandler):
+    """조사 서비스 HTTP 요청 핸들러입니다."""
+
+    server: "ResearchHTTPServer"
+    protocol_version = "HTTP/1.1"
+
+    def _send_json(self, status: HTTPStatus, payload: dict | list) -> None:
+        body = json.dumps(payload, ensure_ascii=False).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json; charset=utf-8")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def _error(self, status: HTTPStatus, message: str) -> None:
+        self._send_json(status, {"error": message})
+
+    def do_GET(self) -> None:  # noqa: N802 - BaseHTTPRequestHandler 규약
+        url = urlparse(self.path)
+        service = self.server.service
+
+        if url.path == "/health":
+            from src.data import get_cache_stats, get_upstream_scheduler
+
+            self._send_json(
+                HTTPStatus.OK,
+                {
+                    "status": "ok",
+                    **service.stats(),
+                    "market_cache": get_cache_stats(),
+                    "upstream": get_upstream_scheduler().stats(),
+                },
+            )
+        elif url.path == "/jobs":
+            self._send_json(HTTPStatus.OK, [job.to_dict(include_report=False) for job in service.recent()])
+        elif url.path.startswith("/jobs/"):
+            job = service.get(url.path.removeprefix("/jobs/"))
+            if job is None:
+                self._error(HTTPStatus.NOT_FOUND, "작업을 찾을 수 없습니다.")
+                return
+            try:
+                wait = float(parse_qs(url.query).get("wait", ["0"])[0])
+            except ValueError:
+                self._error(HTTPStatus.BAD_REQUEST, "wait는 초 단위 숫자여야 합니다.")
+                return
+            if wait > 0:
+                job.done.wait(min(wait, settings.service_max_wait))
+            self._send_json(HTTPStatus.OK, job.to_dict())
+        else:
+            self._error(HTTPStatus.NOT_FOUND, f"알 수 없는 경로: {url.path}")
+
+    def do_POST(self) -> None:  # noqa: N802 - BaseHTTPRequestHandler 규약
+        if urlparse(self.path).path != "/research":
+            self._error(HTTPStatus.NOT_FOUND, f"알 수 없는 경로: {self.path}")
+            return
+
+        try:
+            length = int(self.headers.get("Content-Length") or 0)
+            payload = json.loads(self.rfile.read(length) or b"{}")
+            many = "tickers" in payload
+            tickers = payload["tickers"] if many else [payload["ticker"]]
+            if not isinstance(tickers, list) or not all(isinstance(ticker, str) for ticker in tickers):
+                raise ValueError("tickers는 문자열 리스트여야 합니다.")
+        except (ValueError, KeyError, TypeError) as e:
+            self._error(
+                HTTPStatus.BAD_REQUEST, f'요청 본문은 {{"ticker": ...}} 또는 {{"tickers": [...]}}이어야 합니다: {e}'
+            )
+            return
+
+        # 일부만 접수되지 않도록 모든 심볼을 먼저 검증
+        invalid = []
+        for ticker in tickers:
+            try:
+                normalize_ticker(ticker)
+            except ValueError:
+                invalid.append(ticker)
+        if invalid:
+            self._send_json(
+                HTTPStatus.BAD_REQUEST, {"error": "올바르지 않은 종목 심볼이 있습니다.", "invalid": invalid}
+            )
+            return
+
+        jobs = []
+        try:
+            for ticker in tickers:
+                jobs.append(self.server.service.submit(ticker))
+        except queue.Full:
+            self._send_json(
+                HTTPStatus.SERVICE_UNAVAILABLE,
+                {
+                    "error": "작업 대기열이 가득 찼습니다.",
+                    "accepted": [job.to_dict(include_report=False) for job in jobs],
+                },
+            )
+            return
+
+        accepted = [job.to_dict(include_report=False) for job in jobs]
+        self._send_json(HTTPStatus.ACCEPTED, accepted if many else accepted[0])
+
+    def log_message(self, format: str, *args) -> None:
+        print(f"[service] {self.address_string()} {format % args}")
+
+
+class ResearchHTTPServer(ThreadingHTTPServer):
+    """조사 서비스 인스턴스를 핸들러와 공유하는 HTTP 서버입니다."""
+
+    daemon_threads = True
+
+    def __init__(self, address: tuple[str, int], service: ResearchService) -> None:
+        super().__init__(address, _ServiceRequestHandler)
+        self.service = service
+
+
+def serve(host: str | None = None, port: int | None = None, workers: int | None = None) -> None:
+    """조사 서비스를 시작하고 종료 신호(Ctrl+C)까지 요청을 처리합니다.
+
+    Args:
+        host: 바인드할 주소 (기본값: SERVICE_HOST)
+        port: 바인드할 포트 (기본값: SERVICE_PORT)
+        workers: 동시에 실행할 최대 조사 작업 수 (기본값: SERVICE_WORKERS)
+    """
+    service = ResearchService(
+        workers=workers or settings.service_workers,
+        max_queue=settings.service_queue_size,
+        max_jobs=settings.service_max_jobs,
+    )
+    print("에이전트를 준비하는 중...")
+    service.start()
+
+    server = ResearchHTTPServer((host or settings.service_host, port or settings.service_port), service)
+    bound_host, bound_port = server.server_address[:2]
+    print(f"조사 서비스 시작: http://{bound_host}:{bound_port} (워커 {service.workers}개)")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        print("\n조사 서비스를 종료합니다...")
+    finally:
+        server.server_close()
+        service.shutdown(wait=False)
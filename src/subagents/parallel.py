@@ -0,0 +1,201 @@
+"""세 분석 서브에이전트를 동시에 실행하는 병렬 위임 도구를 정의하는 모듈입니다.
+
+서브에이전트는 deepagents의 `task` 위임과 같은 기본 미들웨어(할 일 목록, 파일시스템, 대화 요약,
+프롬프트 캐싱, 누락된 도구 호출 보정)로 구성합니다. 동기 실행에서 시간 초과된 서브에이전트는
+스레드를 강제로 멈출 수 없으므로 취소 신호를 보내고, 서브에이전트는 다음 LLM 호출 전에 이를 확인하여
+중단합니다 (이미 진행 중인 LLM 호출 하나는 끝까지 실행됨). 비동기 실행은 작업 자체를 취소합니다.
+"""
+
+import asyncio
+import contextvars
+import threading
+from concurrent.futures import ThreadPoolExecutor, wait
+from contextvars import ContextVar
+from typing import Any
+
+from langchain.agents import create_agent
+from langchain.agents.middleware import AgentMiddleware, HumanInTheLoopMiddleware
+from langchain_core.language_models import BaseChatModel
+from langchain_core.messages import HumanMessage
+from langchain_core.runnables import Runnable
+from langchain_core.tools import StructuredTool
+
+# 서브에이전트별 작업 지시문
+_TASK_TEMPLATES = {
+    "fundamental-analyst": "{ticker} 종목의 펀더멘털 분석(재무제표, 밸류에이션, 수익성)을 수행하세요.",
+    "technical-analyst": "{ticker} 종목의 기술적 분석(이동평균, RSI, 매매 시그널)을 수행하세요.",
+    "sentiment-analyst": "{ticker} 종목의 최신 뉴스와 시장 감성을 분석하세요.",
+}
+
+# deepagents `create_deep_agent`가 서브에이전트에 적용하는 대화 요약 기준과 같은 값
+_SUMMARY_MAX_TOKENS = 170000
+_SUMMARY_MESSAGES_TO_KEEP = 6
+
+# 현재 작업 스레드에서 실행 중인 서브에이전트의 취소 신호 (결과를 더 기다리지 않으면 설정됨)
+_cancel_event: ContextVar[threading.Event | None] = ContextVar("subagent_cancel_event", default=None)
+
+
+class _CancellationMiddleware(AgentMiddleware):
+    """LLM 호출 전에 취소 신호를 확인하여 시간 초과된 서브에이전트를 멈추는 미들웨어입니다."""
+
+    def before_model(self, state: Any, runtime: Any) -> dict[str, Any] | None:
+        event = _cancel_event.get()
+        if event is not None and event.is_set():
+            raise TimeoutError("시간 초과로 서브에이전트 실행을 중단했습니다.")
+        return None
+
+    async def abefore_model(self, state: Any, runtime: Any) -> dict[str, Any] | None:
+        return self.before_model(state, runtime)
+
+
+def subagent_middleware(model: BaseChatModel) -> list[AgentMiddleware]:
+    """deepagents가 `task` 위임 서브에이전트에 적용하는 것과 같은 기본 미들웨어를 생성합니다.
+
+    Args:
+        model: 대화 요약에 사용할 LLM
+
+    Returns:
+        list[AgentMiddleware]: 할 일 목록, 파일시스템, 대화 요약, 프롬프트 캐싱, 도구 호출 보정 미들웨어
+    """
+    from deepagents.middleware.filesystem import FilesystemMiddleware
+    from deepagents.middleware.patch_tool_calls import PatchToolCallsMiddleware
+    from langchain.agents.middleware import SummarizationMiddleware, TodoListMiddleware
+    from langchain_anthropic.middleware import AnthropicPromptCachingMiddleware
+
+    return [
+        TodoListMiddleware(),
+        FilesystemMiddleware(),
+        SummarizationMiddleware(
+            model=model,
+            max_tokens_before_summary=_SUMMARY_MAX_TOKENS,
+            messages_to_keep=_SUMMARY_MESSAGES_TO_KEEP,
+        ),
+        AnthropicPromptCachingMiddleware(unsupported_model_behavior="ignore"),
+        PatchToolCallsMiddleware(),
+    ]
+
+
+def compile_subagent(spec: dict[str, Any], model: BaseChatModel) -> Runnable:
+    """서브에이전트 정의를 deepagents `task` 위임과 같은 방식으로 실행 가능한 그래프로 변환합니다.
+
+    기본 미들웨어 뒤에 정의의 `middleware`와 `interrupt_on`을 적용하고, 시간 초과 시 중단할 수 있도록
+    취소 확인 미들웨어를 추가합니다.
+
+    Args:
+        spec: deepagents 서브에이전트 정의 (`runnable`이 있으면 그대로 사용)
+        model: 서브에이전트가 사용할 LLM
+
+    Returns:
+        Runnable: `{"messages": [...]}` 상태를 받아 실행하는 그래프
+    """
+    if "runnable" in spec:
+        return spec["runnable"]
+    subagent_model = spec.get("model", model)
+    middleware = [*subagent_middleware(subagent_model), *spec.get("middleware", [])]
+    if spec.get("interrupt_on"):
+        middleware.append(HumanInTheLoopMiddleware(interrupt_on=spec["interrupt_on"]))
+    middleware.append(_CancellationMiddleware())
+    return create_agent(subagent_model, system_prompt=spec["system_prompt"], tools=spec["tools"], middleware=middleware)
+
+
+def build_task_description(name: str, ticker: str, instructions: str = "") -> str:
+    """서브에이전트에 전달할 작업 설명을 생성합니다."""
+    template = _TASK_TEMPLATES.get(name, "{ticker} 종목을 분석하세요.")
+    description = template.format(ticker=ticker.strip().upper())
+    if instructions:
+        description += f"\n\n추가 지시사항: {instructions}"
+    return description
+
+
+def _final_text(result: dict) -> str:
+    """서브에이전트 실행 결과에서 마지막 메시지 텍스트를 꺼냅니다."""
+    messages = result.get("messages") or []
+    if not messages:
+        return "(결과 없음)"
+    return messages[-1].text
+
+
+def _format_results(names: list[str], results: dict[str, str]) -> str:
+    """서브에이전트별 결과를 하나의 문자열로 합칩니다."""
+    sections = [f"## {name}\n{results[name]}" for name in names]
+    return "\n\n".join(sections)
+
+
+def create_parallel_analysis_tool(
+    model: BaseChatModel, subagents: list[dict[str, Any]], timeout: float
+) -> StructuredTool:
+    """분석 서브에이전트를 동시에 실행하는 `run_parallel_analysis` 도구를 생성합니다.
+
+    Args:
+        model: 서브에이전트가 사용할 LLM
+        subagents: 동시에 실행할 서브에이전트 정의 리스트
+        timeout: 전체 대기 시간 (초). 시간 안에 끝나지 않은 분석은 시간 초과로 표시하고 다음 LLM 호출 전에 중단
+
+    Returns:
+        StructuredTool: 동기(스레드 풀)/비동기(asyncio) 실행을 모두 지원하는 도구
+    """
+    graphs = {spec["name"]: compile_subagent(spec, model) for spec in subagents}
+    names = list(graphs)
+    timeout_message = f"(시간 초과: {timeout:.0f}초 안에 완료되지 않았습니다)"
+
+    def _state(name: str, ticker: str, instructions: str) -> dict:
+        return {"messages": [HumanMessage(content=build_task_description(name, ticker, instructions))]}
+
+    def run_parallel_analysis(ticker: str, instructions: str = "") -> str:
+        """펀더멘털/기술적/감성 분석 서브에이전트를 동시에 실행하고 결과를 한 번에 반환합니다.
+
+        Args:
+            ticker: 주식 심볼 (예: "AAPL", "TSLA")
+            instructions: 모든 분석에 공통으로 전달할 추가 지시사항 (선택 사항)
+
+        Returns:
+            str: 서브에이전트별 분석 결과 (시간 초과 또는 오류는 해당 섹션에 표시)
+        """
+        cancelled = threading.Event()
+
+        def run_one(name: str, graph: Runnable) -> dict:
+            _cancel_event.set(cancelled)
+            return graph.invoke(_state(name, ticker, instructions), {"run_name": name})
+
+        executor = ThreadPoolExecutor(max_workers=len(graphs), thread_name_prefix="subagent")
+        try:
+            # 콜백/설정 컨텍스트가 작업 스레드에도 전달되도록 컨텍스트를 복사하여 실행
+            futures = {
+                executor.submit(contextvars.copy_context().run, run_one, name, graph): name
+                for name, graph in graphs.items()
+            }
+            done, _ = wait(futures, timeout=timeout)
+
+            results = dict.fromkeys(names, timeout_message)
+            for future in done:
+                name = futures[future]
+                try:
+                    results[name] = _final_text(future.result())
+                except Exception as e:
+                    results[name] = f"오류: {str(e)}"
+            return _format_results(names, results)
+        finally:
+            # 시간 초과된 작업은 기다리지 않고, 다음 LLM 호출 전에 멈추도록 취소 신호를 보냄
+            cancelled.set()
+            executor.shutdown(wait=False, cancel_futures=True)
+
+    async def arun_parallel_analysis(ticker: str, instructions: str = "") -> str:
+        async def run_one(name: str, graph: Runnable) -> str:
+            try:
+                result = await asyncio.wait_for(
+                    graph.ainvoke(_state(name, ticker, instructions), {"run_name": name}), timeout
+                )
+                return _final_text(result)
+            except TimeoutError:
+                return timeout_message
+            except Exception as e:
+                return f"오류: {str(e)}"
+
+        outputs = await asyncio.gather(*(run_one(name, graph) for name, graph in graphs.items()))
+        return _format_results(names, dict(zip(names, outputs)))
+
+    return StructuredTool.from_function(
+        func=run_parallel_analysis,
+        coroutine=arun_parallel_analysis,
+        name="run_parallel_analysis",
+    )
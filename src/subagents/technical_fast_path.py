@@ -0,0 +1,201 @@
+"""LLM 없이 기술적 분석 결과를 생성하는 기술적 분석 서브에이전트 고속 경로 모듈입니다.
+
+기술적 분석의 매매 시그널과 추세 신호는 `get_technical_summary`에서 이미 규칙 기반으로 계산되므로,
+작업 설명에서 종목을 찾을 수 있으면 요약 딕셔너리를 템플릿으로 바로 렌더링하여 서브에이전트 결과로
+반환합니다. 종목을 특정할 수 없거나 장중 분석처럼 템플릿이 다루지 않는 요청은 LLM 서브에이전트로 넘깁니다.
+"""
+
+import asyncio
+import re
+from typing import Any
+
+from langchain_core.language_models import BaseChatModel
+from langchain_core.messages import AIMessage
+from langchain_core.runnables import Runnable, RunnableLambda
+
+from src.subagents.parallel import compile_subagent
+from src.tools.analysis import get_technical_summary
+
+# 작업 설명에서 종목 심볼 후보를 찾는 패턴 (예: AAPL, BRK.B, ^GSPC, 005930.KS)
+_TICKER_PATTERN = re.compile(r"(?<![A-Za-z0-9^.])(\^?[A-Z]{1,5}(?:[.-][A-Z]{1,2})?|\d{6}\.K[SQ])(?![A-Za-z0-9])")
+
+# 종목 심볼로 오인하기 쉬운 지표/용어 약어
+_NON_TICKERS = frozenset(
+    {"MA", "SMA", "EMA", "RSI", "MACD", "ATR", "OBV", "BB", "BUY", "SELL", "NEUTRAL", "AI", "US", "USD", "ETF", "PER"}
+)
+
+# 템플릿이 다루지 않아 LLM 서브에이전트가 처리해야 하는 요청 키워드
+_FALLBACK_KEYWORDS = ("장중", "분봉", "intraday", "비교", "compare")
+
+_SIGNAL_KR = {"BUY": "매수", "SELL": "매도", "NEUTRAL": "중립"}
+_TREND_KR = {"BULLISH": "상승", "BEARISH": "하락", "MIXED": "횡보"}
+
+
+def extract_ticker(description: str) -> str | None:
+    """작업 설명에서 분석 대상 종목 심볼을 하나 찾습니다.
+
+    Args:
+        description: 서브에이전트 작업 설명
+
+    Returns:
+        str | None: 종목 심볼 (찾지 못했거나 서로 다른 후보가 여러 개이면 None)
+    """
+    candidates = {match for match in _TICKER_PATTERN.findall(description) if match not in _NON_TICKERS}
+    return candidates.pop() if len(candidates) == 1 else None
+
+
+def _price(value: float | None) -> str:
+    return "N/A" if value is None else f"${value:,.2f}"
+
+
+def _support_resistance(current_price: float, summary: dict) -> tuple[float | None, float | None]:
+    """이동평균선과 볼린저 밴드 중 현재가에 가장 가까운 아래/위 가격대를 찾습니다."""
+    indicators = summary.get("indicators", {})
+    levels = [value for value in summary["moving_averages"].values() if value is not None]
+    levels += [indicators[key] for key in ("bb_lower", "bb_middle", "bb_upper") if indicators.get(key) is not None]
+
+    below = [level for level in levels if level < current_price]
+    above = [level for level in levels if level > current_price]
+    return (max(below) if below else None, min(above) if above else None)
+
+
+def render_technical_report(ticker: str, summary: dict) -> str:
+    """기술적 분석 요약 딕셔너리를 한국어 기술적 분석 보고서로 렌더링합니다.
+
+    Args:
+        ticker: 주식 심볼
+        summary: `get_technical_summary` 결과
+
+    Returns:
+        str: 마크다운 형식의 기술적 분석 결과
+    """
+    current_price = summary["current_price"]
+    moving_averages = summary["moving_averages"]
+    indicators = summary.get("indicators", {})
+    rsi = summary["rsi"]
+
+    lines = [f"## {ticker} 기술적 분석", "", f"- 현재가: {_price(current_price)}"]
+
+    # 1. 추세 분석
+    lines += ["", "### 추세 분석 (이동평균선)"]
+    for key, value in moving_averages.items():
+        if value is None:
+            lines.append(f"- {key}: N/A (데이터 부족)")
+        else:
+            position = "위" if current_price > value else "아래"
+            gap = (current_price / value - 1) * 100
+            lines.append(f"- {key}: {_price(value)} (현재가가 {gap:+.1f}% {position})")
+
+    valid = [value for value in moving_averages.values() if value is not None]
+    if len(valid) >= 2:
+        if valid == sorted(valid, reverse=True):
+            lines.append("- 배열: 정배열 (단기 > 장기)")
+        elif valid == sorted(valid):
+            lines.append("- 배열: 역배열 (단기 < 장기)")
+        else:
+            lines.append("- 배열: 혼조")
+
+    # 2. 모멘텀
+    if rsi > 70:
+        rsi_state = "과매수 구간"
+    elif rsi < 30:
+        rsi_state = "과매도 구간"
+    else:
+        rsi_state = "중립 구간"
+    lines += ["", "### 모멘텀", f"- RSI (14일): {rsi:.2f} ({rsi_state})"]
+    if indicators.get("macd_hist") is not None:
+        direction = "양수 (상승 모멘텀)" if indicators["macd_hist"] > 0 else "음수 (하락 모멘텀)"
+        lines.append(
+            f"- MACD: {indicators['macd']:,.2f} / 시그널 {indicators['macd_signal']:,.2f} / 히스토그램 {direction}"
+        )
+
+    # 3. 변동성/수급
+    lines += ["", "### 변동성/수급"]
+    if indicators.get("bb_lower") is not None:
+        lines.append(
+            f"- 볼린저 밴드: {_price(indicators['bb_lower'])} ~ {_price(indicators['bb_upper'])} "
+            f"(%B {indicators['bb_percent_b']:.2f})"
+        )
+    if indicators.get("atr") is not None and current_price:
+        lines.append(f"- ATR (14일): {_price(indicators['atr'])} (현재가 대비 {indicators['atr'] / current_price:.1%})")
+    if indicators.get("obv") is not None:
+        lines.append(f"- OBV: {indicators['obv']:,.0f}")
+
+    # 4. 결론
+    support, resistance = _support_resistance(current_price, summary)
+    trend = summary.get("trend", "MIXED")
+    signal = summary["signal"]
+    lines += [
+        "",
+        "### 결론",
+        f"- 현재 추세 방향: {_TREND_KR.get(trend, trend)} (MACD 히스토그램 및 볼린저 중심선 기준)",
+        f"- 기술적 매매 시그널: {_SIGNAL_KR.get(signal, signal)} (50일 이동평균 대비 위치와 RSI 기준)",
+        f"- 주요 지지선: {_price(support)}",
+        f"- 주요 저항선: {_price(resistance)}",
+    ]
+    return "\n".join(lines)
+
+
+def _task_description(state: dict) -> str:
+    """서브에이전트 입력 상태에서 작업 설명(마지막 메시지)을 꺼냅니다."""
+    messages = state.get("messages") or []
+    return messages[-1].text if messages else ""
+
+
+def _try_fast_path(state: dict) -> dict | None:
+    """고속 경로로 결과를 생성합니다 (처리할 수 없으면 None)."""
+    description = _task_description(state)
+    if any(keyword in description.lower() for keyword in _FALLBACK_KEYWORDS):
+        return None
+
+    ticker = extract_ticker(description)
+    if ticker is None:
+        return None
+
+    try:
+        summary = get_technical_summary(ticker)
+    except ValueError:
+        return None
+    return {"messages": [AIMessage(content=render_technical_report(ticker, summary))]}
+
+
+def create_technical_fast_path(fallback: Runnable) -> Runnable:
+    """규칙 기반 렌더러를 먼저 시도하고 실패 시 fallback을 실행하는 Runnable을 생성합니다.
+
+    Args:
+        fallback: 고속 경로로 처리할 수 없을 때 실행할 LLM 서브에이전트 그래프
+
+    Returns:
+        Runnable: `{"messages": [...]}` 상태를 받아 실행하는 서브에이전트 그래프
+    """
+
+    def run(state: dict, config: Any = None) -> dict:
+        return _try_fast_path(state) or fallback.invoke(state, config)
+
+    async def arun(state: dict, config: Any = None) -> dict:
+        result = await asyncio.to_thread(_try_fast_path, state)
+        return result or await fallback.ainvoke(state, config)
+
+    return RunnableLambda(run, afunc=arun, name="technical-analyst-fast-path")
+
+
+def with_technical_fast_path(subagents: list[dict[str, Any]], model: BaseChatModel) -> list[dict[str, Any]]:
+    """서브에이전트 목록의 technical-analyst를 고속 경로 버전으로 교체합니다.
+
+    Args:
+        subagents: 서브에이전트 정의 리스트
+        model: fallback LLM 서브에이전트가 사용할 LLM
+
+    Returns:
+        list[dict[str, Any]]: technical-analyst가 `runnable` 정의로 교체된 새 리스트
+    """
+    result = []
+    for spec in subagents:
+        if spec["name"] == "technical-analyst" and "runnable" not in spec:
+            spec = {
+                "name": spec["name"],
+                "description": spec["description"],
+                "runnable": create_technical_fast_path(compile_subagent(spec, model)),
+            }
+        result.append(spec)
+    return result
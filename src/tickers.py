@@ -0,0 +1,26 @@
+"""종목 심볼 정규화와 형식 검증을 담당하는 모듈입니다.
+
+서비스 요청과 배치 보고서 파일 이름이 같은 규칙을 쓰도록 한곳에서 정의합니다.
+"""
+
+import re
+
+_TICKER_PATTERN = re.compile(r"^[A-Z0-9.\-^=]{1,15}$")
+
+
+def normalize_ticker(ticker: str) -> str:
+    """종목 심볼을 대문자로 정규화하고 형식을 검증합니다.
+
+    Args:
+        ticker: 주식 심볼 (예: "aapl", "BRK-B")
+
+    Returns:
+        str: 대문자 심볼
+
+    Raises:
+        ValueError: 종목 심볼 형식이 올바르지 않은 경우 (경로 구분자 등 허용하지 않는 문자 포함)
+    """
+    symbol = ticker.strip().upper()
+    if not _TICKER_PATTERN.match(symbol):
+        raise ValueError(f"올바르지 않은 종목 심볼: {ticker!r}")
+    return symbol
@@ -1,21 +1,68 @@
 """에이전트가 사용하는 도구들을 정의하는 모듈입니다."""
 
-from src.tools.analysis import calculate_moving_averages, calculate_rsi, get_technical_summary, technical_analysis_tool
-from src.tools.news_search import news_search_tool, search_stock_news
-from src.tools.stock_data import financial_data_tool, get_financial_data, get_stock_price, stock_price_tool
+from src.tools.agent_tools import (
+    financial_data_agent_tool,
+    intraday_indicators_agent_tool,
+    news_search_agent_tool,
+    stock_price_agent_tool,
+    technical_summary_agent_tool,
+)
+from src.tools.analysis import (
+    aget_technical_summary,
+    calculate_moving_averages,
+    calculate_rsi,
+    get_technical_summaries,
+    get_technical_summary,
+    technical_analysis_tool,
+)
+from src.tools.indicators import IndicatorSet, compute_indicator_arrays, compute_indicators, wilder_rsi
+from src.tools.news_dedup import deduplicate_news
+from src.tools.news_search import asearch_stock_news, news_search_tool, search_stock_news
+from src.tools.stock_data import (
+    aget_financial_data,
+    aget_stock_price,
+    financial_data_tool,
+    get_financial_data,
+    get_stock_price,
+    get_stock_prices,
+    stock_price_tool,
+)
+from src.tools.streaming import aget_intraday_indicators, get_intraday_indicators, intraday_indicators_tool
 
 __all__ = [
     # Stock data tools
     "get_stock_price",
     "get_financial_data",
+    "get_stock_prices",
+    "aget_stock_price",
+    "aget_financial_data",
     "stock_price_tool",
     "financial_data_tool",
     # News search tools
     "search_stock_news",
+    "asearch_stock_news",
     "news_search_tool",
+    "deduplicate_news",
     # Analysis tools
     "calculate_moving_averages",
     "calculate_rsi",
     "get_technical_summary",
+    "get_technical_summaries",
+    "aget_technical_summary",
     "technical_analysis_tool",
+    # Indicator library
+    "IndicatorSet",
+    "compute_indicators",
+    "compute_indicator_arrays",
+    "wilder_rsi",
+    # Agent graph tools (sync + async)
+    "stock_price_agent_tool",
+    "financial_data_agent_tool",
+    "technical_summary_agent_tool",
+    "intraday_indicators_agent_tool",
+    "news_search_agent_tool",
+    # Streaming (intraday) tools
+    "get_intraday_indicators",
+    "aget_intraday_indicators",
+    "intraday_indicators_tool",
 ]
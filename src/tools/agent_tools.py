@@ -0,0 +1,160 @@
+"""에이전트 그래프에 등록하는 동기/비동기 겸용 도구를 정의하는 모듈입니다.
+
+각 도구는 동기 함수와 비동기 함수를 함께 가지므로 `invoke`/`stream`에서는 동기 버전이,
+`ainvoke`/`astream`에서는 비동기 버전이 실행되어 한 턴 안의 독립적인 도구 호출이 겹쳐 실행됩니다.
+`tool_output_format`이 "compact"/"json"이면 결과 객체 대신 토큰 예산 안의 간결한 문자열을 반환합니다.
+체크포인트 실행 중에는 같은 실행에서 이미 완료된 (도구, 인자) 호출의 결과를 기록에서 재사용합니다.
+조사 실행 중에는 재무 데이터/뉴스 도구가 반환한 데이터로 보고서 섹션 지문을 기록합니다 (`src.reports`).
+"""
+
+import functools
+import inspect
+from collections.abc import Awaitable, Callable
+from typing import Any
+
+from langchain_core.tools import StructuredTool
+from langgraph.prebuilt.tool_node import msg_content_output
+
+from src.checkpoint import is_journaling, journal_lookup, journal_record
+from src.config import settings
+from src.reports import financial_fingerprint, news_fingerprint, observe_section_data
+from src.tools.analysis import aget_technical_summary, get_technical_summary
+from src.tools.formatting import format_financial_data, format_news, format_stock_price, format_technical_summary
+from src.tools.news_search import asearch_stock_news, search_stock_news
+from src.tools.stock_data import aget_financial_data, aget_stock_price, get_financial_data, get_stock_price
+from src.tools.streaming import aget_intraday_indicators, get_intraday_indicators
+
+Formatter = Callable[[Any, str], str]
+
+
+def _with_formatter(
+    func: Callable[..., Any], coroutine: Callable[..., Awaitable[Any]], formatter: Formatter
+) -> tuple[Callable[..., Any], Callable[..., Awaitable[Any]]]:
+    """compact/json 형식일 때 결과를 formatter로 변환하도록 함수를 감쌉니다 (시그니처/설명 유지)."""
+    signature = inspect.signature(func)
+
+    def _format(result: Any, args: tuple, kwargs: dict) -> Any:
+        if settings.tool_output_format == "verbose":
+            return result
+        ticker = signature.bind(*args, **kwargs).arguments["ticker"]
+        return formatter(result, ticker)
+
+    @functools.wraps(func)
+    def sync_wrapper(*args: Any, **kwargs: Any) -> Any:
+        return _format(func(*args, **kwargs), args, kwargs)
+
+    @functools.wraps(coroutine)
+    async def async_wrapper(*args: Any, **kwargs: Any) -> Any:
+        return _format(await coroutine(*args, **kwargs), args, kwargs)
+
+    return sync_wrapper, async_wrapper
+
+
+def _with_fingerprint(
+    section: str, func: Callable[..., Any], coroutine: Callable[..., Awaitable[Any]], fingerprint: Callable[[Any], str]
+) -> tuple[Callable[..., Any], Callable[..., Awaitable[Any]]]:
+    """조사 실행 중이면 도구가 반환한 데이터(형식 변환 전)로 보고서 섹션 지문을 기록하도록 감쌉니다."""
+    signature = inspect.signature(func)
+
+    def _observe(result: Any, args: tuple, kwargs: dict) -> Any:
+        ticker = signature.bind(*args, **kwargs).arguments["ticker"]
+        observe_section_data(section, ticker, lambda: fingerprint(result))
+        return result
+
+    @functools.wraps(func)
+    def sync_wrapper(*args: Any, **kwargs: Any) -> Any:
+        return _observe(func(*args, **kwargs), args, kwargs)
+
+    @functools.wraps(coroutine)
+    async def async_wrapper(*args: Any, **kwargs: Any) -> Any:
+        return _observe(await coroutine(*args, **kwargs), args, kwargs)
+
+    return sync_wrapper, async_wrapper
+
+
+def _with_journal(
+    name: str, func: Callable[..., Any], coroutine: Callable[..., Awaitable[Any]]
+) -> tuple[Callable[..., Any], Callable[..., Awaitable[Any]]]:
+    """체크포인트 실행 중이면 도구 결과(메시지 문자열)를 기록하고, 재개 시 기록된 결과를 반환하도록 감쌉니다."""
+    signature = inspect.signature(func)
+
+    def _arguments(args: tuple, kwargs: dict) -> dict[str, Any]:
+        bound = signature.bind(*args, **kwargs)
+        bound.apply_defaults()
+        return dict(bound.arguments)
+
+    def _record(arguments: dict[str, Any], result: Any) -> str:
+        # 도구 노드가 메시지로 바꿀 때와 같은 문자열로 저장하여 재개 시 같은 내용을 돌려줌
+        content = msg_content_output(result)
+        journal_record(name, arguments, content)
+        return content
+
+    @functools.wraps(func)
+    def sync_wrapper(*args: Any, **kwargs: Any) -> Any:
+        if not is_journaling():
+            return func(*args, **kwargs)
+        arguments = _arguments(args, kwargs)
+        replayed = journal_lookup(name, arguments)
+        if replayed is not None:
+            return replayed
+        return _record(arguments, func(*args, **kwargs))
+
+    @functools.wraps(coroutine)
+    async def async_wrapper(*args: Any, **kwargs: Any) -> Any:
+        if not is_journaling():
+            return await coroutine(*args, **kwargs)
+        arguments = _arguments(args, kwargs)
+        replayed = journal_lookup(name, arguments)
+        if replayed is not None:
+            return replayed
+        return _record(arguments, await coroutine(*args, **kwargs))
+
+    return sync_wrapper, async_wrapper
+
+
+def _sync_async_tool(
+    func: Callable[..., Any],
+    coroutine: Callable[..., Awaitable[Any]],
+    formatter: Formatter | None = None,
+    section: tuple[str, Callable[[Any], str]] | None = None,
+) -> StructuredTool:
+    """동기 함수의 이름, 설명, 인자 스키마를 그대로 사용하는 겸용 도구를 생성합니다.
+
+    Args:
+        func: 동기 함수
+        coroutine: 같은 인자를 받는 비동기 함수
+        formatter: compact/json 형식에서 (결과, 티커)를 문자열로 변환하는 함수 (선택 사항)
+        section: 결과로 지문을 기록할 (보고서 섹션, 지문 함수) (선택 사항)
+    """
+    name = func.__name__
+    if section is not None:
+        func, coroutine = _with_fingerprint(section[0], func, coroutine, section[1])
+    if formatter is not None:
+        func, coroutine = _with_formatter(func, coroutine, formatter)
+    func, coroutine = _with_journal(name, func, coroutine)
+    return StructuredTool.from_function(func=func, coroutine=coroutine, name=name)
+
+
+stock_price_agent_tool = _sync_async_tool(
+    get_stock_price,
+    aget_stock_price,
+    lambda result, ticker: format_stock_price(result, settings.tool_output_format),
+)
+financial_data_agent_tool = _sync_async_tool(
+    get_financial_data,
+    aget_financial_data,
+    lambda result, ticker: format_financial_data(result, settings.tool_output_format),
+    section=("fundamental", financial_fingerprint),
+)
+technical_summary_agent_tool = _sync_async_tool(
+    get_technical_summary,
+    aget_technical_summary,
+    lambda result, ticker: format_technical_summary(ticker, result, settings.tool_output_format),
+)
+intraday_indicators_agent_tool = _sync_async_tool(get_intraday_indicators, aget_intraday_indicators)
+news_search_agent_tool = _sync_async_tool(
+    search_stock_news,
+    asearch_stock_news,
+    lambda result, ticker: format_news(ticker, result, settings.tool_output_format),
+    section=("sentiment", news_fingerprint),
+)
@@ -1,15 +1,27 @@
 """주식 분석 도구를 정의하는 모듈입니다."""
 
-import yfinance as yf
+import asyncio
+
+import numpy as np
+import pandas as pd
 from langchain_core.tools import tool
 
+from src.config import settings
+from src.data.market import get_price_history, get_price_matrix
+from src.tools.formatting import format_technical_summary
+from src.tools.indicators import IndicatorSet, compute_indicators, wilder_rsi
+from src.tracing import traced
+
 
-def calculate_moving_averages(ticker: str, periods: list[int] = [20, 50, 200]) -> dict[str, float | None]:
+def calculate_moving_averages(
+    ticker: str, periods: list[int] = [20, 50, 200], hist_data: pd.DataFrame | None = None
+) -> dict[str, float | None]:
     """이동평균선을 계산합니다.
 
     Args:
         ticker: 주식 심볼 (예: "AAPL", "TSLA")
         periods: 계산할 기간 리스트 (기본값: [20, 50, 200]일)
+        hist_data: 미리 조회한 가격 이력 (None이면 1년치 일봉을 조회)
 
     Returns:
         dict[str, float | None]: 각 기간별 이동평균 값 (예: {"MA_20": 150.5, "MA_50": 145.2})
@@ -18,21 +30,22 @@ def calculate_moving_averages(ticker: str, periods: list[int] = [20, 50, 200]) -
         ValueError: 데이터 조회 실패 또는 계산 중 오류 발생
     """
     try:
-        stock = yf.Ticker(ticker)
-        hist_data = stock.history(period="1y")
+        if hist_data is None:
+            hist_data = get_price_history(ticker, period="1y")
 
         if hist_data.empty:
             raise ValueError(f"티커 '{ticker}'에 대한 과거 데이터를 가져올 수 없습니다.")
 
+        close = hist_data["Close"]
         result: dict[str, float | None] = {}
         for period in periods:
-            ma = hist_data["Close"].rolling(window=period).mean()
-            latest_ma = ma.iloc[-1]
-
-            if not isinstance(latest_ma, (int, float)):
+            # 마지막 이동평균만 필요하므로 전체 rolling 대신 최근 구간 평균만 계산
+            if len(close) < period:
                 result[f"MA_{period}"] = None
-            else:
-                result[f"MA_{period}"] = round(float(latest_ma), 2)
+                continue
+
+            latest_ma = close.iloc[-period:].mean()
+            result[f"MA_{period}"] = None if pd.isna(latest_ma) else round(float(latest_ma), 2)
 
         return result
 
@@ -40,12 +53,15 @@ def calculate_moving_averages(ticker: str, periods: list[int] = [20, 50, 200]) -
         raise ValueError(f"이동평균 계산 중 오류 발생: {str(e)}") from e
 
 
-def calculate_rsi(ticker: str, period: int = 14) -> float:
-    """RSI (Relative Strength Index)를 계산합니다.
+def calculate_rsi(ticker: str, period: int = 14, hist_data: pd.DataFrame | None = None) -> float:
+    """Wilder 평활 RSI (Relative Strength Index)를 계산합니다.
+
+    `get_technical_summary`의 시그널과 일괄 경로(`latest_rsi`)가 모두 같은 정의(`wilder_rsi`)를 사용합니다.
 
     Args:
         ticker: 주식 심볼 (예: "AAPL", "TSLA")
         period: RSI 계산 기간 (기본값: 14일)
+        hist_data: 미리 조회한 가격 이력 (None이면 `get_technical_summary`와 같은 1년치 일봉을 조회)
 
     Returns:
         float: RSI 값 (0-100)
@@ -54,83 +70,236 @@ def calculate_rsi(ticker: str, period: int = 14) -> float:
         ValueError: 데이터 조회 실패 또는 계산 중 오류 발생
     """
     try:
-        stock = yf.Ticker(ticker)
-        hist_data = stock.history(period="3mo")
+        if hist_data is None:
+            # Wilder 평활은 시작 구간에 따라 값이 달라지므로 기술적 분석 요약과 같은 기간을 사용
+            hist_data = get_price_history(ticker, period="1y")
 
         if hist_data.empty:
             raise ValueError(f"티커 '{ticker}'에 대한 과거 데이터를 가져올 수 없습니다.")
 
-        # 일일 가격 변화 계산
-        delta = hist_data["Close"].diff()
+        latest_rsi = wilder_rsi(hist_data["Close"].to_numpy(dtype=float), period)
+        if np.isnan(latest_rsi):
+            raise ValueError("RSI 계산에 필요한 데이터가 부족합니다.")
+
+        return round(float(latest_rsi), 2)
+
+    except Exception as e:
+        raise ValueError(f"RSI 계산 중 오류 발생: {str(e)}") from e
 
-        # 상승/하락 분리
-        gain = delta.where(delta > 0, 0)
-        loss = -delta.where(delta < 0, 0)
 
-        # 평균 상승/하락 계산
-        avg_gain = gain.rolling(window=period).mean()
-        avg_loss = loss.rolling(window=period).mean()
+def determine_signal(current_price: float, ma_50: float | None, rsi: float) -> str:
+    """현재가, 50일 이동평균, RSI로 매매 시그널을 판단합니다.
 
-        # RSI 계산
-        rs = avg_gain / avg_loss
-        rsi = 100 - (100 / (1 + rs))
+    Args:
+        current_price: 현재가
+        ma_50: 50일 이동평균 (없으면 None)
+        rsi: RSI 값 (0-100)
 
-        latest_rsi = rsi.iloc[-1]
+    Returns:
+        str: "BUY", "SELL", "NEUTRAL" 중 하나
+    """
+    if ma_50 and current_price > 0:
+        if current_price > ma_50 and rsi < 70:
+            return "BUY"
+        elif current_price < ma_50 and rsi > 30:
+            return "SELL"
+    return "NEUTRAL"
 
-        if not isinstance(latest_rsi, (int, float)):
-            raise ValueError("RSI 계산 결과가 유효하지 않습니다.")
 
-        return round(float(latest_rsi), 2)
+def determine_trend(current_price: float, indicators: IndicatorSet) -> str:
+    """MACD 히스토그램과 볼린저 중심선으로 추세 확인 신호를 판단합니다.
 
-    except Exception as e:
-        raise ValueError(f"RSI 계산 중 오류 발생: {str(e)}") from e
+    Args:
+        current_price: 현재가
+        indicators: `compute_indicators` 결과
 
+    Returns:
+        str: "BULLISH", "BEARISH", "MIXED" 중 하나
+    """
+    macd_hist, bb_middle = indicators.macd_hist, indicators.bb_middle
+    if np.isnan(macd_hist) or np.isnan(bb_middle):
+        return "MIXED"
+    if macd_hist > 0 and current_price > bb_middle:
+        return "BULLISH"
+    if macd_hist < 0 and current_price < bb_middle:
+        return "BEARISH"
+    return "MIXED"
 
+
+@traced
 def get_technical_summary(ticker: str) -> dict:
     """기술적 분석 요약을 제공합니다.
 
+    1년치 일봉을 한 번만 조회하여 이동평균, Wilder RSI, 현재가와 확장 지표
+    (EMA, MACD, 볼린저 밴드, ATR, OBV)를 모두 계산합니다. RSI는 하나의 정의만 사용하며
+    시그널 판단과 출력(`rsi`)에 같은 값을 씁니다.
+
     Args:
         ticker: 주식 심볼 (예: "AAPL", "TSLA")
 
     Returns:
-        dict: 이동평균, RSI, 매매 시그널을 포함한 기술적 분석 요약
+        dict: 이동평균, RSI, 확장 지표, 매매 시그널, 추세 확인 신호를 포함한 기술적 분석 요약
 
     Raises:
         ValueError: 데이터 조회 실패 또는 분석 중 오류 발생
     """
     try:
-        # 이동평균 계산
-        moving_averages = calculate_moving_averages(ticker)
+        hist_data = get_price_history(ticker, period="1y")
+
+        if hist_data.empty:
+            raise ValueError(f"티커 '{ticker}'에 대한 과거 데이터를 가져올 수 없습니다.")
 
-        # RSI 계산
-        rsi = calculate_rsi(ticker)
+        # 이동평균 및 RSI 계산 (같은 가격 이력 재사용)
+        moving_averages = calculate_moving_averages(ticker, hist_data=hist_data)
+        rsi = calculate_rsi(ticker, hist_data=hist_data)
 
-        # 현재가 조회
-        stock = yf.Ticker(ticker)
-        info = stock.info
-        current_price = info.get("currentPrice") or info.get("regularMarketPrice", 0)
+        # 현재가는 최신 종가 사용
+        current_price = round(float(hist_data["Close"].iloc[-1]), 2)
+
+        # 확장 지표 계산 (같은 가격 이력을 한 번 순회)
+        indicators = compute_indicators(hist_data)
 
         # 시그널 판단
-        ma_50 = moving_averages.get("MA_50")
-        signal = "NEUTRAL"
+        signal = determine_signal(current_price, moving_averages.get("MA_50"), rsi)
 
-        if ma_50 and current_price > 0:
-            if current_price > ma_50 and rsi < 70:
-                signal = "BUY"
-            elif current_price < ma_50 and rsi > 30:
-                signal = "SELL"
+        # RSI는 최상위 `rsi` 하나로만 출력 (확장 지표와 같은 Wilder RSI)
+        extended = {name: value for name, value in indicators.to_dict().items() if name != "rsi"}
 
         return {
             "current_price": current_price,
             "moving_averages": moving_averages,
             "rsi": rsi,
+            "indicators": extended,
             "signal": signal,
+            "trend": determine_trend(current_price, indicators),
         }
 
     except Exception as e:
         raise ValueError(f"기술적 분석 중 오류 발생: {str(e)}") from e
 
 
+async def aget_technical_summary(ticker: str) -> dict:
+    """`get_technical_summary`의 비동기 버전입니다 (yfinance 호출과 계산은 스레드로 오프로딩).
+
+    Args:
+        ticker: 주식 심볼 (예: "AAPL", "TSLA")
+
+    Returns:
+        dict: 이동평균, RSI, 확장 지표, 매매 시그널, 추세 확인 신호를 포함한 기술적 분석 요약
+
+    Raises:
+        ValueError: 데이터 조회 실패 또는 분석 중 오류 발생
+    """
+    return await asyncio.to_thread(get_technical_summary, ticker)
+
+
+def latest_moving_averages(closes: np.ndarray, periods: list[int] = [20, 50, 200]) -> dict[int, np.ndarray]:
+    """(날짜 x 종목) 종가 배열에서 종목별 최신 이동평균을 한 번에 계산합니다.
+
+    Args:
+        closes: 종가 2차원 배열 (행: 날짜, 열: 종목)
+        periods: 계산할 기간 리스트
+
+    Returns:
+        dict[int, np.ndarray]: 기간별 종목 이동평균 (데이터가 부족한 종목은 NaN)
+    """
+    result: dict[int, np.ndarray] = {}
+    for period in periods:
+        if closes.shape[0] < period:
+            result[period] = np.full(closes.shape[1], np.nan)
+            continue
+
+        window = closes[-period:]
+        result[period] = np.where(np.isnan(window).any(axis=0), np.nan, window.mean(axis=0))
+    return result
+
+
+def latest_rsi(closes: np.ndarray, period: int = 14) -> np.ndarray:
+    """(날짜 x 종목) 종가 배열에서 종목별 최신 RSI를 한 번에 계산합니다.
+
+    `calculate_rsi`와 같은 Wilder 평활 방식(`wilder_rsi`)을 사용하며, 앞쪽이 NaN인 열은 값이 있는 봉만 사용합니다.
+
+    Args:
+        closes: 종가 2차원 배열 (행: 날짜, 열: 종목)
+        period: RSI 계산 기간 (기본값: 14일)
+
+    Returns:
+        np.ndarray: 종목별 RSI (데이터가 부족한 종목은 NaN)
+    """
+    return wilder_rsi(closes, period)
+
+
+def determine_signals(current_prices: np.ndarray, ma_50: np.ndarray, rsi: np.ndarray) -> np.ndarray:
+    """`determine_signal`과 같은 규칙을 종목 배열 전체에 적용합니다.
+
+    Args:
+        current_prices: 종목별 현재가
+        ma_50: 종목별 50일 이동평균 (없으면 NaN)
+        rsi: 종목별 RSI
+
+    Returns:
+        np.ndarray: 종목별 "BUY" / "SELL" / "NEUTRAL" 문자열 배열
+    """
+    valid = ~np.isnan(ma_50) & (ma_50 != 0) & (current_prices > 0)
+    buy = valid & (current_prices > ma_50) & (rsi < 70)
+    sell = valid & (current_prices < ma_50) & (rsi > 30)
+    return np.select([buy, sell], ["BUY", "SELL"], default="NEUTRAL")
+
+
+def get_technical_summaries(tickers: list[str], periods: list[int] = [20, 50, 200]) -> dict[str, dict]:
+    """여러 종목의 기술적 분석 요약을 일괄 조회 한 번으로 계산합니다.
+
+    1년치 일봉을 공급자 일괄 조회 한 번으로 받아 (날짜 x 종목) float32 압축 행렬(`PriceMatrix`)에서
+    이동평균, RSI, 시그널을 열 단위로 계산합니다. 각 종목은 자신의 거래일 봉만 사용합니다.
+    압축 행렬에는 고가/저가가 없으므로 확장 지표(`indicators`)와 추세 확인 신호(`trend`)는 계산하지 않으며,
+    필요하면 종목별로 `get_technical_summary`를 호출합니다.
+
+    Args:
+        tickers: 주식 심볼 리스트 (예: ["AAPL", "TSLA"])
+        periods: 계산할 이동평균 기간 리스트 (기본값: [20, 50, 200]일)
+
+    Returns:
+        dict[str, dict]: 티커별 `current_price`, `moving_averages`, `rsi`, `signal` 요약
+            (`get_technical_summary`와 같은 값이지만 `indicators`/`trend` 제외, 데이터를 가져오지 못한 종목은 제외)
+
+    Raises:
+        ValueError: 일괄 조회 또는 계산 중 오류 발생
+    """
+    try:
+        matrix = get_price_matrix(tickers, period="1y")
+        if len(matrix) == 0:
+            return {}
+
+        # 종목별 자신의 봉만 모아 계산하고, float32로 보관한 종가는 계산할 때만 float64로 올려 누적 오차를 피함
+        values = matrix.packed()[0].astype(np.float64)
+        current_prices = matrix.last_close
+        moving_averages = latest_moving_averages(values, sorted(set(periods) | {50}))
+        rsi = latest_rsi(values)
+        signals = determine_signals(current_prices, moving_averages[50], rsi)
+
+        summaries: dict[str, dict] = {}
+        for i, symbol in enumerate(matrix.symbols):
+            if np.isnan(current_prices[i]) or np.isnan(rsi[i]):
+                continue
+
+            summaries[symbol] = {
+                "current_price": round(float(current_prices[i]), 2),
+                "moving_averages": {
+                    f"MA_{period}": None
+                    if np.isnan(moving_averages[period][i])
+                    else round(float(moving_averages[period][i]), 2)
+                    for period in periods
+                },
+                "rsi": round(float(rsi[i]), 2),
+                "signal": str(signals[i]),
+            }
+
+        return summaries
+
+    except Exception as e:
+        raise ValueError(f"일괄 기술적 분석 중 오류 발생: {str(e)}") from e
+
+
 @tool
 def technical_analysis_tool(ticker: str) -> str:
     """주식의 기술적 분석을 수행합니다.
@@ -143,6 +312,8 @@ def technical_analysis_tool(ticker: str) -> str:
     """
     try:
         summary = get_technical_summary(ticker)
+        if settings.tool_output_format != "verbose":
+            return format_technical_summary(ticker, summary, settings.tool_output_format)
 
         result = f"\n=== {ticker} 기술적 분석 ===\n\n"
         result += f"현재가: ${summary['current_price']:,.2f}\n\n"
@@ -154,7 +325,7 @@ def technical_analysis_tool(ticker: str) -> str:
             else:
                 result += f"  {key}: N/A\n"
 
-        result += f"\nRSI (14일): {summary['rsi']:.2f}\n"
+        result += f"\nRSI (Wilder, 14일): {summary['rsi']:.2f}\n"
 
         # RSI 해석
         rsi = summary["rsi"]
@@ -167,11 +338,30 @@ def technical_analysis_tool(ticker: str) -> str:
 
         result += f"RSI 해석: {rsi_interpretation}\n\n"
 
+        # 확장 지표
+        indicators = summary.get("indicators", {})
+        if indicators:
+
+            def fmt(key: str, prefix: str = "") -> str:
+                value = indicators.get(key)
+                return "N/A" if value is None else f"{prefix}{value:,.2f}"
+
+            result += "확장 지표:\n"
+            result += f"  EMA 12/26: {fmt('ema_12', '$')} / {fmt('ema_26', '$')}\n"
+            result += f"  MACD: {fmt('macd')} (시그널 {fmt('macd_signal')}, 히스토그램 {fmt('macd_hist')})\n"
+            result += f"  볼린저 밴드: {fmt('bb_lower', '$')} ~ {fmt('bb_upper', '$')} (%B {fmt('bb_percent_b')})\n"
+            result += f"  ATR (14일): {fmt('atr', '$')}\n"
+            result += f"  OBV: {fmt('obv')}\n\n"
+
         # 시그널
         signal = summary["signal"]
         signal_kr = {"BUY": "매수", "SELL": "매도", "NEUTRAL": "중립"}
         result += f"매매 시그널: {signal_kr.get(signal, signal)}\n"
 
+        trend_kr = {"BULLISH": "상승 확인", "BEARISH": "하락 확인", "MIXED": "혼조"}
+        if "trend" in summary:
+            result += f"추세 확인 (MACD/볼린저): {trend_kr.get(summary['trend'], summary['trend'])}\n"
+
         return result
 
     except Exception as e:
@@ -0,0 +1,274 @@
+"""도구 결과를 토큰 예산 안의 간결한 텍스트 또는 JSON으로 변환하는 모듈입니다.
+
+`tool_output_format`이 "compact" 또는 "json"이면 도구 결과가 장식 없는 형태로 출력되어
+이후 모든 에이전트 턴의 프롬프트 크기가 줄어듭니다. 토큰 수는 토크나이저 없이 근사합니다.
+"""
+
+import json
+import math
+from typing import Any, Literal
+
+from src.config import settings
+from src.models.research import NewsItem
+from src.models.stock import FinancialData, StockPrice
+
+ToolOutputFormat = Literal["verbose", "compact", "json"]
+
+# 도구별 기본 토큰 예산 (`tool_token_budgets` 설정으로 도구별 재정의 가능)
+DEFAULT_TOKEN_BUDGETS = {
+    "stock_price": 80,
+    "financial_data": 80,
+    "technical_analysis": 200,
+    "news_search": 600,
+}
+
+_ELLIPSIS = "…"
+
+
+def estimate_tokens(text: str) -> int:
+    """텍스트의 토큰 수를 근사합니다 (ASCII는 약 4자당 1토큰, 그 외 문자는 1자당 1토큰)."""
+    ascii_chars = sum(1 for char in text if char.isascii())
+    return math.ceil(ascii_chars / 4) + (len(text) - ascii_chars)
+
+
+def token_budget(tool_name: str) -> int:
+    """도구의 토큰 예산을 반환합니다 (설정값 우선, 없으면 기본값)."""
+    return settings.tool_token_budgets.get(tool_name, DEFAULT_TOKEN_BUDGETS.get(tool_name, 200))
+
+
+def truncate_to_tokens(text: str, budget: int) -> str:
+    """텍스트를 토큰 예산 안으로 자릅니다 (가능하면 단어 경계에서 자르고 말줄임표 추가).
+
+    Args:
+        text: 자를 텍스트
+        budget: 최대 토큰 수
+
+    Returns:
+        str: 예산 안에 들어가는 텍스트 (예산이 0 이하이면 빈 문자열)
+    """
+    if budget <= 0:
+        return ""
+    if estimate_tokens(text) <= budget:
+        return text
+
+    # 문자 수에 비례해 자른 뒤 예산을 넘으면 조금씩 줄임
+    limit = max(1, len(text) * budget // estimate_tokens(text))
+    while limit > 1 and estimate_tokens(text[:limit]) + 1 > budget:
+        limit = limit * 9 // 10
+
+    cut = text[:limit]
+    boundary = cut.rfind(" ")
+    if boundary > limit // 2:
+        cut = cut[:boundary]
+    return cut.rstrip() + _ELLIPSIS
+
+
+def _num(value: float | None, digits: int = 2) -> str:
+    """숫자를 짧은 문자열로 변환합니다 (큰 수는 K/M/B/T 단위 사용, 없으면 "NA")."""
+    if value is None or (isinstance(value, float) and math.isnan(value)):
+        return "NA"
+    for threshold, suffix in ((1e12, "T"), (1e9, "B"), (1e6, "M"), (1e3, "K")):
+        if abs(value) >= threshold:
+            return f"{value / threshold:.{digits}f}{suffix}"
+    return f"{value:.{digits}f}"
+
+
+def _round(value: Any, digits: int = 4) -> Any:
+    """JSON 출력용으로 실수를 반올림합니다."""
+    if isinstance(value, float):
+        return None if math.isnan(value) else round(value, digits)
+    if isinstance(value, dict):
+        return {key: _round(item, digits) for key, item in value.items()}
+    if isinstance(value, list):
+        return [_round(item, digits) for item in value]
+    return value
+
+
+def _dumps(data: Any, digits: int = 4) -> str:
+    """공백 없는 JSON 문자열로 직렬화합니다."""
+    return json.dumps(_round(data, digits), ensure_ascii=False, separators=(",", ":"))
+
+
+def _fit_json(data: dict[str, Any], budget: int, drop_order: list[str]) -> str:
+    """JSON을 잘라내지 않고 토큰 예산에 맞춥니다.
+
+    직렬화된 문자열을 자르면 JSON이 깨지므로, 먼저 실수를 소수 둘째 자리로 줄이고 그래도 넘으면
+    `drop_order` 순서대로 필드를 제외합니다. 필수 필드만 남아도 예산을 넘으면 그대로 반환합니다.
+
+    Args:
+        data: 직렬화할 딕셔너리
+        budget: 최대 토큰 수
+        drop_order: 예산을 넘을 때 제외할 필드 (먼저 제외할 필드부터)
+
+    Returns:
+        str: 항상 올바른 JSON 문자열
+    """
+    text = _dumps(data)
+    if estimate_tokens(text) <= budget:
+        return text
+
+    data = dict(data)
+    text = _dumps(data, digits=2)
+    for key in drop_order:
+        if estimate_tokens(text) <= budget:
+            break
+        if key in data:
+            del data[key]
+            text = _dumps(data, digits=2)
+    return text
+
+
+def format_stock_price(price: StockPrice, output_format: ToolOutputFormat = "compact") -> str:
+    """주가 정보를 간결한 한 줄 또는 JSON으로 변환합니다."""
+    if output_format == "json":
+        return _fit_json(price.model_dump(), token_budget("stock_price"), ["market_cap", "volume", "previous_close"])
+
+    text = (
+        f"{price.symbol} price={price.current_price:.2f} prev={price.previous_close:.2f} "
+        f"chg={price.change_percent:+.2f}% vol={_num(price.volume)} mcap={_num(price.market_cap)}"
+    )
+    return truncate_to_tokens(text, token_budget("stock_price"))
+
+
+def format_financial_data(financial: FinancialData, output_format: ToolOutputFormat = "compact") -> str:
+    """재무 데이터를 간결한 한 줄 또는 JSON으로 변환합니다."""
+    if output_format == "json":
+        return _fit_json(
+            financial.model_dump(), token_budget("financial_data"), ["net_income", "revenue", "debt_to_equity"]
+        )
+
+    debt_to_equity = _num(financial.debt_to_equity)
+    if financial.debt_to_equity is not None:
+        debt_to_equity += "%"
+    text = (
+        f"{financial.symbol} revenue={_num(financial.revenue)} net_income={_num(financial.net_income)} "
+        f"eps={_num(financial.eps)} pe={_num(financial.pe_ratio)} de={debt_to_equity}"
+    )
+    return truncate_to_tokens(text, token_budget("financial_data"))
+
+
+def format_technical_summary(ticker: str, summary: dict, output_format: ToolOutputFormat = "compact") -> str:
+    """기술적 분석 요약을 간결한 key=value 텍스트 또는 JSON으로 변환합니다."""
+    if output_format == "json":
+        return _fit_json(
+            {"ticker": ticker.upper(), **summary},
+            token_budget("technical_analysis"),
+            ["indicators", "trend", "moving_averages"],
+        )
+
+    fields = [f"{ticker.upper()} price={_num(summary['current_price'])}"]
+    fields += [f"{key.lower()}={_num(value)}" for key, value in summary["moving_averages"].items()]
+    fields.append(f"rsi14={_num(summary['rsi'])}")
+    fields += [f"{key}={_num(value)}" for key, value in summary.get("indicators", {}).items()]
+    fields.append(f"signal={summary['signal']}")
+    if "trend" in summary:
+        fields.append(f"trend={summary['trend']}")
+    text = " ".join(fields)
+    return truncate_to_tokens(text, token_budget("technical_analysis"))
+
+
+def _allocate_by_priority(needs: list[int], weights: list[float], budget: int) -> list[int]:
+    """예산을 우선순위(가중치)가 높은 항목부터 비례 배분합니다.
+
+    필요량보다 많이 받은 항목의 남는 예산은 다음 항목들에 다시 배분됩니다.
+    """
+    allocations = [0] * len(needs)
+    remaining = budget
+    remaining_weight = sum(weights)
+    for i in sorted(range(len(needs)), key=lambda i: -weights[i]):
+        if remaining <= 0 or remaining_weight <= 0:
+            break
+        share = math.floor(remaining * weights[i] / remaining_weight)
+        allocations[i] = min(needs[i], share)
+        remaining -= allocations[i]
+        remaining_weight -= weights[i]
+    return allocations
+
+
+def format_news(ticker: str, items: list[NewsItem], output_format: ToolOutputFormat = "compact") -> str:
+    """뉴스 리스트를 토큰 예산 안의 간결한 텍스트 또는 JSON으로 변환합니다.
+
+    제목/URL 등 머리글을 먼저 배치하고(예산이 부족하면 관련도가 낮은 기사부터 제외),
+    남은 예산을 관련도 점수에 비례하여 본문에 배분합니다. 관련도가 높은 기사일수록 본문이 길게 남습니다.
+    JSON 출력은 키, 따옴표, 봉투(`{"ticker": ..., "news": [...]}`)까지 포함한 직렬화 결과로 예산을 맞춥니다.
+
+    Args:
+        ticker: 주식 심볼
+        items: 뉴스 아이템 리스트
+        output_format: "compact" 또는 "json"
+
+    Returns:
+        str: 포맷된 뉴스 문자열
+    """
+    if not items:
+        return f"{ticker.upper()} news: none"
+
+    budget = token_budget("news_search")
+    ranked = sorted(items, key=lambda item: -(item.score or 0.0))
+
+    def header(item: NewsItem) -> dict[str, Any]:
+        data: dict[str, Any] = {"title": item.title, "url": item.url}
+        if item.published_date:
+            data["date"] = item.published_date
+        if item.score is not None:
+            data["score"] = round(item.score, 2)
+        if item.merged_count > 1:
+            data["merged"] = item.merged_count
+        return data
+
+    def render_header(data: dict[str, Any]) -> str:
+        meta = [
+            str(data[key]) if key == "date" else f"{key}={data[key]}"
+            for key in ("date", "score", "merged")
+            if key in data
+        ]
+        suffix = f" ({', '.join(meta)})" if meta else ""
+        return f"- {data['title']}{suffix} {data['url']}"
+
+    if output_format == "json":
+        # JSON은 키/따옴표/구분자까지 직렬화된 레코드 기준으로 비용을 계산
+        overhead = estimate_tokens(_dumps({"ticker": ticker.upper(), "news": []}))
+
+        def header_cost(item: NewsItem) -> int:
+            return estimate_tokens(_dumps({**header(item), "content": ""})) + 1
+    else:
+        overhead = estimate_tokens(f"{ticker.upper()} news ({len(items)}/{len(items)}):") + 1
+
+        def header_cost(item: NewsItem) -> int:
+            return estimate_tokens(render_header(header(item))) + 2
+
+    # 머리글이 예산 안에 들어갈 때까지 관련도가 낮은 기사 제외
+    kept = list(ranked)
+    while len(kept) > 1 and overhead + sum(header_cost(item) for item in kept) > budget:
+        kept.pop()
+    body_budget = budget - overhead - sum(header_cost(item) for item in kept)
+
+    # 원래(관련도) 순서를 유지하여 출력
+    order = {id(item): i for i, item in enumerate(items)}
+    kept.sort(key=lambda item: order[id(item)])
+    weights = [max(item.score or 0.0, 0.01) for item in kept]
+    needs = [estimate_tokens(item.content) for item in kept]
+
+    def render(allocations: list[int]) -> str:
+        entries = zip(kept, allocations, strict=True)
+        if output_format == "json":
+            records = [
+                {**header(item), "content": truncate_to_tokens(item.content.strip(), allocation)}
+                for item, allocation in entries
+            ]
+            return _dumps({"ticker": ticker.upper(), "news": records})
+
+        lines = [f"{ticker.upper()} news ({len(kept)}/{len(items)}):"]
+        for item, allocation in entries:
+            lines.append(render_header(header(item)))
+            content = truncate_to_tokens(" ".join(item.content.split()), allocation)
+            if content:
+                lines.append(f"  {content}")
+        return "\n".join(lines)
+
+    # 추정치 반올림/이스케이프로 예산을 넘으면 넘은 만큼 본문 예산을 줄여 다시 렌더링
+    text = render(_allocate_by_priority(needs, weights, body_budget))
+    while body_budget > 0 and (excess := estimate_tokens(text) - budget) > 0:
+        body_budget = max(0, body_budget - excess)
+        text = render(_allocate_by_priority(needs, weights, body_budget))
+    return text
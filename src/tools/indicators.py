@@ -0,0 +1,223 @@
+"""NumPy 기반 기술적 지표를 한 번의 순회로 계산하는 모듈입니다.
+
+EMA, MACD, ATR처럼 직전 값에 의존하는 지표는 시간 축을 한 번만 순회하며 함께 갱신하고,
+볼린저 밴드와 OBV는 벡터 연산으로 계산합니다. RSI는 단일 종목/일괄 경로가 모두 같은 값을 내도록
+`wilder_rsi` 하나로만 계산합니다.
+입력은 (날짜,) 1차원 배열 또는 (날짜 x 종목) 2차원 배열을 모두 지원합니다.
+"""
+
+from dataclasses import dataclass, fields
+
+import numpy as np
+import pandas as pd
+
+
+@dataclass(frozen=True, slots=True)
+class IndicatorSet:
+    """한 종목의 최신 지표 값을 담는 결과 객체입니다."""
+
+    ema_12: float
+    ema_26: float
+    macd: float
+    macd_signal: float
+    macd_hist: float
+    rsi: float
+    bb_upper: float
+    bb_middle: float
+    bb_lower: float
+    bb_percent_b: float
+    atr: float
+    obv: float
+
+    def to_dict(self) -> dict[str, float | None]:
+        """지표 값을 소수점 둘째 자리로 반올림한 딕셔너리로 변환합니다 (계산 불가 값은 None)."""
+        result: dict[str, float | None] = {}
+        for field in fields(self):
+            value = getattr(self, field.name)
+            result[field.name] = None if np.isnan(value) else round(float(value), 2)
+        return result
+
+
+# MACD 느린 EMA 기간 (이 봉 수부터 MACD가 의미를 가짐)
+_MACD_SLOW = 26
+
+
+def wilder_rsi(close: np.ndarray, period: int = 14) -> np.ndarray:
+    """Wilder 평활 RSI의 최신 값을 계산합니다.
+
+    첫 `period`개 가격 변화는 단순 평균으로 시작하고 이후에는 `(이전 평균 x (period - 1) + 새 값) / period`로
+    평활합니다. 종목마다 값이 있는 봉만 사용하므로 앞쪽이 NaN인 열(상장 전, `PriceMatrix.packed()`)도 지원합니다.
+
+    Args:
+        close: 종가 배열 (날짜,) 또는 (날짜 x 종목)
+        period: RSI 기간 (기본값: 14)
+
+    Returns:
+        np.ndarray: 종목별 RSI (0-100, 가격 변화가 `period`개 미만이면 NaN, 1차원 입력이면 0차원 배열)
+    """
+    close = np.asarray(close, dtype=float)
+    squeeze = close.ndim == 1
+    if squeeze:
+        close = close[:, None]
+
+    n_cols = close.shape[1]
+    count = np.zeros(n_cols, dtype=int)
+    avg_gain = np.zeros(n_cols)
+    avg_loss = np.zeros(n_cols)
+    for delta in np.diff(close, axis=0):
+        valid = ~np.isnan(delta)
+        gain = np.where(valid, np.clip(delta, 0, None), 0.0)
+        loss = np.where(valid, np.clip(-delta, 0, None), 0.0)
+        count += valid
+        # 첫 기간은 단순 평균 누적, 이후에는 지수 평활
+        seeding = valid & (count <= period)
+        smoothing = valid & (count > period)
+        avg_gain = np.where(seeding, avg_gain + gain / period, avg_gain)
+        avg_loss = np.where(seeding, avg_loss + loss / period, avg_loss)
+        avg_gain = np.where(smoothing, (avg_gain * (period - 1) + gain) / period, avg_gain)
+        avg_loss = np.where(smoothing, (avg_loss * (period - 1) + loss) / period, avg_loss)
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        rsi = np.where(avg_loss == 0, np.where(avg_gain > 0, 100.0, 50.0), 100 - 100 / (1 + avg_gain / avg_loss))
+    rsi = np.where(count >= period, rsi, np.nan)
+    return rsi[0] if squeeze else rsi
+
+
+def compute_indicator_arrays(
+    close: np.ndarray,
+    high: np.ndarray | None = None,
+    low: np.ndarray | None = None,
+    volume: np.ndarray | None = None,
+    rsi_period: int = 14,
+    atr_period: int = 14,
+    bb_period: int = 20,
+    bb_width: float = 2.0,
+) -> dict[str, np.ndarray]:
+    """종가(와 고가/저가/거래량) 배열에서 모든 지표의 최신 값을 계산합니다.
+
+    Args:
+        close: 종가 배열 (날짜,) 또는 (날짜 x 종목)
+        high: 고가 배열 (None이면 종가로 대체)
+        low: 저가 배열 (None이면 종가로 대체)
+        volume: 거래량 배열 (None이면 OBV는 NaN)
+        rsi_period: Wilder RSI 기간 (기본값: 14, `wilder_rsi`로 계산)
+        atr_period: ATR 기간 (기본값: 14)
+        bb_period: 볼린저 밴드 기간 (기본값: 20)
+        bb_width: 볼린저 밴드 표준편차 배수 (기본값: 2.0)
+
+    Returns:
+        dict[str, np.ndarray]: `IndicatorSet` 필드 이름별 종목 배열 (데이터가 부족하면 NaN)
+    """
+    close = np.asarray(close, dtype=float)
+    squeeze = close.ndim == 1
+    if squeeze:
+        close = close[:, None]
+    high = close if high is None else np.asarray(high, dtype=float).reshape(close.shape)
+    low = close if low is None else np.asarray(low, dtype=float).reshape(close.shape)
+
+    n_rows, n_cols = close.shape
+    nan = np.full(n_cols, np.nan)
+    k_12, k_26, k_9 = 2 / 13, 2 / 27, 2 / 10
+
+    ema_12 = ema_26 = macd_signal = nan
+    atr = nan
+    tr_sum = np.zeros(n_cols)
+
+    # 직전 값에 의존하는 지표를 한 번의 시간 축 순회로 함께 갱신
+    for t in range(n_rows):
+        price = close[t]
+        if t == 0:
+            ema_12 = ema_26 = price.copy()
+            continue
+
+        ema_12 = ema_12 + k_12 * (price - ema_12)
+        ema_26 = ema_26 + k_26 * (price - ema_26)
+        # 시그널선은 MACD가 의미를 갖는 첫 봉의 MACD 값으로 시작 (0으로 시작하면 초기 구간이 왜곡됨)
+        if t == _MACD_SLOW - 1:
+            macd_signal = ema_12 - ema_26
+        elif t >= _MACD_SLOW:
+            macd_signal = macd_signal + k_9 * ((ema_12 - ema_26) - macd_signal)
+
+        prev = close[t - 1]
+        true_range = np.maximum(high[t] - low[t], np.maximum(np.abs(high[t] - prev), np.abs(low[t] - prev)))
+
+        if t <= atr_period:
+            tr_sum += true_range
+            if t == atr_period:
+                atr = tr_sum / atr_period
+        else:
+            atr = (atr * (atr_period - 1) + true_range) / atr_period
+
+    macd = ema_12 - ema_26
+    # EMA 26은 최소 26봉이 있어야 의미가 있음
+    if n_rows < _MACD_SLOW:
+        ema_26 = macd = macd_signal = nan
+    if n_rows < 12:
+        ema_12 = nan
+
+    rsi = wilder_rsi(close, rsi_period)
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        # 볼린저 밴드: 최근 구간만 벡터 연산
+        if n_rows >= bb_period:
+            window = close[-bb_period:]
+            bb_middle = window.mean(axis=0)
+            bb_std = window.std(axis=0)
+            bb_upper = bb_middle + bb_width * bb_std
+            bb_lower = bb_middle - bb_width * bb_std
+            bb_percent_b = np.where(bb_upper > bb_lower, (close[-1] - bb_lower) / (bb_upper - bb_lower), 0.5)
+        else:
+            bb_middle = bb_upper = bb_lower = bb_percent_b = nan
+
+    # OBV: 전일 대비 방향 x 거래량의 누적합
+    if volume is not None and n_rows > 1:
+        volume = np.asarray(volume, dtype=float).reshape(close.shape)
+        direction = np.sign(np.diff(close, axis=0))
+        obv = np.nansum(direction * volume[1:], axis=0)
+    else:
+        obv = nan
+
+    result = {
+        "ema_12": ema_12,
+        "ema_26": ema_26,
+        "macd": macd,
+        "macd_signal": macd_signal,
+        "macd_hist": macd - macd_signal,
+        "rsi": rsi,
+        "bb_upper": bb_upper,
+        "bb_middle": bb_middle,
+        "bb_lower": bb_lower,
+        "bb_percent_b": bb_percent_b,
+        "atr": atr,
+        "obv": obv,
+    }
+    if squeeze:
+        return {name: np.asarray(values)[..., 0] for name, values in result.items()}
+    return result
+
+
+def compute_indicators(hist_data: pd.DataFrame) -> IndicatorSet:
+    """가격 이력 DataFrame에서 모든 지표의 최신 값을 계산합니다.
+
+    Args:
+        hist_data: OHLCV 가격 이력 (Close 필수, High/Low/Volume 선택)
+
+    Returns:
+        IndicatorSet: 최신 지표 값
+
+    Raises:
+        ValueError: 가격 이력이 비어 있는 경우
+    """
+    if hist_data.empty:
+        raise ValueError("지표 계산에 필요한 가격 이력이 없습니다.")
+
+    def column(name: str) -> np.ndarray | None:
+        return hist_data[name].to_numpy(dtype=float) if name in hist_data else None
+
+    values = compute_indicator_arrays(
+        hist_data["Close"].to_numpy(dtype=float),
+        high=column("High"),
+        low=column("Low"),
+        volume=column("Volume"),
+    )
+    return IndicatorSet(**{name: float(value) for name, value in values.items()})
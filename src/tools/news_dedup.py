@@ -0,0 +1,87 @@
+"""SimHash 지문으로 거의 같은 뉴스 기사를 묶어 하나로 합치는 모듈입니다."""
+
+import hashlib
+import re
+
+from src.models.research import NewsItem
+
+_TOKEN_PATTERN = re.compile(r"\w+")
+_FINGERPRINT_BITS = 64
+
+
+def _shingles(text: str, size: int) -> list[str]:
+    """텍스트를 소문자 단어 단위 shingle(연속 단어 묶음) 리스트로 변환합니다."""
+    tokens = _TOKEN_PATTERN.findall(text.lower())
+    if len(tokens) <= size:
+        return [" ".join(tokens)] if tokens else []
+    return [" ".join(tokens[i : i + size]) for i in range(len(tokens) - size + 1)]
+
+
+def simhash(text: str, shingle_size: int = 3) -> int:
+    """텍스트의 64비트 SimHash 지문을 계산합니다.
+
+    내용이 거의 같은 텍스트는 해밍 거리가 작은 지문을 갖습니다.
+
+    Args:
+        text: 지문을 계산할 텍스트
+        shingle_size: shingle 하나에 포함할 단어 수 (기본값: 3)
+
+    Returns:
+        int: 64비트 지문 (텍스트가 비어 있으면 0)
+    """
+    weights = [0] * _FINGERPRINT_BITS
+    for shingle in _shingles(text, shingle_size):
+        digest = int.from_bytes(hashlib.blake2b(shingle.encode("utf-8"), digest_size=8).digest(), "big")
+        for bit in range(_FINGERPRINT_BITS):
+            weights[bit] += 1 if digest >> bit & 1 else -1
+
+    fingerprint = 0
+    for bit, weight in enumerate(weights):
+        if weight > 0:
+            fingerprint |= 1 << bit
+    return fingerprint
+
+
+def hamming_distance(a: int, b: int) -> int:
+    """두 지문 사이의 해밍 거리(서로 다른 비트 수)를 반환합니다."""
+    return (a ^ b).bit_count()
+
+
+def _fingerprint_text(item: NewsItem) -> str:
+    """지문 계산에 사용할 텍스트를 반환합니다 (본문이 없으면 제목 사용)."""
+    return item.content.strip() or item.title
+
+
+def deduplicate_news(items: list[NewsItem], max_distance: int = 12, shingle_size: int = 3) -> list[NewsItem]:
+    """내용이 거의 같은 뉴스를 묶어 묶음마다 관련도 점수가 가장 높은 기사 하나만 남깁니다.
+
+    남은 기사의 `merged_count`에는 묶음에 포함된 기사 수(자기 자신 포함)가 기록되며,
+    결과는 원래 순서를 유지합니다.
+
+    Args:
+        items: 뉴스 아이템 리스트
+        max_distance: 같은 기사로 판단할 최대 지문 해밍 거리 (0-64, 기본값: 12)
+        shingle_size: shingle 하나에 포함할 단어 수 (기본값: 3)
+
+    Returns:
+        list[NewsItem]: 중복이 제거된 뉴스 아이템 리스트
+    """
+    if len(items) < 2:
+        return list(items)
+
+    fingerprints = [simhash(_fingerprint_text(item), shingle_size) for item in items]
+
+    # 점수가 높은 기사부터 대표로 선정 (점수가 같으면 원래 순서 우선)
+    order = sorted(range(len(items)), key=lambda i: (-(items[i].score or 0.0), i))
+    representatives: list[int] = []
+    counts: dict[int, int] = {}
+    for index in order:
+        for rep in representatives:
+            if hamming_distance(fingerprints[index], fingerprints[rep]) <= max_distance:
+                counts[rep] += items[index].merged_count
+                break
+        else:
+            representatives.append(index)
+            counts[index] = items[index].merged_count
+
+    return [items[i].model_copy(update={"merged_count": counts[i]}) for i in sorted(representatives)]
@@ -1,19 +1,174 @@
-"""tavily 기반 뉴스 검색 도구를 정의하는 모듈입니다."""
+"""tavily 기반 뉴스 검색 도구를 정의하는 모듈입니다.
+
+`news_cache_path`를 설정하면 검색 결과 캐시를 파일로 유지합니다. 파일 읽기/쓰기는 이벤트 루프를 막지 않도록
+작업 스레드에서 실행하고, 쓰기는 `news_cache_save_interval` 동안의 변경을 모아 한 번에(그리고 종료 시) 합니다.
+"""
+
+import asyncio
+import atexit
+import threading
+from typing import TYPE_CHECKING, Literal
 
 from langchain_core.tools import tool
-from tavily import TavilyClient
 
 from src.config import settings
+from src.data.cache import MarketDataCache
+from src.data.scheduler import get_upstream_scheduler
 from src.models.research import NewsItem
+from src.tools.formatting import format_news
+from src.tools.news_dedup import deduplicate_news
+from src.tracing import record_event, traced
+
+if TYPE_CHECKING:
+    from tavily import AsyncTavilyClient, TavilyClient
+
+# 프로세스 전역 뉴스 검색 결과 캐시 (처음 사용할 때 설정으로 생성, 값은 Tavily 결과 딕셔너리 리스트)
+_news_cache: MarketDataCache | None = None
+
+# 공유 Tavily 클라이언트 (처음 사용할 때 SDK를 불러와 생성)
+_client: "TavilyClient | None" = None
+_async_client: "AsyncTavilyClient | None" = None
+_client_lock = threading.Lock()
+_persisted_loaded = False
+
+# 예약된 캐시 파일 저장 (변경이 생기면 한 번만 예약하고 저장 후 해제)
+_save_timer: threading.Timer | None = None
+_save_lock = threading.Lock()
+_save_at_exit = False
+
+
+def get_news_cache() -> MarketDataCache:
+    """프로세스 전역 뉴스 검색 결과 캐시를 반환합니다 (싱글톤, import 시점에는 설정을 읽지 않음)."""
+    global _news_cache
+    if _news_cache is None:
+        with _client_lock:
+            if _news_cache is None:
+                _news_cache = MarketDataCache(
+                    max_entries=settings.news_cache_max_entries,
+                    ttls={"news": settings.news_cache_ttl},
+                )
+    return _news_cache
+
+
+def get_tavily_client() -> "TavilyClient":
+    """프로세스 전역에서 공유하는 동기 Tavily 클라이언트를 반환합니다."""
+    global _client
+    if _client is None:
+        with _client_lock:
+            if _client is None:
+                from tavily import TavilyClient
+
+                _client = TavilyClient(api_key=settings.tavily_api_key)
+    return _client
+
+
+def get_async_tavily_client() -> "AsyncTavilyClient":
+    """프로세스 전역에서 공유하는 비동기 Tavily 클라이언트를 반환합니다."""
+    global _async_client
+    if _async_client is None:
+        with _client_lock:
+            if _async_client is None:
+                from tavily import AsyncTavilyClient
+
+                _async_client = AsyncTavilyClient(api_key=settings.tavily_api_key)
+    return _async_client
+
+
+def _build_query(ticker: str, query: str) -> str:
+    """Tavily 검색 쿼리를 구성합니다."""
+    if query:
+        return f"{ticker} {query} stock news"
+    return f"{ticker} stock news"
+
+
+def normalize_query(query: str) -> str:
+    """캐시 키용으로 추가 검색 쿼리를 정규화합니다 (소문자, 공백 정리)."""
+    return " ".join(query.lower().split())
+
+
+def _cache_params(query: str, search_depth: str, max_results: int) -> tuple[str, str, int]:
+    """(정규화 쿼리, 검색 깊이, 최대 결과 수) 캐시 파라미터를 생성합니다."""
+    return (normalize_query(query), search_depth, max_results)
+
+
+def _load_persisted_cache() -> None:
+    """디스크에 저장된 뉴스 캐시를 처음 한 번만 불러옵니다."""
+    global _persisted_loaded
+    if _persisted_loaded or not settings.news_cache_path:
+        return
+    with _client_lock:
+        if not _persisted_loaded:
+            get_news_cache().load(settings.news_cache_path)
+            _persisted_loaded = True
+
+
+def flush_news_cache() -> None:
+    """예약된 뉴스 캐시 파일 저장을 지금 실행합니다 (저장할 변경이 없으면 아무것도 하지 않음)."""
+    global _save_timer
+    with _save_lock:
+        if _save_timer is None:
+            return
+        _save_timer.cancel()
+        _save_timer = None
+    if settings.news_cache_path:
+        get_news_cache().save(settings.news_cache_path)
+
+
+def _schedule_save() -> None:
+    """캐시 파일 저장을 작업 스레드에 예약합니다 (이미 예약되어 있으면 그 저장에 합쳐짐)."""
+    global _save_timer, _save_at_exit
+    with _save_lock:
+        if _save_timer is not None:
+            return
+        if not _save_at_exit:
+            atexit.register(flush_news_cache)
+            _save_at_exit = True
+        _save_timer = threading.Timer(settings.news_cache_save_interval, flush_news_cache)
+        _save_timer.daemon = True
+        _save_timer.start()
+
+
+def _store_results(ticker: str, params: tuple[str, str, int], results: list[dict]) -> None:
+    """검색 결과를 캐시에 저장하고, 설정 시 디스크 저장을 예약합니다."""
+    get_news_cache().set(ticker, "news", results, *params)
+    if settings.news_cache_path:
+        _schedule_save()
+
+
+def _to_news_items(results: list[dict]) -> list[NewsItem]:
+    """Tavily 검색 결과를 NewsItem 리스트로 변환합니다 (설정 시 유사 기사 병합)."""
+    news_items = []
+    for result in results:
+        news_items.append(
+            NewsItem(
+                title=result.get("title", ""),
+                url=result.get("url", ""),
+                content=result.get("content", ""),
+                published_date=result.get("published_date"),
+                score=result.get("score"),
+            )
+        )
+
+    if settings.news_dedup_enabled:
+        return deduplicate_news(news_items, max_distance=settings.news_dedup_max_distance)
+    return news_items
 
 
-def search_stock_news(ticker: str, query: str = "", max_results: int = 5) -> list[NewsItem]:
+@traced
+def search_stock_news(
+    ticker: str, query: str = "", max_results: int = 5, search_depth: Literal["basic", "advanced"] | None = None
+) -> list[NewsItem]:
     """Tavily API를 사용하여 주식 관련 뉴스를 검색합니다.
 
+    같은 (티커, 쿼리, 검색 깊이, 최대 결과 수) 요청은 캐시 유효 시간 동안 로컬에서 응답하고,
+    캐시 미스는 업스트림 스케줄러를 거쳐 속도 제한과 스로틀링(429) 재시도가 적용됩니다.
+    내용이 거의 같은 기사(신디케이션 등)는 관련도가 가장 높은 하나로 합쳐집니다.
+
     Args:
         ticker: 주식 심볼 (예: "AAPL", "TSLA")
         query: 추가 검색 쿼리 (선택 사항, 기본값: "")
         max_results: 최대 결과 수 (기본값: 5)
+        search_depth: 검색 깊이 ("basic" 또는 "advanced", 기본값: 설정값)
 
     Returns:
         list[NewsItem]: 뉴스 아이템 리스트
@@ -22,30 +177,70 @@ def search_stock_news(ticker: str, query: str = "", max_results: int = 5) -> lis
         ValueError: API 호출 실패 또는 검색 중 오류 발생
     """
     try:
-        client = TavilyClient(api_key=settings.tavily_api_key)
-
-        # 검색 쿼리 구성
-        search_query = f"{ticker} stock news"
-        if query:
-            search_query = f"{ticker} {query} stock news"
-
-        # Tavily 검색 실행
-        response = client.search(query=search_query, search_depth="advanced", max_results=max_results)
-
-        # 결과 변환
-        news_items = []
-        for result in response.get("results", []):
-            news_items.append(
-                NewsItem(
-                    title=result.get("title", ""),
-                    url=result.get("url", ""),
-                    content=result.get("content", ""),
-                    published_date=result.get("published_date"),
-                    score=result.get("score"),
+        _load_persisted_cache()
+        depth = search_depth or settings.news_search_depth
+        params = _cache_params(query, depth, max_results)
+
+        hit, results = get_news_cache().get(ticker, "news", *params)
+        if not hit:
+            # Tavily 검색 실행 (속도 제한/재시도 적용, 동시에 들어온 같은 검색은 한 번만 호출)
+            search_query = _build_query(ticker, query)
+
+            def search() -> dict:
+                record_event("tavily_calls")
+                return get_tavily_client().search(query=search_query, search_depth=depth, max_results=max_results)
+
+            response = get_upstream_scheduler().call("tavily", (ticker.upper(), *params), search)
+            results = response.get("results", [])
+            _store_results(ticker, params, results)
+
+        return _to_news_items(results)
+
+    except Exception as e:
+        raise ValueError(f"뉴스 검색 중 오류 발생: {str(e)}") from e
+
+
+@traced
+async def asearch_stock_news(
+    ticker: str, query: str = "", max_results: int = 5, search_depth: Literal["basic", "advanced"] | None = None
+) -> list[NewsItem]:
+    """`search_stock_news`의 비동기 버전입니다 (비차단 HTTP 클라이언트 사용, 캐시 공유).
+
+    Args:
+        ticker: 주식 심볼 (예: "AAPL", "TSLA")
+        query: 추가 검색 쿼리 (선택 사항, 기본값: "")
+        max_results: 최대 결과 수 (기본값: 5)
+        search_depth: 검색 깊이 ("basic" 또는 "advanced", 기본값: 설정값)
+
+    Returns:
+        list[NewsItem]: 뉴스 아이템 리스트
+
+    Raises:
+        ValueError: API 호출 실패 또는 검색 중 오류 발생
+    """
+    try:
+        if not _persisted_loaded and settings.news_cache_path:
+            # 처음 한 번 파일을 읽는 동안 이벤트 루프를 막지 않음
+            await asyncio.to_thread(_load_persisted_cache)
+        depth = search_depth or settings.news_search_depth
+        params = _cache_params(query, depth, max_results)
+
+        hit, results = get_news_cache().get(ticker, "news", *params)
+        if not hit:
+            # Tavily 비동기 검색 실행 (동기 검색과 같은 스케줄러를 공유)
+            search_query = _build_query(ticker, query)
+
+            async def search() -> dict:
+                record_event("tavily_calls")
+                return await get_async_tavily_client().search(
+                    query=search_query, search_depth=depth, max_results=max_results
                 )
-            )
 
-        return news_items
+            response = await get_upstream_scheduler().acall("tavily", (ticker.upper(), *params), search)
+            results = response.get("results", [])
+            _store_results(ticker, params, results)
+
+        return _to_news_items(results)
 
     except Exception as e:
         raise ValueError(f"뉴스 검색 중 오류 발생: {str(e)}") from e
@@ -68,6 +263,9 @@ def news_search_tool(ticker: str, query: str = "") -> str:
         if not news_items:
             return f"'{ticker}'에 대한 뉴스를 찾을 수 없습니다."
 
+        if settings.tool_output_format != "verbose":
+            return format_news(ticker, news_items, settings.tool_output_format)
+
         result = f"\n=== {ticker} 관련 뉴스 ({len(news_items)}개) ===\n\n"
 
         for i, item in enumerate(news_items, 1):
@@ -81,6 +279,9 @@ def news_search_tool(ticker: str, query: str = "") -> str:
             if item.score is not None:
                 result += f"관련도: {item.score:.2f}\n"
 
+            if item.merged_count > 1:
+                result += f"유사 기사: {item.merged_count}건 병합\n"
+
             result += "\n" + "-" * 80 + "\n\n"
 
         return result
@@ -1,11 +1,18 @@
 """yfinance 기반 주식 데이터 조회 도구를 정의하는 모듈입니다."""
 
-import yfinance as yf
+import asyncio
+
 from langchain_core.tools import tool
 
+from src.config import settings
+from src.data.compact import Fundamentals
+from src.data.market import get_price_matrix, get_ticker_info
 from src.models.stock import FinancialData, StockPrice
+from src.tools.formatting import format_financial_data, format_stock_price
+from src.tracing import traced
 
 
+@traced
 def get_stock_price(ticker: str) -> StockPrice:
     """yfinance를 사용하여 현재 주가 정보를 조회합니다.
 
@@ -19,8 +26,7 @@ def get_stock_price(ticker: str) -> StockPrice:
         ValueError: 유효하지 않은 티커이거나 데이터를 가져올 수 없는 경우
     """
     try:
-        stock = yf.Ticker(ticker)
-        info = stock.info
+        info = get_ticker_info(ticker)
 
         # 필수 데이터 확인
         if not info or "currentPrice" not in info:
@@ -48,6 +54,7 @@ def get_stock_price(ticker: str) -> StockPrice:
         raise ValueError(f"주가 데이터 조회 중 오류 발생: {str(e)}") from e
 
 
+@traced
 def get_financial_data(ticker: str) -> FinancialData:
     """yfinance를 사용하여 재무제표 데이터를 조회합니다.
 
@@ -61,25 +68,74 @@ def get_financial_data(ticker: str) -> FinancialData:
         ValueError: 유효하지 않은 티커이거나 데이터를 가져올 수 없는 경우
     """
     try:
-        stock = yf.Ticker(ticker)
-        info = stock.info
+        info = get_ticker_info(ticker)
 
         if not info:
             raise ValueError(f"티커 '{ticker}'에 대한 데이터를 가져올 수 없습니다.")
 
-        return FinancialData(
-            symbol=ticker.upper(),
-            revenue=info.get("totalRevenue"),
-            net_income=info.get("netIncomeToCommon"),
-            eps=info.get("trailingEps"),
-            pe_ratio=info.get("trailingPE"),
-            debt_to_equity=info.get("debtToEquity"),
-        )
+        return Fundamentals.from_info(ticker, info).to_model()
 
     except Exception as e:
         raise ValueError(f"재무 데이터 조회 중 오류 발생: {str(e)}") from e
 
 
+async def aget_stock_price(ticker: str) -> StockPrice:
+    """`get_stock_price`의 비동기 버전입니다 (yfinance 호출은 스레드로 오프로딩).
+
+    Args:
+        ticker: 주식 심볼 (예: "AAPL", "TSLA")
+
+    Returns:
+        StockPrice: 현재가, 전일 종가, 등락률, 거래량, 시가총액 정보
+
+    Raises:
+        ValueError: 유효하지 않은 티커이거나 데이터를 가져올 수 없는 경우
+    """
+    return await asyncio.to_thread(get_stock_price, ticker)
+
+
+async def aget_financial_data(ticker: str) -> FinancialData:
+    """`get_financial_data`의 비동기 버전입니다 (yfinance 호출은 스레드로 오프로딩).
+
+    Args:
+        ticker: 주식 심볼 (예: "AAPL", "TSLA")
+
+    Returns:
+        FinancialData: 매출액, 순이익, EPS, PER, 부채비율 정보
+
+    Raises:
+        ValueError: 유효하지 않은 티커이거나 데이터를 가져올 수 없는 경우
+    """
+    return await asyncio.to_thread(get_financial_data, ticker)
+
+
+def get_stock_prices(tickers: list[str], period: str = "1y") -> dict[str, StockPrice]:
+    """여러 종목의 주가 정보를 일괄 조회 한 번으로 계산합니다.
+
+    일봉 이력을 공급자 일괄 조회 한 번으로 받아 최신 종가를 현재가, 직전 종가를 전일 종가로 사용합니다.
+    이력은 float32 압축 행렬(`PriceMatrix`)로만 보관합니다.
+    기본 조회 기간은 `get_technical_summaries`와 같아 같은 일괄 요청을 재사용합니다.
+    일괄 조회에는 시가총액이 포함되지 않으므로 market_cap은 None입니다.
+
+    Args:
+        tickers: 주식 심볼 리스트 (예: ["AAPL", "TSLA"])
+        period: 일봉 조회 기간 (기본값: "1y")
+
+    Returns:
+        dict[str, StockPrice]: 티커별 주가 정보 (데이터를 가져오지 못한 종목은 제외)
+
+    Raises:
+        ValueError: 일괄 조회 중 오류 발생
+    """
+    try:
+        quotes = get_price_matrix(tickers, period=period).latest_quotes()
+        # pydantic 모델은 반환 직전(도구 경계)에만 생성
+        return {symbol: quote.to_model() for symbol, quote in quotes.items()}
+
+    except Exception as e:
+        raise ValueError(f"일괄 주가 데이터 조회 중 오류 발생: {str(e)}") from e
+
+
 @tool
 def stock_price_tool(ticker: str) -> str:
     """주식의 현재 가격 정보를 조회합니다.
@@ -92,6 +148,9 @@ def stock_price_tool(ticker: str) -> str:
     """
     try:
         price_data = get_stock_price(ticker)
+        if settings.tool_output_format != "verbose":
+            return format_stock_price(price_data, settings.tool_output_format)
+
         return f"""
 주식 심볼: {price_data.symbol}
 현재가: ${price_data.current_price:,.2f}
@@ -116,6 +175,8 @@ def financial_data_tool(ticker: str) -> str:
     """
     try:
         financial = get_financial_data(ticker)
+        if settings.tool_output_format != "verbose":
+            return format_financial_data(financial, settings.tool_output_format)
 
         def format_value(value: float | None, prefix: str = "$", suffix: str = "") -> str:
             if value is None:
@@ -0,0 +1,336 @@
+"""분봉 스트림에서 기술적 지표를 증분 계산하는 도구를 정의하는 모듈입니다.
+
+종목별 고정 크기 링 버퍼에 새 분봉만 밀어 넣고, 이동평균과 Wilder RSI를
+봉 하나당 O(1)로 갱신합니다. 매 호출마다 전체 이력을 다시 계산하지 않습니다.
+"""
+
+import asyncio
+import threading
+
+import numpy as np
+import pandas as pd
+from langchain_core.tools import tool
+
+from src.data.market import get_intraday_bars
+from src.tools.analysis import determine_signal
+from src.tracing import traced
+
+
+class RingBuffer:
+    """고정 크기 float 링 버퍼입니다."""
+
+    def __init__(self, capacity: int) -> None:
+        """버퍼를 초기화합니다.
+
+        Args:
+            capacity: 보관할 최대 값 개수
+        """
+        if capacity <= 0:
+            raise ValueError("capacity는 1 이상이어야 합니다.")
+        self.capacity = capacity
+        self._values = np.zeros(capacity, dtype=float)
+        self._head = 0  # 다음에 쓸 위치
+        self._size = 0
+
+    def __len__(self) -> int:
+        return self._size
+
+    def push(self, value: float) -> None:
+        """값을 추가합니다 (가득 차면 가장 오래된 값을 덮어씀)."""
+        self._values[self._head] = value
+        self._head = (self._head + 1) % self.capacity
+        self._size = min(self._size + 1, self.capacity)
+
+    def ago(self, k: int) -> float:
+        """k개 이전 값을 반환합니다 (0이면 가장 최근 값)."""
+        if not 0 <= k < self._size:
+            raise IndexError(f"버퍼에 {k}개 이전 값이 없습니다.")
+        return float(self._values[(self._head - 1 - k) % self.capacity])
+
+    def to_array(self) -> np.ndarray:
+        """오래된 값부터 최신 값 순서의 배열 복사본을 반환합니다."""
+        if self._size < self.capacity:
+            return self._values[: self._size].copy()
+        return np.roll(self._values, -self._head)
+
+
+class StreamingIndicators:
+    """한 종목의 이동평균과 Wilder RSI를 봉 단위로 증분 갱신합니다."""
+
+    def __init__(self, ma_periods: tuple[int, ...] = (20, 50, 200), rsi_period: int = 14) -> None:
+        """지표 상태를 초기화합니다.
+
+        Args:
+            ma_periods: 이동평균 기간 (기본값: 20, 50, 200봉)
+            rsi_period: RSI 기간 (기본값: 14봉)
+        """
+        self.ma_periods = tuple(sorted(ma_periods))
+        self.rsi_period = rsi_period
+        self.closes = RingBuffer(max(self.ma_periods))
+        self.bars_processed = 0
+
+        self._sums = dict.fromkeys(self.ma_periods, 0.0)
+        self._prev_close: float | None = None
+        self._gain_sum = 0.0
+        self._loss_sum = 0.0
+        self._avg_gain: float | None = None
+        self._avg_loss: float | None = None
+        self._deltas_seen = 0
+
+    def update(self, close: float) -> None:
+        """새 봉의 종가를 반영합니다 (O(1)).
+
+        Args:
+            close: 새 봉의 종가
+        """
+        # 이동평균: 창에서 빠지는 값을 빼고 새 값을 더함
+        for period in self.ma_periods:
+            leaving = self.closes.ago(period - 1) if len(self.closes) >= period else 0.0
+            self._sums[period] += close - leaving
+        self.closes.push(close)
+        self.bars_processed += 1
+
+        # 누적 오차 방지를 위해 버퍼가 한 바퀴 돌 때마다 합계를 다시 계산
+        if self.bars_processed % self.closes.capacity == 0:
+            values = self.closes.to_array()
+            for period in self.ma_periods:
+                self._sums[period] = float(values[-period:].sum())
+
+        # Wilder RSI: 첫 기간은 단순 평균, 이후에는 지수 평활
+        if self._prev_close is not None:
+            delta = close - self._prev_close
+            gain, loss = max(delta, 0.0), max(-delta, 0.0)
+            self._deltas_seen += 1
+
+            if self._avg_gain is None or self._avg_loss is None:
+                self._gain_sum += gain
+                self._loss_sum += loss
+                if self._deltas_seen == self.rsi_period:
+                    self._avg_gain = self._gain_sum / self.rsi_period
+                    self._avg_loss = self._loss_sum / self.rsi_period
+            else:
+                self._avg_gain = (self._avg_gain * (self.rsi_period - 1) + gain) / self.rsi_period
+                self._avg_loss = (self._avg_loss * (self.rsi_period - 1) + loss) / self.rsi_period
+        self._prev_close = close
+
+    def moving_average(self, period: int) -> float | None:
+        """현재 이동평균을 반환합니다 (봉이 부족하면 None)."""
+        if period not in self._sums or len(self.closes) < period:
+            return None
+        return self._sums[period] / period
+
+    def rsi(self) -> float | None:
+        """현재 Wilder RSI를 반환합니다 (봉이 부족하면 None)."""
+        if self._avg_gain is None or self._avg_loss is None:
+            return None
+        if self._avg_loss == 0:
+            return 100.0 if self._avg_gain > 0 else 50.0
+        rs = self._avg_gain / self._avg_loss
+        return 100 - (100 / (1 + rs))
+
+
+class StreamingIndicatorEngine:
+    """종목별 `StreamingIndicators`를 보관하고 새 분봉만 반영하는 엔진입니다."""
+
+    def __init__(
+        self,
+        ma_periods: tuple[int, ...] = (20, 50, 200),
+        rsi_period: int = 14,
+        bar_interval: pd.Timedelta = pd.Timedelta(minutes=1),
+    ) -> None:
+        """엔진을 초기화합니다.
+
+        Args:
+            ma_periods: 종목마다 적용할 이동평균 기간
+            rsi_period: 종목마다 적용할 RSI 기간
+            bar_interval: 봉 간격 (봉 시작 시각에서 이 시간이 지나면 완성된 봉으로 판단)
+        """
+        self.ma_periods = ma_periods
+        self.rsi_period = rsi_period
+        self.bar_interval = bar_interval
+        self._states: dict[str, StreamingIndicators] = {}
+        self._last_bar: dict[str, pd.Timestamp] = {}
+        self._lock = threading.Lock()
+
+    def last_bar(self, ticker: str) -> pd.Timestamp | None:
+        """종목에 마지막으로 반영한 완성 봉의 시각을 반환합니다 (없으면 None)."""
+        with self._lock:
+            return self._last_bar.get(ticker.strip().upper())
+
+    def ingest(self, ticker: str, bars: pd.DataFrame, now: pd.Timestamp | None = None) -> int:
+        """분봉 DataFrame 중 아직 반영하지 않은 완성 봉만 지표에 반영합니다.
+
+        봉 시작 시각이 `now - bar_interval` 이전인 봉만 완성된 것으로 보고 반영합니다
+        (장 마감 봉처럼 더 이상 갱신되지 않는 마지막 봉도 포함). 받은 봉이 마지막으로 반영한 봉까지
+        거슬러 올라가지 않으면(그 사이 봉이 빠짐) 이어지지 않는 데이터를 섞지 않도록 종목 상태를 초기화하고
+        받은 봉 전체로 다시 계산합니다.
+
+        Args:
+            ticker: 주식 심볼
+            bars: 시간 오름차순 분봉 (Close 컬럼 필요)
+            now: 현재 시각 (기본값: 지금, 분봉 인덱스와 같은 타임존)
+
+        Returns:
+            int: 새로 반영한 봉 수
+        """
+        symbol = ticker.strip().upper()
+        if now is None:
+            tz = getattr(bars.index, "tz", None)
+            now = pd.Timestamp.now(tz=tz) if tz is not None else pd.Timestamp.now()
+
+        with self._lock:
+            state = self._states.get(symbol)
+            last_bar = self._last_bar.get(symbol)
+            if state is not None and last_bar is not None and (bars.empty or bars.index[0] > last_bar):
+                # 마지막 반영 봉 이후의 봉이 빠져 있으므로 받은 봉으로 처음부터 다시 계산
+                state = last_bar = None
+                self._last_bar.pop(symbol, None)
+            if state is None:
+                state = self._states[symbol] = StreamingIndicators(self.ma_periods, self.rsi_period)
+
+            new_bars = bars if last_bar is None else bars[bars.index > last_bar]
+            complete = new_bars[new_bars.index <= now - self.bar_interval]
+            for close in complete["Close"].to_numpy(dtype=float):
+                if not np.isnan(close):
+                    state.update(float(close))
+
+            if not complete.empty:
+                self._last_bar[symbol] = complete.index[-1]
+            return len(complete)
+
+    def snapshot(self, ticker: str, last_price: float | None = None) -> dict:
+        """종목의 현재 지표 값을 반환합니다.
+
+        Args:
+            ticker: 주식 심볼
+            last_price: 진행 중인 봉의 현재가 (없으면 마지막 완성 봉 종가)
+
+        Returns:
+            dict: 이동평균, RSI, 매매 시그널을 포함한 지표 요약
+
+        Raises:
+            ValueError: 해당 종목에 반영된 봉이 없는 경우
+        """
+        symbol = ticker.strip().upper()
+        with self._lock:
+            state = self._states.get(symbol)
+            if state is None or state.bars_processed == 0:
+                raise ValueError(f"티커 '{ticker}'에 대한 분봉 데이터가 없습니다.")
+
+            price = last_price if last_price is not None else state.closes.ago(0)
+            moving_averages = {
+                f"SMA_{period}": None if (ma := state.moving_average(period)) is None else round(ma, 2)
+                for period in state.ma_periods
+            }
+            rsi = state.rsi()
+            last_bar = self._last_bar.get(symbol)
+
+        return {
+            "current_price": round(price, 2),
+            "last_bar": last_bar.isoformat() if last_bar is not None else None,
+            "bars_processed": state.bars_processed,
+            "moving_averages": moving_averages,
+            "rsi": None if rsi is None else round(rsi, 2),
+            "signal": determine_signal(price, moving_averages.get("SMA_50"), rsi) if rsi is not None else "NEUTRAL",
+        }
+
+    def has_state(self, ticker: str) -> bool:
+        """종목에 대한 지표 상태가 있는지 반환합니다."""
+        with self._lock:
+            return ticker.strip().upper() in self._states
+
+    def reset(self, ticker: str | None = None) -> None:
+        """종목(또는 전체)의 지표 상태를 초기화합니다."""
+        with self._lock:
+            if ticker is None:
+                self._states.clear()
+                self._last_bar.clear()
+            else:
+                self._states.pop(ticker.strip().upper(), None)
+                self._last_bar.pop(ticker.strip().upper(), None)
+
+
+# 프로세스 전역 스트리밍 지표 엔진 (싱글톤)
+streaming_engine = StreamingIndicatorEngine()
+
+
+@traced
+def get_intraday_indicators(ticker: str) -> dict:
+    """1분봉 기준 장중 이동평균(20/50/200봉)과 Wilder RSI(14봉)를 조회합니다.
+
+    처음 조회한 종목은 최근 5거래일치 분봉으로 지표를 채우고, 이후에는 마지막으로
+    반영한 봉 이후의 새 분봉만 증분 반영합니다. 마지막 반영 봉이 오늘 이전이면 그 사이 세션의 봉까지
+    받도록 5거래일치를 다시 조회하며, 그보다 오래 비어 있으면 지표를 새로 계산합니다.
+
+    Args:
+        ticker: 주식 심볼 (예: "AAPL", "TSLA")
+
+    Returns:
+        dict: 현재가, 분봉 이동평균, RSI, 매매 시그널을 포함한 장중 지표 요약
+
+    Raises:
+        ValueError: 데이터 조회 실패 또는 계산 중 오류 발생
+    """
+    try:
+        last_bar = streaming_engine.last_bar(ticker)
+        # 오늘 반영한 봉이 있으면 오늘 세션만, 아니면 빠진 세션을 덮도록 5거래일치를 조회
+        today = pd.Timestamp.now(tz=last_bar.tz).date() if last_bar is not None else None
+        period = "1d" if last_bar is not None and last_bar.date() == today else "5d"
+        bars = get_intraday_bars(ticker, period=period)
+
+        if bars.empty:
+            raise ValueError(f"티커 '{ticker}'에 대한 분봉 데이터를 가져올 수 없습니다.")
+
+        streaming_engine.ingest(ticker, bars)
+        return streaming_engine.snapshot(ticker, last_price=float(bars["Close"].iloc[-1]))
+
+    except Exception as e:
+        raise ValueError(f"장중 지표 계산 중 오류 발생: {str(e)}") from e
+
+
+async def aget_intraday_indicators(ticker: str) -> dict:
+    """`get_intraday_indicators`의 비동기 버전입니다 (yfinance 호출은 스레드로 오프로딩).
+
+    Args:
+        ticker: 주식 심볼 (예: "AAPL", "TSLA")
+
+    Returns:
+        dict: 현재가, 분봉 이동평균, RSI, 매매 시그널을 포함한 장중 지표 요약
+
+    Raises:
+        ValueError: 데이터 조회 실패 또는 계산 중 오류 발생
+    """
+    return await asyncio.to_thread(get_intraday_indicators, ticker)
+
+
+@tool
+def intraday_indicators_tool(ticker: str) -> str:
+    """주식의 장중(1분봉) 기술적 지표를 조회합니다.
+
+    Args:
+        ticker: 주식 심볼 (예: "AAPL", "TSLA")
+
+    Returns:
+        str: 장중 지표를 담은 포맷된 문자열
+    """
+    try:
+        summary = get_intraday_indicators(ticker)
+
+        result = f"\n=== {ticker} 장중 지표 (1분봉) ===\n\n"
+        result += f"현재가: ${summary['current_price']:,.2f}\n"
+        result += f"마지막 완성 봉: {summary['last_bar']}\n\n"
+
+        result += "이동평균선:\n"
+        for key, value in summary["moving_averages"].items():
+            result += f"  {key}: ${value:,.2f}\n" if value is not None else f"  {key}: N/A\n"
+
+        rsi = summary["rsi"]
+        result += f"\nRSI (Wilder, 14봉): {rsi:.2f}\n" if rsi is not None else "\nRSI (Wilder, 14봉): N/A\n"
+
+        signal_kr = {"BUY": "매수", "SELL": "매도", "NEUTRAL": "중립"}
+        result += f"장중 시그널: {signal_kr.get(summary['signal'], summary['signal'])}\n"
+
+        return result
+
+    except Exception as e:
+        return f"오류: {str(e)}"
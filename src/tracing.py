@@ -0,0 +1,472 @@
+"""실행 단위 지연 시간/토큰 추적(tracing) 모듈입니다.
+
+한 번의 조사 실행(`trace_run`) 동안 다음을 span으로 기록합니다.
+
+- 도구 함수 (`traced` 데코레이터): 소요 시간, 캐시 적중/미스, 업스트림 호출 수
+- 서브에이전트 (`task` 도구 또는 병렬 위임): 소요 시간
+- LLM 호출 (`TracingCallbackHandler`): 소요 시간, 입력/출력 토큰 수, 호출한 서브에이전트
+
+실행이 끝나면 실행별 JSON trace를 저장하고, 프로세스 전역 집계(히스토그램)에 반영합니다.
+"""
+
+import functools
+import inspect
+import json
+import os
+import threading
+import time
+import uuid
+from collections import defaultdict, deque
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import asdict, dataclass, field
+from datetime import datetime
+from typing import Any
+from uuid import UUID
+
+from langchain_core.callbacks import BaseCallbackHandler
+from langchain_core.outputs import LLMResult
+
+from src.config import settings
+
+# 지연 시간 히스토그램 구간 상한 (초)
+HISTOGRAM_BUCKETS = (0.01, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0, float("inf"))
+
+# 서브에이전트에 작업을 위임하는 도구 이름
+_SUBAGENT_TOOLS = ("task",)
+
+
+@dataclass
+class Span:
+    """실행 중 측정한 구간 하나를 나타내는 클래스입니다."""
+
+    name: str
+    kind: str  # "tool", "subagent", "llm"
+    start: float  # 실행 시작 기준 오프셋 (초)
+    duration: float = 0.0
+    status: str = "ok"  # "ok" 또는 "error"
+    attributes: dict[str, Any] = field(default_factory=dict)
+    counters: dict[str, int] = field(default_factory=dict)
+
+
+class RunTrace:
+    """한 번의 조사 실행에서 기록된 span과 카운터를 모으는 클래스입니다 (스레드 안전)."""
+
+    def __init__(self, ticker: str) -> None:
+        """실행 trace를 초기화합니다.
+
+        Args:
+            ticker: 조사 대상 종목 심볼
+        """
+        self.run_id = uuid.uuid4().hex[:12]
+        self.ticker = ticker.strip().upper()
+        self.started_at = datetime.now()
+        self.duration = 0.0
+        self.spans: list[Span] = []
+        self.counters: dict[str, int] = defaultdict(int)
+        self._origin = time.perf_counter()
+        self._lock = threading.Lock()
+
+    def offset(self) -> float:
+        """실행 시작 이후 경과 시간 (초)"""
+        return time.perf_counter() - self._origin
+
+    def add_span(self, span: Span) -> None:
+        """완료된 span을 추가합니다."""
+        with self._lock:
+            self.spans.append(span)
+
+    def count(self, name: str, n: int = 1) -> None:
+        """실행 전체 카운터를 증가시킵니다."""
+        with self._lock:
+            self.counters[name] += n
+
+    def finish(self) -> None:
+        """실행 종료 시각을 기록합니다."""
+        self.duration = self.offset()
+
+    def to_dict(self) -> dict[str, Any]:
+        """trace를 직렬화 가능한 딕셔너리로 변환합니다 (종류별 합계 포함)."""
+        with self._lock:
+            spans = sorted(self.spans, key=lambda span: span.start)
+            totals: dict[str, dict[str, float]] = {}
+            for span in spans:
+                total = totals.setdefault(span.kind, {"count": 0, "duration": 0.0})
+                total["count"] += 1
+                total["duration"] = round(total["duration"] + span.duration, 4)
+                for key in ("input_tokens", "output_tokens", "total_tokens"):
+                    if key in span.attributes:
+                        total[key] = total.get(key, 0) + span.attributes[key]
+            return {
+                "run_id": self.run_id,
+                "ticker": self.ticker,
+                "started_at": self.started_at.isoformat(timespec="seconds"),
+                "duration": round(self.duration, 4),
+                "counters": dict(self.counters),
+                "totals": totals,
+                "spans": [asdict(span) for span in spans],
+            }
+
+
+_current_trace: ContextVar[RunTrace | None] = ContextVar("current_trace", default=None)
+_current_span: ContextVar[Span | None] = ContextVar("current_span", default=None)
+
+
+def get_current_trace() -> RunTrace | None:
+    """현재 컨텍스트에서 진행 중인 실행 trace를 반환합니다 (없으면 None)."""
+    return _current_trace.get()
+
+
+def record_event(name: str, n: int = 1) -> None:
+    """현재 span과 실행 trace의 카운터를 증가시킵니다 (trace가 없으면 아무것도 하지 않음).
+
+    Args:
+        name: 카운터 이름 (예: "cache_hits", "upstream_calls")
+        n: 증가량
+    """
+    trace = _current_trace.get()
+    if trace is None:
+        return
+    span = _current_span.get()
+    if span is not None:
+        span.counters[name] = span.counters.get(name, 0) + n
+    trace.count(name, n)
+
+
+@contextmanager
+def _span(trace: RunTrace, name: str, kind: str, attributes: dict[str, Any]) -> Iterator[Span]:
+    span = Span(name=name, kind=kind, start=round(trace.offset(), 4), attributes=attributes)
+    token = _current_span.set(span)
+    started = time.perf_counter()
+    try:
+        yield span
+    except BaseException:
+        span.status = "error"
+        raise
+    finally:
+        span.duration = round(time.perf_counter() - started, 4)
+        _current_span.reset(token)
+        trace.add_span(span)
+
+
+def traced(func: Callable[..., Any]) -> Callable[..., Any]:
+    """도구 함수의 호출을 "tool" span으로 기록하는 데코레이터입니다 (동기/비동기 함수 모두 지원).
+
+    진행 중인 실행 trace가 없으면 원래 함수를 그대로 호출합니다.
+    """
+    name = func.__name__
+
+    def _attributes(args: tuple, kwargs: dict) -> dict[str, Any]:
+        ticker = kwargs.get("ticker", args[0] if args else None)
+        return {"ticker": ticker} if isinstance(ticker, str) else {}
+
+    if inspect.iscoroutinefunction(func):
+
+        @functools.wraps(func)
+        async def async_wrapper(*args: Any, **kwargs: Any) -> Any:
+            trace = _current_trace.get()
+            if trace is None:
+                return await func(*args, **kwargs)
+            with _span(trace, name, "tool", _attributes(args, kwargs)):
+                return await func(*args, **kwargs)
+
+        return async_wrapper
+
+    @functools.wraps(func)
+    def wrapper(*args: Any, **kwargs: Any) -> Any:
+        trace = _current_trace.get()
+        if trace is None:
+            return func(*args, **kwargs)
+        with _span(trace, name, "tool", _attributes(args, kwargs)):
+            return func(*args, **kwargs)
+
+    return wrapper
+
+
+class TracingCallbackHandler(BaseCallbackHandler):
+    """LLM 호출과 서브에이전트 실행을 span으로 기록하는 콜백 핸들러입니다.
+
+    LLM 호출은 상위 실행을 거슬러 올라가 어느 서브에이전트에서 발생했는지 함께 기록합니다.
+    """
+
+    def __init__(self, trace: RunTrace, subagent_names: set[str] | None = None) -> None:
+        """핸들러를 초기화합니다.
+
+        Args:
+            trace: span을 기록할 실행 trace
+            subagent_names: 이름으로 식별할 서브에이전트 실행 이름 (병렬 위임에서 사용)
+        """
+        self.trace = trace
+        self.subagent_names = subagent_names or set()
+        self._parents: dict[UUID, UUID | None] = {}
+        self._subagents: dict[UUID, tuple[str, float]] = {}  # run_id -> (서브에이전트 이름, 시작 오프셋)
+        self._llm_runs: dict[UUID, tuple[str, float, dict[str, Any]]] = {}
+        self._lock = threading.Lock()
+
+    def _subagent_of(self, run_id: UUID | None) -> str:
+        """실행 계보를 거슬러 올라가 가장 가까운 서브에이전트 이름을 찾습니다 (없으면 "main")."""
+        seen = 0
+        while run_id is not None and seen < 256:
+            if run_id in self._subagents:
+                return self._subagents[run_id][0]
+            run_id = self._parents.get(run_id)
+            seen += 1
+        return "main"
+
+    def _start_subagent(self, run_id: UUID, name: str) -> None:
+        with self._lock:
+            self._subagents[run_id] = (name, self.trace.offset())
+
+    def _end_subagent(self, run_id: UUID, status: str) -> None:
+        with self._lock:
+            entry = self._subagents.get(run_id)
+        if entry is None:
+            return
+        name, start = entry
+        duration = self.trace.offset() - start
+        self.trace.add_span(
+            Span(name=name, kind="subagent", start=round(start, 4), duration=round(duration, 4), status=status)
+        )
+
+    def on_chain_start(
+        self, serialized: dict[str, Any], inputs: Any, *, run_id: UUID, parent_run_id: UUID | None = None, **kwargs
+    ) -> None:
+        with self._lock:
+            self._parents[run_id] = parent_run_id
+        if kwargs.get("name") in self.subagent_names:
+            self._start_subagent(run_id, kwargs["name"])
+
+    def on_chain_end(self, outputs: Any, *, run_id: UUID, **kwargs: Any) -> None:
+        self._end_subagent(run_id, "ok")
+
+    def on_chain_error(self, error: BaseException, *, run_id: UUID, **kwargs: Any) -> None:
+        self._end_subagent(run_id, "error")
+
+    def on_tool_start(
+        self,
+        serialized: dict[str, Any],
+        input_str: str,
+        *,
+        run_id: UUID,
+        parent_run_id: UUID | None = None,
+        inputs: dict[str, Any] | None = None,
+        **kwargs: Any,
+    ) -> None:
+        with self._lock:
+            self._parents[run_id] = parent_run_id
+        name = kwargs.get("name") or (serialized or {}).get("name")
+        if name in _SUBAGENT_TOOLS:
+            self._start_subagent(run_id, (inputs or {}).get("subagent_type", name))
+
+    def on_tool_end(self, output: Any, *, run_id: UUID, **kwargs: Any) -> None:
+        self._end_subagent(run_id, "ok")
+
+    def on_tool_error(self, error: BaseException, *, run_id: UUID, **kwargs: Any) -> None:
+        self._end_subagent(run_id, "error")
+
+    def on_chat_model_start(
+        self,
+        serialized: dict[str, Any],
+        messages: list,
+        *,
+        run_id: UUID,
+        parent_run_id: UUID | None = None,
+        metadata: dict[str, Any] | None = None,
+        **kwargs: Any,
+    ) -> None:
+        model = (metadata or {}).get("ls_model_name") or (serialized or {}).get("name", "llm")
+        with self._lock:
+            self._parents[run_id] = parent_run_id
+            attributes = {"agent": self._subagent_of(parent_run_id)}
+            self._llm_runs[run_id] = (model, self.trace.offset(), attributes)
+
+    def _end_llm(self, run_id: UUID, status: str, response: LLMResult | None = None) -> None:
+        with self._lock:
+            entry = self._llm_runs.pop(run_id, None)
+        if entry is None:
+            return
+        model, start, attributes = entry
+        if response is not None:
+            attributes.update(_token_usage(response))
+        self.trace.add_span(
+            Span(
+                name=model,
+                kind="llm",
+                start=round(start, 4),
+                duration=round(self.trace.offset() - start, 4),
+                status=status,
+                attributes=attributes,
+            )
+        )
+
+    def on_llm_end(self, response: LLMResult, *, run_id: UUID, **kwargs: Any) -> None:
+        self._end_llm(run_id, "ok", response)
+
+    def on_llm_error(self, error: BaseException, *, run_id: UUID, **kwargs: Any) -> None:
+        self._end_llm(run_id, "error")
+
+
+def _token_usage(response: LLMResult) -> dict[str, int]:
+    """LLM 응답에서 입력/출력 토큰 수를 꺼냅니다 (제공자가 보고하지 않으면 빈 딕셔너리)."""
+    usage = {"input_tokens": 0, "output_tokens": 0, "total_tokens": 0}
+    found = False
+    for generations in response.generations:
+        for generation in generations:
+            metadata = getattr(getattr(generation, "message", None), "usage_metadata", None)
+            if metadata:
+                found = True
+                for key in usage:
+                    usage[key] += int(metadata.get(key, 0))
+    return usage if found else {}
+
+
+class TraceAggregator:
+    """여러 실행 trace의 span을 이름별 지연 시간 히스토그램과 토큰 합계로 집계하는 클래스입니다."""
+
+    def __init__(self, max_samples: int = 10_000) -> None:
+        """집계기를 초기화합니다.
+
+        Args:
+            max_samples: span 이름별로 보관할 최근 지연 시간 표본 수 (백분위수 계산용)
+        """
+        self.max_samples = max_samples
+        self.runs = 0
+        self._durations: dict[str, deque[float]] = {}
+        self._buckets: dict[str, list[int]] = {}
+        self._tokens: dict[str, dict[str, int]] = defaultdict(lambda: defaultdict(int))
+        self._counters: dict[str, int] = defaultdict(int)
+        self._lock = threading.Lock()
+
+    def add(self, trace: RunTrace) -> None:
+        """완료된 실행 trace를 집계에 반영합니다."""
+        with self._lock:
+            self.runs += 1
+            self._observe("run", trace.duration)
+            for name, value in trace.counters.items():
+                self._counters[name] += value
+            for span in list(trace.spans):
+                self._observe(f"{span.kind}:{span.name}", span.duration)
+                if span.kind == "llm":
+                    for key in ("input_tokens", "output_tokens", "total_tokens"):
+                        self._tokens[span.name][key] += span.attributes.get(key, 0)
+
+    def _observe(self, key: str, duration: float) -> None:
+        samples = self._durations.setdefault(key, deque(maxlen=self.max_samples))
+        samples.append(duration)
+        buckets = self._buckets.setdefault(key, [0] * len(HISTOGRAM_BUCKETS))
+        for i, bound in enumerate(HISTOGRAM_BUCKETS):
+            if duration <= bound:
+                buckets[i] += 1
+                break
+
+    def to_dict(self) -> dict[str, Any]:
+        """집계를 직렬화 가능한 딕셔너리로 변환합니다.
+
+        Returns:
+            dict: {"runs", "latency": {"<kind>:<name>": {count, mean, p50, p95, max, histogram}}, "tokens", "counters"}
+        """
+        with self._lock:
+            latency = {}
+            for key, samples in sorted(self._durations.items()):
+                ordered = sorted(samples)
+                latency[key] = {
+                    "count": len(ordered),
+                    "mean": round(sum(ordered) / len(ordered), 4),
+                    "p50": round(_percentile(ordered, 0.50), 4),
+                    "p95": round(_percentile(ordered, 0.95), 4),
+                    "max": round(ordered[-1], 4),
+                    "histogram": {
+                        ("+inf" if bound == float("inf") else f"<={bound}"): count
+                        for bound, count in zip(HISTOGRAM_BUCKETS, self._buckets[key], strict=True)
+                    },
+                }
+            return {
+                "runs": self.runs,
+                "latency": latency,
+                "tokens": {model: dict(usage) for model, usage in self._tokens.items()},
+                "counters": dict(self._counters),
+            }
+
+    def clear(self) -> None:
+        """모든 집계를 초기화합니다."""
+        with self._lock:
+            self.runs = 0
+            self._durations.clear()
+            self._buckets.clear()
+            self._tokens.clear()
+            self._counters.clear()
+
+
+def _percentile(ordered: list[float], q: float) -> float:
+    """정렬된 표본에서 선형 보간 백분위수를 계산합니다."""
+    if len(ordered) == 1:
+        return ordered[0]
+    position = (len(ordered) - 1) * q
+    lower = int(position)
+    upper = min(lower + 1, len(ordered) - 1)
+    return ordered[lower] + (ordered[upper] - ordered[lower]) * (position - lower)
+
+
+# 프로세스 전역 trace 집계 (싱글톤)
+trace_aggregator = TraceAggregator()
+
+
+def _write_json(path: str, data: Any) -> None:
+    """임시 파일에 기록한 뒤 교체하여 JSON 파일을 저장합니다."""
+    tmp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump(data, f, ensure_ascii=False, indent=2)
+    os.replace(tmp_path, path)
+
+
+def export_trace(trace: RunTrace, trace_dir: str) -> str:
+    """실행 trace를 `<trace_dir>/<TICKER>-<시각>-<run_id>.json`으로 저장하고 집계 파일을 갱신합니다.
+
+    Args:
+        trace: 저장할 실행 trace
+        trace_dir: 저장 디렉터리
+
+    Returns:
+        str: 저장된 trace 파일 경로
+    """
+    os.makedirs(trace_dir, exist_ok=True)
+    stamp = trace.started_at.strftime("%Y%m%d-%H%M%S")
+    path = os.path.join(trace_dir, f"{trace.ticker}-{stamp}-{trace.run_id}.json")
+    _write_json(path, trace.to_dict())
+    _write_json(os.path.join(trace_dir, "aggregate.json"), trace_aggregator.to_dict())
+    return path
+
+
+@contextmanager
+def trace_run(ticker: str) -> Iterator[RunTrace | None]:
+    """조사 실행 하나를 추적하는 컨텍스트를 엽니다.
+
+    `tracing_enabled`가 꺼져 있으면 None을 돌려주고 아무것도 기록하지 않습니다.
+    켜져 있으면 종료 시 집계에 반영하고 `trace_dir`에 JSON trace를 저장합니다.
+
+    Args:
+        ticker: 조사 대상 종목 심볼
+
+    Yields:
+        RunTrace | None: 진행 중인 실행 trace
+    """
+    if not settings.tracing_enabled:
+        yield None
+        return
+
+    trace = RunTrace(ticker)
+    token = _current_trace.set(trace)
+    try:
+        yield trace
+    finally:
+        _current_trace.reset(token)
+        trace.finish()
+        trace_aggregator.add(trace)
+        if settings.trace_dir:
+            export_trace(trace, settings.trace_dir)
+
+
+def get_trace_summary() -> dict[str, Any]:
+    """프로세스 전역 trace 집계(지연 시간 히스토그램, 토큰 합계)를 반환합니다."""
+    return trace_aggregator.to_dict()